@@ -0,0 +1,135 @@
+# converge_root_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" compares the number of mission evaluations of the dense finite difference
+    jacobian and the colored jacobian in converge_root for the baseline mission,
+    run from this folder like Baseline.py
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+import numpy as np
+import time
+
+from SUAVE.Methods.Center_of_Gravity.compute_component_centers_of_gravity import compute_component_centers_of_gravity
+from RUN_IN_PYCHARM.Baseline.Baseline import full_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    modes = ['none','colored']
+
+    results     = SUAVE.Core.Data()
+    evaluations = SUAVE.Core.Data()
+
+    for mode in modes:
+        results[mode], evaluations[mode], wall_time = run_mission(mode)
+
+        print('solver_jacobian : ' + mode)
+        print('  evaluations   : ' + str(evaluations[mode].total))
+        print('  wall time     : %.2f s' % wall_time)
+        for tag, count in evaluations[mode].segments.items():
+            print('    %-20s %d' % (tag, count))
+
+    # with the dense chebyshev operators the colored jacobian falls back to the dense one
+    # and must not cost more evaluations
+    assert evaluations.colored.total <= evaluations.none.total
+
+    # both jacobians have to land on the same solution
+    for tag in results.none.segments.keys():
+        old = results.none.segments[tag].conditions.weights.total_mass[:,0]
+        new = results.colored.segments[tag].conditions.weights.total_mass[:,0]
+        err = np.max(np.abs(new-old)/old)
+        print('    %-20s mass error %.2e' % (tag, err))
+        assert err < 1e-6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Run the mission with a given solver jacobian
+# ----------------------------------------------------------------------
+
+def run_mission(mode):
+
+    configs, analyses = full_setup(iteration_setup())
+
+    # weights and center of gravity as in Baseline.main
+    analyses.configs.base.weights.evaluate(method="Raymer")
+    deltacg = 2
+    while abs(deltacg) > 1e-5:
+        compute_component_centers_of_gravity(configs.base)
+        oldcg = configs.base.mass_properties.center_of_gravity[0][0]
+        configs.base.center_of_gravity()
+        configs.base.store_diff()
+        deltacg = configs.base.mass_properties.center_of_gravity[0][0] - oldcg
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+
+    # count the calls of the iterate process
+    evaluations          = SUAVE.Core.Data()
+    evaluations.segments = SUAVE.Core.Data()
+    for segment in mission.segments:
+        segment.state.numerics.solver_jacobian = mode
+        segment.process.iterate.count          = evaluation_counter(evaluations.segments,segment.tag)
+
+    tic     = time.time()
+    results = mission.evaluate()
+    toc     = time.time() - tic
+
+    evaluations.total = sum(evaluations.segments.values())
+
+    return results, evaluations, toc
+
+def iteration_setup():
+
+    setup = Data()
+
+    setup.weight_iter                = Data()
+    setup.weight_iter.MTOW           = 279_000 * Units.kg
+    setup.weight_iter.BOW            = 130_000 * Units.kg
+    setup.weight_iter.Design_Payload = 24_500 * Units.kg
+    setup.weight_iter.FUEL           = setup.weight_iter.MTOW - setup.weight_iter.BOW - setup.weight_iter.Design_Payload
+    setup.weight_iter.TOW            = setup.weight_iter.MTOW
+
+    setup.mission_iter                         = Data()
+    setup.mission_iter.mission_distance        = 10_500 * Units['nautical_mile']
+    setup.mission_iter.cruise_distance         = 9_900 * Units['nautical_mile']
+    setup.mission_iter.throttle_mid_cruise     = 1.
+    setup.mission_iter.design_cruise_altitude  = 37_000 * Units.ft
+    setup.mission_iter.design_cruise_mach      = 0.82
+    setup.mission_iter.reserve_hold_time       = 30 * Units.min
+    setup.mission_iter.reserve_hold_altitude   = 1500. * Units.ft
+    setup.mission_iter.reserve_hold_speed      = 250 * Units['kts']
+    setup.mission_iter.reserve_trip_pct        = 0.03
+    setup.mission_iter.reserve_distance        = 200. * Units.nautical_mile
+    setup.mission_iter.reserve_cruise_distance = 100. * Units.nautical_miles
+
+    setup.sizing_iter                     = Data()
+    setup.sizing_iter.wing_loading        = 700.
+    setup.sizing_iter.thrust_loading      = 0.22
+    setup.sizing_iter.aspect_ratio        = 13.
+    setup.sizing_iter.sweep_quarter_chord = 29 * Units.deg
+    setup.sizing_iter.thickness_to_chord  = 0.105
+    setup.sizing_iter.wing_origin         = [[22.408,0,-0.957]]
+
+    return setup
+
+def evaluation_counter(counts,tag):
+    counts[tag] = 0
+    def count(segment):
+        counts[tag] += 1
+    return count
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@
 #           Jan 2018, SUAVE Team
 #           May 2019, T. MacDonald
 #           Mar 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -54,6 +55,7 @@ modules = [
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
+    'scripts/data/pack_array_test.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
@@ -68,6 +70,7 @@ modules = [
     'scripts/geometry/NACA_volume_compute.py',
     'scripts/geometry/wing_fuel_volume_compute.py',
     'scripts/geometry/fuselage_planform_compute.py',
+    'scripts/grid_interpolator/grid_interpolator_test.py',
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/internal_combustion_propeller/ICE_Test.py',
     'scripts/internal_combustion_propeller/ICE_CS_Test.py',
@@ -82,6 +85,7 @@ modules = [
     'scripts/noise_fidelity_one/propeller_noise.py',
     'scripts/noise_fidelity_one/aircraft_noise.py',
     'scripts/nonuniform_propeller_inflow/nonuniform_propeller_inflow.py',
+    'scripts/optimization_packages/evaluate_batch_test.py',
     'scripts/optimization_packages/optimization_packages.py',
     'scripts/payload_range/payload_range.py',
     'scripts/plots/plot_test.py',
@@ -93,6 +97,7 @@ modules = [
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',
+    'scripts/segments/merge_data_test.py',
     'scripts/segments/segment_test.py',
     'scripts/segments/transition_segment_test.py',
     'scripts/slipstream/slipstream_test.py',
@@ -102,6 +107,7 @@ modules = [
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',
     'scripts/sweeps/test_sweeps.py',
+    'scripts/test_input_output/test_binary_archive.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
     'scripts/turboelectric_HTS_ducted_fan_network/turboelectric_HTS_ducted_fan_network.py',
@@ -0,0 +1,71 @@
+# induced_velocity_memory_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" compares the peak memory and run time of compute_wing_induced_velocity evaluated
+    all at once and in blocks under a memory budget, for increasing panel counts
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+import SUAVE
+from SUAVE.Analyses.Aerodynamics                          import Vortex_Lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import generate_vortex_distribution, compute_wing_induced_velocity
+
+sys.path.append('../Vehicles')
+
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    geometry = b737_setup()
+    mach     = np.atleast_2d([0.1, 0.3, 0.5, 0.7, 0.85, 1.3, 1.5, 2.0]).T
+    budget   = 100e6
+
+    print('%6s %6s %14s %14s %10s %10s %s' % ('n_sw','n_cp','peak all [MB]','peak blk [MB]','all [s]','blk [s]','identical'))
+
+    for n_sw, n_cw in [(10,4),(15,5),(20,8),(30,10)]:
+
+        settings = Vortex_Lattice().settings
+        settings.number_spanwise_vortices  = n_sw
+        settings.number_chordwise_vortices = n_cw
+        settings.model_fuselage            = True
+        VD = generate_vortex_distribution(geometry,settings)
+
+        all_at_once, peak_all, time_all = run(VD,mach,None)
+        blocks     , peak_blk, time_blk = run(VD,mach,budget)
+
+        identical = all([np.array_equal(a,b,equal_nan=True) for a,b in zip(all_at_once,blocks)])
+
+        print('%6d %6d %14.1f %14.1f %10.2f %10.2f %s' % (n_sw,VD.n_cp,peak_all/1e6,peak_blk/1e6,time_all,time_blk,identical))
+
+        assert identical
+
+    return
+
+# ----------------------------------------------------------------------
+#   Evaluate with a memory budget
+# ----------------------------------------------------------------------
+def run(VD,mach,budget):
+
+    tracemalloc.start()
+    tic     = time.time()
+    outputs = compute_wing_induced_velocity(VD,mach,compute_EW=True,memory_budget=budget)
+    toc     = time.time() - tic
+    peak    = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return outputs, peak, toc
+
+if __name__ == '__main__':
+    main()
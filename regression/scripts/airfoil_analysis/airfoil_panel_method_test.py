@@ -2,6 +2,7 @@
 # 
 # Created:  
 # Modified: Mar 2021, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
@@ -88,8 +89,24 @@ def main():
     
     print('\nCM difference') 
     print(np.sum(np.abs((airfoil_properties_2.cm[0]  - True_cms)/True_cms)))
-    assert np.sum(np.abs((airfoil_properties_2.cm[0]   - True_cms)/True_cms))  < 1e-5  
-    return   
+    assert np.sum(np.abs((airfoil_properties_2.cm[0]   - True_cms)/True_cms))  < 1e-5
+
+    # -----------------------------------------------
+    # Coarse polar sweep - NACA 4412
+    # -----------------------------------------------
+    # the turbulent boundary layer of some cases is stiff near separation
+    AoA_sweep             = np.array([-4,0,2,4,8,10,14])*Units.degrees
+    Re_sweep              = np.array([1,5,10,30,50,75,100])*1E4
+    AoA_vals              = np.tile(AoA_sweep[None,:],(len(Re_sweep) ,1))
+    Re_vals               = np.tile(Re_sweep[:,None],(1, len(AoA_sweep)))
+    airfoil_geometry_3    = compute_naca_4series('4412',npoints = 30)
+    airfoil_properties_3  = airfoil_analysis(airfoil_geometry_3,AoA_vals,Re_vals)
+
+    print('\n\nCoarse Polar Sweep')
+    print('\nCD at Re = 1E5, AoA = 14 deg')
+    print(airfoil_properties_3.cd[2,6])
+    assert np.all(np.isfinite(airfoil_properties_3.cd))
+    return
     
 
 if __name__ == '__main__': 
@@ -0,0 +1,58 @@
+# airfoil_sweep_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the boundary layer sweep of the airfoil panel method, in which the laminar and
+    turbulent boundary layers of all angles of attack and Reynolds numbers are packed
+    into columns, and checks that the sweep gives the same results as one case at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import time
+import numpy as np
+
+from SUAVE.Core import Units
+from SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis import airfoil_analysis
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series import compute_naca_4series
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties import compute_airfoil_properties
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    airfoil_geometry = compute_naca_4series('2412',npoints = 200)
+
+    # the sweep of compute_airfoil_properties
+    AoA_sweep = np.array([-4,0,2,4,8,10,14])*Units.degrees
+    Re_sweep  = np.array([1,5,10,30,50,75,100])*1E4
+    AoA_vals  = np.tile(AoA_sweep[None,:],(len(Re_sweep),1))
+    Re_vals   = np.tile(Re_sweep[:,None],(1,len(AoA_sweep)))
+
+    airfoil_analysis(airfoil_geometry,AoA_vals[:1,:1],Re_vals[:1,:1])
+
+    t0 = time.time()
+    sweep = airfoil_analysis(airfoil_geometry,AoA_vals,Re_vals)
+    t1 = time.time()
+    compute_airfoil_properties(airfoil_geometry)
+    t2 = time.time()
+
+    print('%-32s %10s' % ('','time [s]'))
+    print('%-32s %10.3f' % ('airfoil_analysis, 7 x 7 sweep',t1-t0))
+    print('%-32s %10.3f' % ('compute_airfoil_properties',t2-t1))
+
+    # every case of the sweep is integrated on its own. odeint amplifies the round off of
+    # the panel method solve of the sweep near separation, to about 1e-5 in the coefficients
+    for i in [0,3,6]:
+        for j in [0,4,6]:
+            case = airfoil_analysis(airfoil_geometry,AoA_vals[i:i+1,j:j+1],Re_vals[i:i+1,j:j+1])
+            for name in ['cl','cd','cm']:
+                assert np.allclose(case[name][0,0],sweep[name][i,j],rtol=1e-4,atol=0,equal_nan=True)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+# airfoil_cache_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" times the import of an airfoil geometry, its polars and its extended polars without a
+    cache, from the cache in memory and from the binary cache directory in a new process,
+    and checks that a changed polar file replaces the cache entry
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import numpy as np
+
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import import_airfoil_geometry, compute_airfoil_properties, \
+     set_airfoil_cache_directory, clear_airfoil_cache
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry import read_airfoil_geometry
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_properties import compute_extended_airfoil_properties
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    separator = os.path.sep
+    rel_path  = os.path.abspath(__file__).split('airfoil_import' + separator)[0] + 'Vehicles' + separator + 'Airfoils' + separator
+    directory = tempfile.mkdtemp()
+
+    # copy the airfoil files, so that one can be changed
+    geometry_file = os.path.join(directory,'NACA_4412.txt')
+    shutil.copy(rel_path + 'NACA_4412.txt',geometry_file)
+    polar_files   = []
+    for Re in [50000,100000,200000,500000,1000000]:
+        polar_files.append(os.path.join(directory,'NACA_4412_polar_Re_%d.txt' % Re))
+        shutil.copy(rel_path + 'Polars' + separator + 'NACA_4412_polar_Re_%d.txt' % Re,polar_files[-1])
+    cache_directory = os.path.join(directory,'cache')
+    os.mkdir(cache_directory)
+
+    try:
+        t0 = time.time()
+        geometry   = read_airfoil_geometry(geometry_file)
+        properties = compute_extended_airfoil_properties(geometry,polar_files)
+        t1 = time.time()
+
+        # the cache in memory
+        set_airfoil_cache_directory(None)
+        compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files)
+        t2 = time.time()
+        memory_properties = compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files)
+        t3 = time.time()
+
+        # the binary cache directory, filled by this process and read by a new one
+        set_airfoil_cache_directory(cache_directory)
+        compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files)
+        code = 'import time; t0 = time.time(); ' + \
+               'from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil import import_airfoil_geometry, compute_airfoil_properties, set_airfoil_cache_directory; ' + \
+               't1 = time.time(); set_airfoil_cache_directory(%r); ' % cache_directory + \
+               'compute_airfoil_properties(import_airfoil_geometry(%r),%r); ' % (geometry_file,polar_files) + \
+               'print(time.time() - t1)'
+        process_time = float(subprocess.check_output([sys.executable,'-c',code],text=True).split()[-1])
+        t4 = time.time()
+        disk_properties = compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files)
+        t5 = time.time()
+
+        print('%-32s %10s' % ('geometry and properties','time [s]'))
+        print('%-32s %10.4f' % ('no cache',t1-t0))
+        print('%-32s %10.4f' % ('cache in memory',t3-t2))
+        print('%-32s %10.4f' % ('cache directory',t5-t4))
+        print('%-32s %10.4f' % ('cache directory, new process',process_time))
+
+        # the cached properties are the computed ones, and changes to them stay private
+        for cached in [memory_properties,disk_properties]:
+            for name in ['lift_coefficients','drag_coefficients','angle_of_attacks','reynolds_numbers']:
+                assert np.array_equal(cached[name],properties[name])
+            assert np.array_equal(cached.boundary_layer.theta_lower_surface,properties.boundary_layer.theta_lower_surface)
+        disk_properties.lift_coefficients[:] = 0.
+        assert np.array_equal(compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files).lift_coefficients,
+                              properties.lift_coefficients)
+
+        # a changed polar file is read again
+        with open(polar_files[0]) as f:
+            lines = f.readlines()
+        with open(polar_files[0],'w') as f:
+            f.writelines(lines[:-1])
+        changed_properties = compute_airfoil_properties(import_airfoil_geometry(geometry_file),polar_files)
+        assert not np.array_equal(changed_properties.lift_coefficients,properties.lift_coefficients)
+        assert len(os.listdir(cache_directory)) == 5
+
+    finally:
+        clear_airfoil_cache(remove_files=True)
+        set_airfoil_cache_directory(None)
+        shutil.rmtree(directory)
+
+    return
+
+if __name__ == '__main__':
+    main()
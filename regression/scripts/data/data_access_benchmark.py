@@ -0,0 +1,67 @@
+# data_access_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" measures the cost of attribute access on the Data trees of a mission segment state,
+    for the reads, writes and method lookups that the mission solver does on every
+    iteration, with a plain dict lookup of the same values as a reference
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import timeit
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    state     = mission_state()
+    plain     = {'conditions':{'freestream':{'mach_number':state.conditions.freestream.mach_number},
+                               'frames':{'inertial':{'time':state.conditions.frames.inertial.time}}}}
+    value     = np.ones((16,1))
+    namespace = dict(state=state, plain=plain, value=value, Data=Data)
+
+    cases = [('dict read, depth 4',          "plain['conditions']['frames']['inertial']['time']"),
+             ('key read, depth 4',           "state.conditions.frames.inertial.time"),
+             ('key read, depth 3',           "state.conditions.freestream.mach_number"),
+             ('method lookup',               "state.conditions.items"),
+             ('missing attribute',           "getattr(state.conditions,'missing',None)"),
+             ('key write, existing',         "state.conditions.freestream.mach_number = value"),
+             ('key write, new',              "state.conditions.freestream.new_value = value"),
+             ('Data() creation',             "Data()"),]
+
+    print('%-32s %12s' % ('operation','time [ns]'))
+    for name, statement in cases:
+        number = 200000
+        times  = timeit.repeat(statement, globals=namespace, number=number, repeat=5)
+        print('%-32s %12.1f' % (name, min(times)/number*1e9))
+
+    return
+
+# ----------------------------------------------------------------------
+#   State of a climb segment with the conditions of a battery powered aircraft
+# ----------------------------------------------------------------------
+def mission_state():
+
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    state   = segment.state
+    state.numerics.number_control_points = 16
+    segment.process.initialize.expand_state(segment)
+
+    # the conditions of a battery powered aircraft, as the networks append them
+    ones_row = state.ones_row
+    for name in ['battery_state_of_charge','battery_cell_temperature','battery_current','battery_voltage_under_load',
+                 'battery_power_draw','battery_energy','throttle','propeller_rpm','propeller_thrust','propeller_torque']:
+        state.conditions.propulsion[name] = ones_row(1)
+
+    return state
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# pack_array_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that Data.pack_array and unpack_array with a pack plan give the same vectors as
+    walking the tree, and that the plan follows changes of the structure of the tree
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import pickle
+import numpy as np
+from copy import deepcopy
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import atleast_2d_col, array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    segment  = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    state    = segment.state
+    state.numerics.number_control_points = 8
+    segment.process.initialize.expand_state(segment)
+
+    unknowns = state.unknowns
+    unknowns.throttle = 0.5 * state.ones_row(1)
+    unknowns.body_angle = 3.0 * state.ones_row(1)
+    unknowns.extra = Data(matrix = np.random.rand(8,2), scalar = 2.0, count = 3)
+
+    # packing with the plan gives the vector of the walk, twice as the plan is reused
+    for _ in range(2):
+        vector = unknowns.pack_array()
+        assert np.array_equal(vector,walk_pack(unknowns))
+        assert vector.dtype == walk_pack(unknowns).dtype
+
+    # unpacking writes the vector back, arrays in place and scalars replaced
+    throttle   = unknowns.throttle
+    new_vector = np.arange(len(vector),dtype=float)
+    unknowns.unpack_array(new_vector)
+    assert unknowns.throttle is throttle
+    assert np.array_equal(unknowns.pack_array(),new_vector)
+    assert np.array_equal(walk_pack(unknowns),new_vector)
+
+    # the plan is rebuilt when keys are added, removed, reordered or change shape
+    unknowns.new_key = np.ones((8,1))
+    assert np.array_equal(unknowns.pack_array(),walk_pack(unknowns))
+    del unknowns.extra.scalar
+    assert np.array_equal(unknowns.pack_array(),walk_pack(unknowns))
+    unknowns.extra.matrix = np.random.rand(4,3)
+    assert np.array_equal(unknowns.pack_array(),walk_pack(unknowns))
+    throttle = unknowns.pop('throttle')
+    unknowns.throttle = throttle
+    assert np.array_equal(unknowns.pack_array(),walk_pack(unknowns))
+
+    vector = np.random.rand(len(unknowns.pack_array()))
+    unknowns.unpack_array(vector)
+    assert np.array_equal(unknowns.pack_array(),vector)
+
+    # copies of the tree keep packing the same
+    for copied in [deepcopy(unknowns), pickle.loads(pickle.dumps(unknowns))]:
+        assert np.array_equal(copied.pack_array(),vector)
+        copied.unpack_array(2*vector)
+        assert np.array_equal(copied.pack_array(),2*vector)
+    assert np.array_equal(unknowns.pack_array(),vector)
+
+    # the residuals of the segment round trip as well
+    residuals = state.residuals
+    residuals.forces = np.random.rand(8,2)
+    vector    = residuals.pack_array()
+    assert np.array_equal(vector,walk_pack(residuals))
+    residuals.unpack_array(vector + 1.)
+    assert np.array_equal(residuals.pack_array(),vector + 1.)
+
+    print('pack_array and unpack_array match the walk of the tree')
+
+    return
+
+# ----------------------------------------------------------------------
+#   The vector of pack_array, from walking the tree
+# ----------------------------------------------------------------------
+def walk_pack(data):
+
+    valid_types = (int, float, array_type, matrix_type)
+    M = []
+
+    def do_pack(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_pack(v)
+                continue
+            elif not isinstance(v,valid_types) or np.ndim(v) > 2:
+                continue
+            M.append(atleast_2d_col(v).ravel(order='F'))
+
+    do_pack(data)
+
+    return np.hstack(M) if M else np.array([])
+
+if __name__ == '__main__':
+    main()
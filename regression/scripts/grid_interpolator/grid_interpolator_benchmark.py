@@ -0,0 +1,84 @@
+# grid_interpolator_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" compares the accuracy and run time of Grid_Interpolator against the linear
+    scipy.interpolate.RegularGridInterpolator for engine deck sized tables, and its
+    derivatives against central differences
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import time
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from SUAVE.Core import Grid_Interpolator
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(0)
+
+    # grids the size of the max thrust and tsfc decks of the Turbofan_Raymer network
+    tables = [('2D', (np.unique(np.random.rand(12))*40000, np.linspace(0,0.9,20))),
+              ('3D', (np.linspace(0,0.9,10), np.linspace(0,1,20), np.unique(np.random.rand(8))*40000))]
+
+    print('%4s %6s %12s %12s %12s %14s' % ('grid','n_pts','scipy [us]','grid [us]','max error','deriv. error'))
+
+    for name, points in tables:
+        values = np.random.rand(*[len(p) for p in points])
+        scipy_interp = RegularGridInterpolator(points, values, bounds_error=False, fill_value=None)
+        grid_interp  = Grid_Interpolator(points, values, fill_value=None)
+
+        for n_pts in [16, 1000]:
+            lower = np.array([p[0]  for p in points])
+            upper = np.array([p[-1] for p in points])
+            xi    = lower + np.random.rand(n_pts,len(points))*(upper - lower)
+
+            time_scipy = timeit(scipy_interp, xi)
+            time_grid  = timeit(grid_interp , xi)
+            error      = np.max(np.abs(scipy_interp(xi) - grid_interp(xi)))
+
+            # central differences of the scipy interpolant
+            _, gradient = grid_interp.evaluate(xi, derivatives=True)
+            deriv_error = 0.
+            for k in range(len(points)):
+                step           = np.zeros(len(points))
+                step[k]        = 1e-6*(upper[k] - lower[k])
+                finite_diff    = (scipy_interp(xi + step) - scipy_interp(xi - step))/(2*step[k])
+                deriv_error    = max(deriv_error, np.max(np.abs(finite_diff - gradient[:,k]))/np.max(np.abs(finite_diff)))
+
+            print('%4s %6d %12.1f %12.1f %12.2e %14.2e' % (name,n_pts,time_scipy*1e6,time_grid*1e6,error,deriv_error))
+
+            assert error < 1e-12
+            assert deriv_error < 1e-4
+
+        # points with a NaN coordinate are NaN, as in scipy
+        xi        = np.array([p[len(p)//2] for p in points])*np.ones((len(points),1))
+        xi[np.diag_indices(len(points))] = np.nan
+        for fill_value in [np.nan, 0., None]:
+            scipy_nan = RegularGridInterpolator(points, values, bounds_error=False, fill_value=fill_value)(xi)
+            grid_nan  = Grid_Interpolator(points, values, fill_value=fill_value)(xi)
+            assert np.all(np.isnan(scipy_nan)) and np.all(np.isnan(grid_nan))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Time an interpolator
+# ----------------------------------------------------------------------
+def timeit(interpolator, xi, repeats=2000):
+
+    interpolator(xi)
+    tic = time.time()
+    for _ in range(repeats):
+        interpolator(xi)
+
+    return (time.time() - tic)/repeats
+
+if __name__ == '__main__':
+    main()
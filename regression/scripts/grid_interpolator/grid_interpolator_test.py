@@ -0,0 +1,100 @@
+# grid_interpolator_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks Grid_Interpolator against the linear scipy.interpolate.RegularGridInterpolator
+    on uniform and nonuniform grids, inside and outside of the grid, and its derivatives
+    against central differences
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+from scipy.interpolate import RegularGridInterpolator
+
+from SUAVE.Core import Grid_Interpolator
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(1)
+
+    grids = [('1D uniform',    (np.linspace(0,1,5),)),
+             ('2D nonuniform', (np.unique(np.random.rand(12))*40000, np.linspace(0,0.9,20))),
+             ('3D mixed',      (np.linspace(0,0.9,10), np.linspace(0,1,20), np.unique(np.random.rand(8))*40000))]
+
+    for name, points in grids:
+        ndim   = len(points)
+        values = np.random.rand(*[len(p) for p in points])
+        lower  = np.array([p[0]  for p in points])
+        upper  = np.array([p[-1] for p in points])
+        span   = upper - lower
+
+        # points inside the grid, on its nodes, and outside of it
+        inside  = lower + np.random.rand(200,ndim)*span
+        nodes   = np.array(np.meshgrid(*points,indexing='ij')).reshape(ndim,-1).T
+        outside = lower - 0.5*span + np.random.rand(200,ndim)*2*span
+
+        for fill_value in [np.nan, 0., None]:
+            scipy_interp = RegularGridInterpolator(points, values, bounds_error=False, fill_value=fill_value)
+            grid_interp  = Grid_Interpolator(points, values, fill_value=fill_value)
+
+            for xi in [inside, nodes, outside, inside.reshape(20,10,ndim)]:
+                expected = scipy_interp(xi)
+                result   = grid_interp(xi)
+                assert result.shape == expected.shape
+                assert np.allclose(result,expected,rtol=0,atol=1e-12,equal_nan=True)
+
+        # the derivatives inside the grid are those of the interpolant
+        grid_interp  = Grid_Interpolator(points, values, fill_value=None)
+        scipy_interp = RegularGridInterpolator(points, values, bounds_error=False, fill_value=None)
+        result, gradient = grid_interp.evaluate(inside, derivatives=True)
+        assert np.allclose(result,grid_interp(inside),rtol=0,atol=0)
+        for k in range(ndim):
+            step        = np.zeros(ndim)
+            step[k]     = 1e-7*span[k]
+            finite_diff = (scipy_interp(inside + step) - scipy_interp(inside - step))/(2*step[k])
+            assert np.allclose(gradient[:,k],finite_diff,rtol=1e-5,atol=1e-5*np.max(np.abs(finite_diff)))
+
+        # the derivatives are zero where the fill value is used
+        _, gradient = Grid_Interpolator(points, values, fill_value=0.).evaluate(outside, derivatives=True)
+        out_of_bounds = np.any((outside < lower) | (outside > upper),axis=1)
+        assert np.all(gradient[out_of_bounds] == 0.)
+
+        # points with a NaN coordinate are NaN, as in scipy
+        xi = np.array(inside[:ndim])
+        xi[np.diag_indices(ndim)] = np.nan
+        for fill_value in [np.nan, 0., None]:
+            assert np.all(np.isnan(Grid_Interpolator(points, values, fill_value=fill_value)(xi)))
+
+        # cells can be reused, and copies share the tables
+        cells = grid_interp.cells(inside)
+        assert np.array_equal(grid_interp.evaluate(inside,cells=cells),grid_interp(inside))
+        assert deepcopy(grid_interp) is grid_interp
+
+        print(name + ' grid matches scipy')
+
+    # values with trailing dimensions are interpolated with the same weights
+    points = (np.linspace(0,1,4), np.array([0.,0.3,1.]))
+    values = np.random.rand(4,3,2)
+    xi     = np.random.rand(50,2)
+    result = Grid_Interpolator(points, values)(xi)
+    for j in range(2):
+        assert np.allclose(result[:,j],RegularGridInterpolator(points, values[...,j])(xi),rtol=0,atol=1e-12)
+
+    # grids that are not strictly increasing are rejected
+    try:
+        Grid_Interpolator((np.array([0.,1.,1.]),), np.zeros(3))
+        raise AssertionError('a repeated grid coordinate was accepted')
+    except ValueError:
+        pass
+
+    return
+
+if __name__ == '__main__':
+    main()
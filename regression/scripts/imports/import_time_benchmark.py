@@ -0,0 +1,64 @@
+# import_time_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" measures the time to import SUAVE in a new interpreter, as every worker of a parallel
+    sweep does, and checks that importing SUAVE does not load the plotting and machine
+    learning packages, which are only imported by the functions that use them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import subprocess
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    statements = [('import SUAVE',                    'import SUAVE'),
+                  ('mission segment',                 'import SUAVE; SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()'),
+                  ('vehicle and analyses',            'import SUAVE; SUAVE.Vehicle(); SUAVE.Components.Wings.Main_Wing(); SUAVE.Analyses.Vehicle()'),
+                  ('surrogate network',               'import SUAVE; SUAVE.Components.Energy.Networks.Propulsor_Surrogate()'),
+                  ('mission plots',                   'from SUAVE.Plots.Performance import plot_flight_conditions')]
+
+    print('%-24s %12s %10s' % ('import','time [ms]','modules'))
+    for name, statement in statements:
+        times, modules = import_time(statement)
+        print('%-24s %12.1f %10d' % (name, np.median(times)*1e3, modules))
+
+    # the optional packages stay unloaded until they are used
+    loaded = loaded_modules('import SUAVE')
+    for package in ['matplotlib','sklearn','plotly','pkg_resources','scipy.stats']:
+        assert package not in loaded, package + ' is loaded by import SUAVE'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helpers
+# ----------------------------------------------------------------------
+def import_time(statement,repeat=5):
+    """ times a statement in new interpreters, and counts the SUAVE modules it loads """
+
+    code  = 'import time, sys; t0 = time.perf_counter(); ' + statement + \
+            '; print(time.perf_counter() - t0, len([m for m in sys.modules if m.startswith("SUAVE")]))'
+    times = []
+    for i in range(repeat):
+        output = subprocess.check_output([sys.executable,'-c',code],text=True).split()
+        times.append(float(output[-2]))
+
+    return np.array(times), int(output[-1])
+
+def loaded_modules(statement):
+    """ the modules loaded by a statement in a new interpreter """
+
+    code = statement + '; import sys; print(" ".join(sys.modules))'
+
+    return subprocess.check_output([sys.executable,'-c',code],text=True).split()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# harmonic_noise_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" compares the run time and peak memory of the harmonic noise of two rotors on ground
+    microphone grids of increasing size, evaluated in one pass and in microphone blocks
+    within the memory budget of the Fidelity One noise analysis
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import time
+import tracemalloc
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses.Noise.Fidelity_One import Fidelity_One
+from SUAVE.Methods.Noise.Fidelity_One.Propeller import compute_harmonic_noise
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    settings = Fidelity_One().settings
+    budget   = settings.harmonic_noise_memory_budget
+
+    print('%8s %8s %14s %14s %14s %14s' % ('mics','steady','one pass [s]','blocks [s]','one pass [MB]','blocks [MB]'))
+
+    for n_side in [5, 10, 20, 50]:
+        for steady in [False, True]:
+            args = harmonic_noise_inputs(settings, n_side, steady)
+
+            # a single pass of the largest grid needs several GB
+            if n_side <= 20:
+                settings.harmonic_noise_memory_budget = None
+                one_pass, time_one_pass, memory_one_pass = run(args)
+            else:
+                one_pass, time_one_pass, memory_one_pass = None, np.nan, np.nan
+
+            settings.harmonic_noise_memory_budget = budget
+            blocks, time_blocks, memory_blocks = run(args)
+
+            print('%8d %8s %14.3f %14.3f %14.1f %14.1f' % (n_side**2,steady,time_one_pass,time_blocks,memory_one_pass/1e6,memory_blocks/1e6))
+
+            if one_pass is not None:
+                assert np.array_equal(one_pass.SPL_prop_harmonic_bpf_spectrum,blocks.SPL_prop_harmonic_bpf_spectrum,equal_nan=True)
+                assert np.array_equal(one_pass.SPL_prop_harmonic_1_3_spectrum,blocks.SPL_prop_harmonic_1_3_spectrum,equal_nan=True)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Inputs of two rotors over a ground microphone grid
+# ----------------------------------------------------------------------
+def harmonic_noise_inputs(settings, n_side, steady, n_cpt=4, n_r=20):
+
+    rng                            = np.random.RandomState(0)
+    r                              = np.linspace(0.15,1.,n_r)
+    rotor                          = Data()
+    rotor.radius_distribution      = r
+    rotor.chord_distribution       = 0.1 + 0.05*(1 - r)
+    rotor.thickness_to_chord       = 0.12*np.ones(n_r)
+    rotor.mid_chord_alignment      = 0.01*r
+    rotor.orientation_euler_angles = [0., np.pi/2, 0.]
+    rotor.tip_radius               = 1.
+    rotor.number_of_blades         = 3
+    rotors                         = Data(rotor = rotor)
+
+    # control points of a climb, or all equal for a hover
+    scale                    = np.ones(n_cpt) if steady else np.linspace(1., 1.2, n_cpt)
+    freestream               = Data()
+    freestream.speed_of_sound= np.ones((n_cpt,1))*340.
+    freestream.density       = np.ones((n_cpt,1))*1.2
+    angle_of_attack          = 0.05*scale[:,None]
+    velocity_vector          = np.zeros((n_cpt,3))
+    velocity_vector[:,0]     = 20.*scale
+
+    aeroacoustic_data             = Data()
+    aeroacoustic_data.omega       = 200.*scale[:,None]
+    aeroacoustic_data.blade_dT_dr = np.tile(rng.rand(1,n_r)*100,(n_cpt,1))
+    aeroacoustic_data.blade_dQ_dr = np.tile(rng.rand(1,n_r)*20 ,(n_cpt,1))
+
+    # rotor hub to microphone vectors
+    x, y            = np.meshgrid(np.linspace(-200,200,n_side),np.linspace(-190,230,n_side))
+    microphones     = np.stack([x.ravel(),y.ravel(),np.zeros(x.size)],axis=1)
+    hubs            = np.array([[0.,-2.,-100.],[0.,2.,-100.]])
+    position_vector = (microphones[None,:,None,:] - hubs[None,None,:,:])*scale[:,None,None,None]
+
+    return (settings.harmonics, freestream, angle_of_attack, position_vector, velocity_vector, rotors, aeroacoustic_data, settings)
+
+# ----------------------------------------------------------------------
+#   Time and trace the memory of one evaluation
+# ----------------------------------------------------------------------
+def run(args):
+
+    results = Data()
+    tracemalloc.start()
+    tic     = time.time()
+    compute_harmonic_noise(*args, results)
+    elapsed = time.time() - tic
+    peak    = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return results, elapsed, peak
+
+if __name__ == '__main__':
+    main()
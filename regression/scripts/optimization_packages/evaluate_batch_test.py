@@ -0,0 +1,114 @@
+# evaluate_batch_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that Nexus.evaluate_batch gives the objective and constraints of the serial
+    Nexus.objective and Nexus.all_constraints at every design point, with one process and
+    with a pool of processes that is reused over several batches
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(0)
+    X = np.random.rand(7,2)*2. - 1.
+
+    # the functions of the serial nexus, one design point at a time
+    nexus       = setup()
+    objective   = np.array([nexus.objective(x) for x in X])
+    constraints = np.array([nexus.all_constraints(x) for x in X])
+
+    # one process evaluates the points in this nexus
+    nexus   = setup()
+    outputs = nexus.evaluate_batch(X)
+    assert outputs.objective.shape == (len(X),1)
+    assert outputs.all_constraints.shape == (len(X),2)
+    assert np.array_equal(outputs.objective,objective)
+    assert np.array_equal(outputs.all_constraints,constraints)
+    assert nexus.evaluation_count == len(X)
+
+    # a pool of processes works on copies of the nexus, and is reused for every batch
+    nexus = setup()
+    nexus.number_of_processes = 2
+    with nexus.batch_pool(keys=['objective']) as pool:
+        for batch in [X[:4], X[4:]]:
+            outputs = nexus.evaluate_batch(batch,keys=['objective'],pool=pool)
+            assert list(outputs.keys()) == ['objective']
+            assert np.array_equal(outputs.objective,objective[:4] if len(batch) == 4 else objective[4:])
+        if pool.pool is not None:
+            assert nexus.evaluation_count == 0
+    outputs = nexus.evaluate_batch(X)
+    assert np.array_equal(outputs.objective,objective)
+    assert np.array_equal(outputs.all_constraints,constraints)
+
+    # a single design point
+    outputs = nexus.evaluate_batch(X[0])
+    assert np.array_equal(outputs.objective,objective[:1])
+
+    print('evaluate_batch matches the serial objective and constraints')
+
+    return
+
+# ----------------------------------------------------------------------
+#   A nexus of two inputs, with a quadratic objective and two constraints
+# ----------------------------------------------------------------------
+def setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, lb , ub , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x1' , 0. , -1. , 1. , 1. , 1. ],
+        [ 'x2' , 0. , -1. , 1. , 2. , 1. ],
+    ],dtype=object)
+
+    #   [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f' , 10. , 1. ],
+    ],dtype=object)
+
+    #   [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'g1' , '>' , -1. , 1. , 1. ],
+        [ 'g2' , '<' ,  1. , 1. , 1. ],
+    ],dtype=object)
+
+    #   [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'x1' , 'summary.x1' ],
+        [ 'x2' , 'summary.x2' ],
+        [ 'f'  , 'summary.f'  ],
+        [ 'g1' , 'summary.g1' ],
+        [ 'g2' , 'summary.g2' ],
+    ]
+
+    nexus.procedure = Process()
+    nexus.procedure.analysis = analysis
+
+    return nexus
+
+def analysis(nexus):
+
+    summary = nexus.summary
+    summary.f  = (summary.x1 - 0.3)**2 + (summary.x2 + 0.2)**2 + summary.x1*summary.x2
+    summary.g1 = summary.x1 + summary.x2
+    summary.g2 = summary.x1*summary.x2
+
+    return nexus
+
+if __name__ == '__main__':
+    main()
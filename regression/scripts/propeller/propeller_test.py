@@ -3,6 +3,7 @@
 # Created:  Sep 2014, E. Botero
 # Modified: Feb 2020, M. Clarke  
 #           Sep 2020, M. Clarke 
+#           Oct 2026, SUAVE Team
 
 #----------------------------------------------------------------------
 #   Imports
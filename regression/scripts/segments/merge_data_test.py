@@ -0,0 +1,113 @@
+# merge_data_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that merge_data merges segment states as the first state deep-copied and
+    updated with Data.append_or_update by each of the others, and that the merged arrays
+    are shared with the segments when views are asked for
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+import SUAVE
+from SUAVE.Core import Data, merge_data
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(0)
+
+    # segments of different lengths, where later ones add keys and values that are not arrays
+    states = [segment_state(n) for n in [4,8,6]]
+    states[1].conditions.propulsion.battery_current = np.random.rand(8,1)
+    states[2].conditions.propulsion.battery_current = np.random.rand(6,1)
+    states[2].conditions.propulsion.new_subsystem   = Data(power = np.random.rand(6,1))
+    states[0].conditions.tag_value = 'first'
+    states[2].conditions.tag_value = 'last'
+    states[1].conditions.frames.inertial.count = 2
+
+    for key in ['unknowns','conditions','residuals']:
+        datas    = [state[key] for state in states]
+        expected = old_merge(datas)
+        merged   = merge_data(datas)
+        assert compare(merged,expected)
+
+    # the segments are unchanged by a merge without views
+    conditions = [state.conditions for state in states]
+    before     = deepcopy(conditions)
+    merge_data(conditions)
+    for a, b in zip(conditions,before):
+        assert compare(a,b)
+
+    # with views, the segments hold views of their rows in the merged arrays
+    expected = old_merge(conditions)
+    merged   = merge_data(conditions,views=True)
+    assert compare(merged,expected)
+    time     = merged.frames.inertial.time
+    assert np.shares_memory(conditions[1].frames.inertial.time,time)
+    assert np.array_equal(conditions[1].frames.inertial.time,time[4:12])
+    conditions[2].frames.inertial.time[:] = -1.
+    assert np.all(time[12:] == -1.)
+
+    # a single segment is copied
+    merged = merge_data([states[0].conditions])
+    assert compare(merged,old_merge([states[0].conditions]))
+    assert not np.shares_memory(merged.frames.inertial.time,states[0].conditions.frames.inertial.time)
+
+    print('merge_data matches the merge with append_or_update')
+
+    return
+
+# ----------------------------------------------------------------------
+#   The merge of Segment.merged before merge_data
+# ----------------------------------------------------------------------
+def old_merge(datas):
+
+    merged = deepcopy(datas[0])
+    for data in datas[1:]:
+        merged.append_or_update(data)
+
+    return merged
+
+# ----------------------------------------------------------------------
+#   State of a climb segment with random conditions
+# ----------------------------------------------------------------------
+def segment_state(number_control_points):
+
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+    state   = segment.state
+    state.numerics.number_control_points = number_control_points
+    segment.process.initialize.expand_state(segment)
+    state.unknowns.throttle   = np.random.rand(number_control_points,1)
+    state.unknowns.body_angle = np.random.rand(number_control_points,1)
+    state.residuals.forces    = np.random.rand(number_control_points,2)
+
+    for node in walk(state.conditions):
+        for k, v in node.items():
+            if isinstance(v,np.ndarray) and v.dtype == float:
+                v[...] = np.random.rand(*v.shape)
+
+    return state
+
+def walk(data):
+    yield data
+    for v in data.values():
+        if isinstance(v,dict):
+            yield from walk(v)
+
+def compare(a,b):
+    if isinstance(a,dict):
+        return type(a) == type(b) and list(a.keys()) == list(b.keys()) and all([compare(a[k],b[k]) for k in a.keys()])
+    if isinstance(a,np.ndarray):
+        return isinstance(b,np.ndarray) and a.dtype == b.dtype and np.array_equal(a,b)
+    return type(a) == type(b) and a == b
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+# binary_archive_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" compares the JSON archive with the binary archive on a mission results tree, for the
+    time to archive and load it, the size on disk, and a partial load of the weights
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import shutil
+import tempfile
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE import archive, load, archive_binary, load_binary
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    results   = mission_results(number_of_segments=20)
+    directory = tempfile.mkdtemp()
+    json_file = os.path.join(directory,'results.res')
+    npy_dir   = os.path.join(directory,'results')
+
+    try:
+        t0 = time.time()
+        archive(results,json_file)
+        t1 = time.time()
+        json_results = load(json_file)
+        t2 = time.time()
+        archive_binary(results,npy_dir)
+        t3 = time.time()
+        binary_results = load_binary(npy_dir)
+        t4 = time.time()
+        weights = load_binary(npy_dir,keys='segments.*.conditions.weights')
+        t5 = time.time()
+
+        json_size   = os.path.getsize(json_file)
+        binary_size = sum([os.path.getsize(os.path.join(root,name)) for root, dirs, names in os.walk(npy_dir) for name in names])
+
+        print('%-24s %12s %12s' % ('','JSON','binary'))
+        print('%-24s %12.3f %12.3f' % ('archive [s]',t1-t0,t3-t2))
+        print('%-24s %12.3f %12.3f' % ('load [s]',t2-t1,t4-t3))
+        print('%-24s %12.1f %12.1f' % ('size [kB]',json_size/1e3,binary_size/1e3))
+        print('%-24s %12s %12.3f' % ('load weights [s]','',t5-t4))
+
+        # the binary archive loads the results as they were archived
+        assert compare(results,binary_results)
+        assert list(weights.segments.keys()) == list(results.segments.keys())
+        for segment in weights.segments.values():
+            assert list(segment.keys()) == ['conditions']
+            assert list(segment.conditions.keys()) == ['weights']
+        assert compare(weights.segments.segment_0.conditions.weights,results.segments.segment_0.conditions.weights)
+
+        # a sweep appends its results to one archive
+        for i in range(3):
+            results.segments.segment_0.conditions.weights.total_mass[:] = i
+            archive_binary(results,npy_dir,append=True)
+        sweep = load_binary(npy_dir,keys='segments.*.conditions.weights.total_mass',index=None)
+        assert len(sweep) == 4
+        assert np.all(sweep[-1].segments.segment_0.conditions.weights.total_mass == 2.)
+
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Results of a mission of climb segments
+# ----------------------------------------------------------------------
+def mission_results(number_of_segments):
+
+    results = Data()
+    results.segments = Data()
+    for i in range(number_of_segments):
+        segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+        state   = segment.state
+        state.numerics.number_control_points = 64
+        segment.process.initialize.expand_state(segment)
+        for name in ['battery_state_of_charge','battery_current','battery_voltage_under_load','throttle']:
+            state.conditions.propulsion[name] = state.ones_row(1)
+
+        # fill the conditions with values that do not round trip as short strings
+        for node in [state.conditions] + list(walk(state.conditions)):
+            for k, v in node.items():
+                if isinstance(v,np.ndarray) and v.dtype == float:
+                    v[...] = np.random.rand(*v.shape)
+
+        results.segments['segment_%d' % i] = Data(conditions=state.conditions)
+
+    return results
+
+def walk(data):
+    for v in data.values():
+        if isinstance(v,dict):
+            yield v
+            yield from walk(v)
+
+def compare(a,b):
+    if isinstance(a,dict):
+        return list(a.keys()) == list(b.keys()) and all([compare(a[k],b[k]) for k in a.keys()])
+    if isinstance(a,np.ndarray):
+        return np.array_equal(a,b)
+    return a == b
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+# test_binary_archive.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that a binary archive loads as the data that was archived and as the JSON
+    archive of the same data, with memory-mapped or read arrays, and that loaded memory-mapped
+    results can be archived again
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import os
+import shutil
+import tempfile
+import numpy as np
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Input_Output.SUAVE import archive, load, archive_binary, load_binary
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(0)
+
+    results   = mission_results()
+    directory = tempfile.mkdtemp()
+    json_file = os.path.join(directory,'results.res')
+    npy_dir   = os.path.join(directory,'results')
+
+    try:
+        archive(results,json_file)
+        archive_binary(results,npy_dir)
+        json_results = load(json_file)
+
+        # memory-mapped arrays, and arrays read from the file
+        mapped = load_binary(npy_dir)
+        read   = load_binary(npy_dir,mmap_mode=None)
+        for loaded in [mapped,read]:
+            assert compare(loaded,results)
+            assert same_types(loaded,json_results)
+
+        time = mapped.segments.segment_0.conditions.frames.inertial.time
+        assert isinstance(time,np.memmap) and not time.flags.writeable
+        assert not isinstance(read.segments.segment_0.conditions.frames.inertial.time,np.memmap)
+
+        # the values that are not arrays load as from the JSON archive
+        for key in ['tag','count','ratio','flag','nothing','names']:
+            assert compare(mapped.settings[key],json_results.settings[key])
+
+        # loaded memory-mapped results archive again, to JSON and to a new binary archive
+        archive(mapped,os.path.join(directory,'mapped.res'))
+        assert compare(load(os.path.join(directory,'mapped.res')),json_results)
+        archive_binary(mapped,os.path.join(directory,'mapped'))
+        assert compare(load_binary(os.path.join(directory,'mapped')),results)
+
+        # a partial load keeps the matching subtrees only
+        weights = load_binary(npy_dir,keys='segments.*.conditions.weights')
+        assert list(weights.keys()) == ['segments']
+        for tag, segment in weights.segments.items():
+            assert list(segment.keys()) == ['conditions']
+            assert list(segment.conditions.keys()) == ['weights']
+            assert compare(segment.conditions.weights,results.segments[tag].conditions.weights)
+
+        # appended entries load in order, and a new archive replaces them
+        for i in range(2):
+            results.segments.segment_0.conditions.weights.total_mass[:] = i
+            archive_binary(results,npy_dir,append=True)
+        entries = load_binary(npy_dir,index=None)
+        assert len(entries) == 3
+        assert compare(entries[0],mapped)
+        assert np.all(entries[2].segments.segment_0.conditions.weights.total_mass == 1.)
+        archive_binary(results,npy_dir)
+        assert len(load_binary(npy_dir,index=None)) == 1
+        assert len([name for name in os.listdir(npy_dir) if name.endswith('.bin')]) == 1
+
+    finally:
+        shutil.rmtree(directory)
+
+    print('binary archive loads as archived')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Results of a mission of climb segments
+# ----------------------------------------------------------------------
+def mission_results():
+
+    results = Data()
+    results.segments = Data()
+    for i in range(3):
+        segment = SUAVE.Analyses.Mission.Segments.Climb.Constant_Speed_Constant_Rate()
+        state   = segment.state
+        state.numerics.number_control_points = 8
+        segment.process.initialize.expand_state(segment)
+
+        # values that do not round trip as short strings
+        for node in walk(state.conditions):
+            for k, v in node.items():
+                if isinstance(v,np.ndarray) and v.dtype == float:
+                    v[...] = np.random.rand(*v.shape)
+
+        results.segments['segment_%d' % i] = Data(conditions=state.conditions)
+
+    results.settings = Data()
+    results.settings.tag     = 'mission'
+    results.settings.count   = 3
+    results.settings.ratio   = 0.1
+    results.settings.flag    = True
+    results.settings.nothing = None
+    results.settings.names   = ['a','b']
+    results.settings.indices = np.arange(5)
+    results.settings.table   = np.random.rand(2,3,4)
+    results.settings.empty   = np.zeros((0,1))
+
+    return results
+
+def walk(data):
+    yield data
+    for v in data.values():
+        if isinstance(v,dict):
+            yield from walk(v)
+
+def compare(a,b):
+    if isinstance(a,dict):
+        return list(a.keys()) == list(b.keys()) and all([compare(a[k],b[k]) for k in a.keys()])
+    if isinstance(a,np.ndarray) or isinstance(b,np.ndarray):
+        return np.array_equal(a,b) and np.shape(a) == np.shape(b)
+    return a == b
+
+def same_types(a,b):
+    if isinstance(a,dict):
+        return type(a) == type(b) and all([same_types(a[k],b[k]) for k in a.keys()])
+    return True
+
+if __name__ == '__main__':
+    main()
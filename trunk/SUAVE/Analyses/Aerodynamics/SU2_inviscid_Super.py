@@ -20,11 +20,6 @@ from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
 # Package imports
 import numpy as np
 import time
-import pylab as plt
-import sklearn
-from sklearn import gaussian_process
-from sklearn import neighbors
-from sklearn import svm
 
 # ----------------------------------------------------------------------
 #  Class
@@ -263,6 +258,7 @@ class SU2_inviscid_Super(Aerodynamics):
         
         import pyKriging
         
+        from sklearn import gaussian_process
         # Gaussian Process New
         regr_cl_sup = gaussian_process.GaussianProcess()
         regr_cl_sub = gaussian_process.GaussianProcess()
@@ -313,6 +309,7 @@ class SU2_inviscid_Super(Aerodynamics):
                 CD_sur[ii,jj] = cd_surrogate.predict(np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]]))
         
 
+        import pylab as plt
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
         #plt.clabel(plt_handle, inline=1, fontsize=10)
@@ -13,6 +13,7 @@
 #           May 2021, E. Botero
 #           Jun 2021, R. Erhard
 #           Nov 2022, D. Enriquez
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,8 +24,11 @@ import SUAVE
 
 from SUAVE.Core import Data
 from SUAVE.Core import Units
+from SUAVE.Core import hash_data
  
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution import generate_vortex_distribution
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache import hash_airfoil_file
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -33,6 +37,15 @@ from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import
 # package imports
 import numpy as np 
 from scipy.interpolate import RectBivariateSpline, RegularGridInterpolator
+from collections import OrderedDict
+from copy import deepcopy
+import pickle
+import tempfile
+import time
+import os
+
+# trained surrogates of this session, shared by all vortex lattice analyses
+_training_cache = OrderedDict()
 
 # ----------------------------------------------------------------------
 #  Class
@@ -85,6 +98,7 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.discretize_control_surfaces     = False
         self.settings.use_VORLAX_matrix_calculation   = False
         self.settings.floating_point_precision        = np.float32
+        self.settings.influence_matrix_memory_budget  = None
         self.settings.use_surrogate                   = True
 
         # conditions table, used for surrogate model training
@@ -103,6 +117,15 @@ class Vortex_Lattice(Aerodynamics):
         self.training.wing_drag_coefficient_sub      = None
         self.training.wing_drag_coefficient_sup      = None
         
+        # cache of trained surrogates keyed on the geometry, settings and training grid, 0 turns it off
+        self.training_cache                          = Data()
+        self.training_cache.size                     = 0
+        self.training_cache.directory                = None
+        self.training_cache.hits                     = 0
+        self.training_cache.misses                   = 0
+        self.training_cache.sample_time              = 0.
+        self.training_cache.time_saved               = 0.
+        
         # blending function 
         self.hsub_min                                = 0.85
         self.hsub_max                                = 0.95
@@ -164,11 +187,20 @@ class Vortex_Lattice(Aerodynamics):
         
         # If we are using the surrogate
         if use_surrogate == True: 
-            # sample training data
-            self.sample_training()
-                        
-            # build surrogate
-            self.build_surrogate()        
+            
+            # reuse the surrogates of an identical geometry
+            key = self.training_key()
+            if not self.load_training_cache(key):
+                tic = time.time()
+                
+                # sample training data
+                self.sample_training()
+                            
+                # build surrogate
+                self.build_surrogate()        
+                
+                self.training_cache.sample_time = time.time() - tic
+                self.store_training_cache(key)
             
             self.evaluate = self.evaluate_surrogate
                
@@ -374,6 +406,186 @@ class Vortex_Lattice(Aerodynamics):
         return  
     
     
+    def training_key(self):
+        """Hashes everything the surrogate training depends on.
+
+        Assumptions:
+        The lifting surfaces, bodies, reference area, center of gravity, settings and
+        training grid set the training. Mass properties of the components and the
+        vortex distribution left by earlier runs are left out. Airfoil files are
+        identified by their content, so an edited file gives a new key.
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key           [str]
+
+        Properties Used:
+        self.geometry.
+          wings
+          fuselages
+          nacelles
+          reference_area
+          mass_properties.center_of_gravity
+        self.settings
+        self.training.
+          angle_of_attack             [radians]
+          Mach                        [-]
+        """
+        
+        geometry = self.geometry
+        
+        inputs = Data()
+        inputs.version         = SUAVE.__version__
+        inputs.wings           = geometry.get('wings',None)
+        inputs.fuselages       = geometry.get('fuselages',None)
+        inputs.nacelles        = geometry.get('nacelles',None)
+        inputs.reference_area  = geometry.get('reference_area',None)
+        if 'mass_properties' in geometry:
+            inputs.center_of_gravity = geometry.mass_properties.center_of_gravity
+        inputs.settings        = self.settings
+        inputs.angle_of_attack = self.training.angle_of_attack
+        inputs.Mach            = self.training.Mach
+        inputs.airfoil_files   = airfoil_file_hashes([inputs.wings,inputs.fuselages,inputs.nacelles])
+        
+        return hash_data(inputs,skip=['mass_properties','vortex_distribution','influence_matrix_memory_budget'])
+    
+    def load_training_cache(self,key):
+        """Puts cached training data and surrogates into this analysis. Looks in the
+        surrogates trained in this session first and then in the cache directory.
+
+        Assumptions:
+        Unreadable cache files are deleted and count as a miss
+
+        Source:
+        N/A
+
+        Inputs:
+        key           [str]
+
+        Outputs:
+        hit           [bool]
+
+        Properties Used:
+        self.training_cache.
+          size                        [int]
+          directory                   [str]
+        """
+        
+        cache = self.training_cache
+        if not cache.size:
+            return False
+        
+        tic   = time.time()
+        entry = None
+        
+        if key in _training_cache:
+            entry = _training_cache[key]
+            _training_cache.move_to_end(key)
+            
+        elif cache.directory is not None:
+            path = os.path.join(cache.directory,key + '.pkl')
+            if os.path.exists(path):
+                try:
+                    with open(path,'rb') as file:
+                        entry = pickle.load(file)
+                    os.utime(path)
+                    remember_training(key,entry,cache.size)
+                except Exception:
+                    entry = None
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    
+        if entry is None:
+            cache.misses += 1
+            return False
+        
+        self.training   = deepcopy(entry.training)
+        self.surrogates = deepcopy(entry.surrogates)
+        
+        # leave the panels on the geometry as if the vortex lattice had been run
+        generate_vortex_distribution(self.geometry,self.settings)
+        
+        cache.hits       += 1
+        cache.sample_time = entry.sample_time
+        cache.time_saved += entry.sample_time - (time.time() - tic)
+        
+        return True
+    
+    def store_training_cache(self,key):
+        """Caches the training data and surrogates of this analysis. Beyond the cache
+        size the least recently used entries are dropped, in this session and in the
+        cache directory.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        key           [str]
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.training_cache.
+          size                        [int]
+          directory                   [str]
+          sample_time                 [s]
+        """        
+        
+        cache = self.training_cache
+        if not cache.size:
+            return
+        
+        entry = Data()
+        entry.training    = deepcopy(self.training)
+        entry.surrogates  = deepcopy(self.surrogates)
+        entry.sample_time = cache.sample_time
+        
+        remember_training(key,entry,cache.size)
+        
+        if cache.directory is not None:
+            os.makedirs(cache.directory,exist_ok=True)
+            
+            # write under a temporary name and rename, so other processes never read a partial file
+            temp_path = None
+            try:
+                handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=cache.directory)
+                with os.fdopen(handle,'wb') as file:
+                    pickle.dump(entry,file)
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, os.path.join(cache.directory,key + '.pkl'))
+            except OSError:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)
+                
+            # drop the least recently used files, which other processes may have removed already
+            times = []
+            for name in os.listdir(cache.directory):
+                if name.endswith('.pkl'):
+                    path = os.path.join(cache.directory,name)
+                    try:
+                        times.append((os.path.getmtime(path),path))
+                    except FileNotFoundError:
+                        pass
+            times.sort()
+            for _,path in times[:max(len(times)-cache.size,0)]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        
+        return
+        
     def sample_training(self):
         """Call methods to run vortex lattice for sample point evaluation.
 
@@ -634,6 +846,77 @@ class Vortex_Lattice(Aerodynamics):
 # ----------------------------------------------------------------------
 #  Helper Functions
 # ----------------------------------------------------------------------
+def remember_training(key,entry,size):
+    """Keeps trained surrogates for the rest of the session, dropping the least
+    recently used beyond the cache size.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    key        [str]
+    entry      [Data]
+    size       [int]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    
+    _training_cache[key] = entry
+    _training_cache.move_to_end(key)
+    while len(_training_cache) > size:
+        _training_cache.popitem(last=False)
+        
+    return
+
+def airfoil_file_hashes(components):
+    """Finds the airfoil coordinate and polar files of the components and hashes their
+    content.
+
+    Assumptions:
+    Files that do not exist are identified by their name
+
+    Source:
+    N/A
+
+    Inputs:
+    components [list of Data]
+
+    Outputs:
+    hashes     [list], [file, content hash] sorted by file
+
+    Properties Used:
+    N/A
+    """
+    
+    files = set()
+    def find_files(data):
+        if not isinstance(data,dict):
+            return
+        for key,value in data.items():
+            if key == 'coordinate_file' and isinstance(value,str):
+                files.add(value)
+            elif key == 'polar_files' and isinstance(value,(list,tuple)):
+                files.update([name for name in value if isinstance(name,str)])
+            else:
+                find_files(value)
+                
+    for component in components:
+        find_files(component)
+        
+    hashes = []
+    for name in sorted(files):
+        content = hash_airfoil_file(name) if os.path.isfile(name) else None
+        hashes.append([name,content])
+        
+    return hashes
+
 def calculate_VLM(conditions,settings,geometry):
     """Calculate the total vehicle lift coefficient and specific wing coefficients (with specific wing reference areas)
     using a vortex lattice method.
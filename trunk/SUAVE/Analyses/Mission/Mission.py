@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -12,6 +13,7 @@
 
 import SUAVE
 from SUAVE.Core import Container as ContainerBase
+from SUAVE.Core import parallel_map
 from . import Segments
 
 # ----------------------------------------------------------------------
@@ -88,11 +90,16 @@ class Container(ContainerBase):
         None
     """    
     
+    # missions are independent, solve them on this many processes
+    number_of_processes = 1
+    
     def evaluate(self,state=None):
         """ Go through the missions, run through them, save the results
     
             Assumptions:
-            None
+            Missions share no state, so with number_of_processes > 1 they are solved
+            on a process pool and the solved segment states are copied back into
+            the missions of this container.
     
             Source:
             N/A
@@ -104,10 +111,20 @@ class Container(ContainerBase):
             Results [Data()]
     
             Properties Used:
-            None
+            self.number_of_processes [int]
         """         
         results = SUAVE.Core.Data()
         
+        if self.number_of_processes > 1 and len(self) > 1:
+            keys   = list(self.keys())
+            solved = parallel_map(lambda key: pack_states(self[key].evaluate(state)),
+                                  keys,self.number_of_processes)
+            for key,states in zip(keys,solved):
+                mission = self[key]
+                unpack_states(mission,states)
+                results[key] = mission
+            return results
+        
         for key,mission in self.items():
             result = mission.evaluate(state)
             results[key] = result
@@ -136,3 +153,69 @@ class Container(ContainerBase):
 
 # Link container
 Mission.Container = Container
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+def pack_states(segment):
+    """ Collects the solved states of a segment and all of its sub segments, used to
+        send a mission solved on another process back
+    
+        Assumptions:
+        None
+    
+        Source:
+        N/A
+    
+        Inputs:
+        segment [Segment()]
+    
+        Outputs:
+        states  [Data()]
+    
+        Properties Used:
+        None
+    """     
+    states            = SUAVE.Core.Data()
+    states.state      = segment.state
+    states.conditions = segment.get('conditions',None)
+    states.converged  = segment.get('converged',None)
+    states.segments  = SUAVE.Core.Data()
+    
+    for tag,sub_segment in segment.get('segments',{}).items():
+        states.segments[tag] = pack_states(sub_segment)
+        
+    return states
+
+## @ingroup Analyses-Mission
+def unpack_states(segment,states):
+    """ Puts states collected with pack_states back into a segment and its sub segments
+    
+        Assumptions:
+        The segment has the same structure as the one that was packed
+    
+        Source:
+        N/A
+    
+        Inputs:
+        segment [Segment()]
+        states  [Data()]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        None
+    """     
+    segment.state = states.state
+    if states.conditions is not None:
+        segment.conditions = states.conditions
+    if states.converged is not None:
+        segment.converged = states.converged
+        
+    for tag,sub_states in states.segments.items():
+        unpack_states(segment.segments[tag],sub_states)
+        
+    return
@@ -53,6 +53,8 @@ class Numerics(Conditions):
         self.discretization_method = chebyshev_data
         
         self.solver_jacobian                  = "none"
+        self.jacobian_sparsity                = None
+        self.jacobian_coloring                = None
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Sep 2016, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,9 +13,9 @@
 # SUAVE imports
 
 from SUAVE.Analyses import Analysis, Settings, Process
+from SUAVE.Core import merge_data
 from .Conditions import State
 import numpy as np
-from copy import deepcopy
 
 # ----------------------------------------------------------------------
 #  Segment
@@ -181,17 +182,19 @@ class Segment(Analysis):
         return self
     
     
-    def merged(self):
+    def merged(self,views=False):
         """ Combines the states of multiple segments
     
             Assumptions:
-            None
+            Every merged array is allocated once. With views the arrays of the segments are
+            replaced by views of their rows in the merged arrays, so the segments and the
+            merged state share their memory.
     
             Source:
             N/A
     
             Inputs:
-            None
+            views     [bool]
     
             Outputs:
             state_out [State()]
@@ -200,15 +203,12 @@ class Segment(Analysis):
             None
         """              
         
-        state_out = State()
+        state_out  = State()
+        sub_states = [sub_seg.state for sub_seg in self.segments.values()]
         
-        for i,(tag,sub_seg) in enumerate(self.segments.items()):
-            sub_state = sub_seg.state
+        if sub_states:
             for key in ['unknowns','conditions','residuals']:
-                if i == 0:
-                    state_out[key] = deepcopy(sub_state[key]) # Necessary deepcopy: otherwise the next step overwrites this state
-                else:
-                    state_out[key].append_or_update(sub_state[key])
+                state_out[key] = merge_data([sub_state[key] for sub_state in sub_states],views)
 
         return state_out
 
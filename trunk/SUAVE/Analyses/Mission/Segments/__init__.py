@@ -7,11 +7,13 @@ from .Segment     import Segment
 from .Simple      import Simple
 from .Aerodynamic import Aerodynamic
 
-from . import Climb
-from . import Conditions
-from . import Cruise
-from . import Descent
-from . import Ground
-from . import Hover
-from . import Single_Point
-from . import Transition
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Climb',
+                                             'Conditions',
+                                             'Cruise',
+                                             'Descent',
+                                             'Ground',
+                                             'Hover',
+                                             'Single_Point',
+                                             'Transition'])
\ No newline at end of file
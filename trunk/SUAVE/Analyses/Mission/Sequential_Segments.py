@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Oct 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -64,6 +65,9 @@ class Sequential_Segments(Mission):
         # --------------------------------------------------------------
         self.process.converge = Methods.Segments.Common.Sub_Segments.sequential_sub_segments
         
+        # speculative_sub_segments pre-solves the segments on this many processes
+        self.settings.number_of_processes = None
+        
         # --------------------------------------------------------------
         #   Iterate
         # --------------------------------------------------------------        
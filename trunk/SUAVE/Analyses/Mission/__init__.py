@@ -7,6 +7,7 @@ from .All_At_Once import All_At_Once
 from .Mission import Mission
 from .Sequential_Segments import Sequential_Segments
 
-# packages
-from . import Segments
-from . import Variable_Range_Cruise
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Segments',
+                                             'Variable_Range_Cruise'])
@@ -6,6 +6,7 @@
 # Modified: Apr 2021, M. Clarke
 #           Jul 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,17 +15,14 @@ import SUAVE
 from SUAVE.Core import Data , Units
 from .Noise     import Noise 
 
-from SUAVE.Components.Physical_Component import Container 
 
 # noise imports 
 from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_Fink                   import noise_airframe_Fink
 from SUAVE.Methods.Noise.Fidelity_One.Engine.noise_SAE                               import noise_SAE  
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_geometric                    import noise_geometric
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.decibel_arithmetic                 import SPL_arithmetic
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points         import generate_ground_microphone_points
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise_evaluation_locations import compute_ground_noise_evaluation_locations
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.compute_noise_evaluation_locations import compute_building_noise_evaluation_locations
-from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity               import propeller_mid_fidelity 
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.microphone_geometry                import microphone_geometry
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_noise_tiles                import propeller_noise_tiles 
 
 # package imports
 import numpy as np
@@ -70,6 +68,9 @@ class Fidelity_One(Noise):
         # Initialize quantities                   
         settings                                      = self.settings
         settings.harmonics                            = np.arange(1,30) 
+        settings.harmonic_noise_memory_budget         = 100e6 # bytes, None for all microphones at once
+        settings.microphone_tile_size                 = 10    # microphones evaluated at once, None for all of them
+        settings.number_of_processes                  = 1     # processes evaluating the microphone tiles
         settings.flyover                              = False    
         settings.approach                             = False
         settings.sideline                             = False
@@ -89,6 +90,7 @@ class Fidelity_One(Noise):
         settings.level_ground_microphone_max_y        = 450   # sideline microphone distance
         settings.level_ground_microphone_x_resolution = 5
         settings.level_ground_microphone_y_resolution = 5
+        settings.microphone_culling_distance          = None  # microphones farther from a segment are not evaluated for the rotors, None for all
         settings.center_frequencies                   = np.array([16,20,25,31.5,40, 50, 63, 80, 100, 125, 160, 200, 250, 315, 400, \
                                                                   500, 630, 800, 1000, 1250, 1600, 2000, 2500, 3150,
                                                                   4000, 5000, 6300, 8000, 10000])        
@@ -127,26 +129,25 @@ class Fidelity_One(Noise):
         conditions    = segment.state.conditions  
         dim_cf        = len(settings.center_frequencies ) 
         ctrl_pts      = int(segment.state.numerics.number_control_points)
-        min_x         = settings.level_ground_microphone_min_x         
-        max_x         = settings.level_ground_microphone_max_x         
-        min_y         = settings.level_ground_microphone_min_y         
-        max_y         = settings.level_ground_microphone_max_y         
-        x_resolution  = settings.level_ground_microphone_x_resolution  
-        y_resolution  = settings.level_ground_microphone_y_resolution 
-            
-        
-        # generate noise valuation points
-        settings.ground_microphone_locations = generate_ground_microphone_points(min_x,max_x,min_y,max_y,x_resolution,y_resolution )     
-        
-        GM_THETA,GM_PHI,GML,num_gm_mic = compute_ground_noise_evaluation_locations(settings,segment)
-        
-        BM_THETA,BM_PHI,UCML,num_b_mic = compute_building_noise_evaluation_locations(settings,segment) 
-        
-        mic_locations  = np.concatenate((GML,UCML),axis = 1) 
-        THETA          = np.concatenate((GM_THETA,BM_THETA),axis = 1) 
-        PHI            = np.concatenate((GM_PHI,BM_PHI),axis = 1)  
-        
-        num_mic = num_b_mic + num_gm_mic  
+        position      = conditions.frames.inertial.position_vector
+        
+        # noise evaluation points, shared by every segment with the same microphones
+        geometry                             = microphone_geometry(settings)
+        settings.ground_microphone_locations = geometry.ground_locations
+        num_gm_mic                           = geometry.number_ground_microphones
+        num_b_mic                            = geometry.number_building_microphones
+        num_mic                              = geometry.number_of_microphones
+        
+        THETA, PHI, mic_locations = geometry.relative_locations(position)
+        GM_THETA       = THETA[:,:num_gm_mic]
+        BM_THETA       = THETA[:,num_gm_mic:]
+        GM_PHI         = PHI[:,:num_gm_mic]
+        BM_PHI         = PHI[:,num_gm_mic:]
+        GML            = mic_locations[:,:num_gm_mic]
+        UCML           = mic_locations[:,num_gm_mic:]
+        
+        # only the microphones close enough to the segment are evaluated for the rotors
+        audible_mics   = geometry.audible_microphones(position,settings.microphone_culling_distance)
         
         # append microphone locations to conditions
         conditions.noise.ground_microphone_theta_angles   = GM_THETA
@@ -208,22 +209,7 @@ class Fidelity_One(Noise):
                             rotors        = net.lift_rotors 
                             identity_flag = net.identical_lift_rotors
                              
-                        if identity_flag:
-                            aeroacoustic_data  = acoustic_data[list(acoustic_data.keys())[0]] 
-                            propeller_noise    = propeller_mid_fidelity(rotors,aeroacoustic_data,segment,settings) 
-                        else:
-                            distributed_rotors                       = Container()
-                            num_rotors                               = len(rotors)
-                            distributed_prop_noise_SPL_dBA           = np.zeros((num_rotors,ctrl_pts,num_mic)) 
-                            distributed_prop_noise_SPL_1_3_spectrum  = np.zeros((num_rotors,ctrl_pts,num_mic,dim_cf)) 
-                            for r_idx , rotor  in enumerate(rotors): 
-                                aeroacoustic_data                               = acoustic_data[rotor.tag]                                    
-                                distributed_rotors.append(rotors[rotor.tag])       
-                                propeller_noise                                 = propeller_mid_fidelity(distributed_rotors,aeroacoustic_data,segment,settings) 
-                                distributed_prop_noise_SPL_dBA[r_idx]           = propeller_noise.SPL_dBA 
-                                distributed_prop_noise_SPL_1_3_spectrum[r_idx]  = propeller_noise.SPL_1_3_spectrum     
-                            propeller_noise.SPL_dBA          = SPL_arithmetic(distributed_prop_noise_SPL_dBA ,sum_axis=0)
-                            propeller_noise.SPL_1_3_spectrum = SPL_arithmetic(distributed_prop_noise_SPL_1_3_spectrum ,sum_axis=0)
+                        propeller_noise = propeller_noise_tiles(rotors,acoustic_data,identity_flag,segment,settings,audible_mics)
                      
                         source_SPLs_dBA[:,si,:]      = propeller_noise.SPL_dBA 
                         source_SPL_spectra[:,si,:,:] = propeller_noise.SPL_1_3_spectrum    
@@ -2,7 +2,7 @@
 # Rotor_Wake_Fidelity_One.py
 #
 # Created:  Jan 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -66,10 +66,31 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         self.wake_settings.number_steps_per_rotation  = 72
         self.wake_settings.initial_timestep_offset    = 0    # initial timestep
         
+        # evaluation of the wake induced velocities
+        self.wake_settings.floating_point_precision       = np.float64
+        self.wake_settings.induced_velocity_memory_budget = 20e6 # bytes, None for a single pass
+        self.wake_settings.far_field_tolerance            = None # cluster size over distance for the far field approximation
+        
         # wake convergence criteria
         self.maximum_convergence_iteration            = 10
         self.axial_velocity_convergence_tolerance     = 1e-2
         
+        # reuse of the induced velocities of control points whose circulation, velocity, speed and 
+        # orientation changed less than this relative tolerance since the last call, None to never reuse.
+        # The default only absorbs the round-off that the BET solve of other control points leaves.
+        self.circulation_reuse_tolerance              = 1e-9
+        self.previous_solution                        = None
+        
+        # instrumentation, the callback is called as callback(wake,record) after every wake convergence
+        self.convergence_callback                     = None
+        self.convergence_statistics                   = Data()
+        self.convergence_statistics.calls             = 0
+        self.convergence_statistics.iterations        = 0
+        self.convergence_statistics.evaluated_points  = 0
+        self.convergence_statistics.reused_points     = 0
+        self.convergence_statistics.regenerations     = 0
+        self.convergence_statistics.time              = 0.
+        
         # flags for slipstream interaction
         self.slipstream                 = False
         self.verbose                    = False
@@ -99,8 +120,8 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         None
         
         """
-        # run the BET once using fidelity zero inflow
-        rotor_temp = copy.deepcopy(rotor)
+        # run the BET once using fidelity zero inflow, spin only rebinds the attributes of the copy
+        rotor_temp = copy.copy(rotor)
         rotor_temp.Wake = Rotor_Wake_Fidelity_Zero()
         _,_,_,_,outputs,_ = rotor_temp.spin(conditions)
         
@@ -236,7 +257,11 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
     
         # compute the induced velocity from the rotor wake on the lifting surfaces
         VD.Wake         = wake_vortex_distribution
-        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
+        settings        = self.wake_settings
+        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts,
+                                                        precision           = settings.get('floating_point_precision',np.float64),
+                                                        memory_budget       = settings.get('induced_velocity_memory_budget',None),
+                                                        far_field_tolerance = settings.get('far_field_tolerance',None))        
         
         return rot_V_wake_ind
     
@@ -3,4 +3,6 @@
 # @ingroup Analyses
 
 
-from . import Sizing
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Sizing'])
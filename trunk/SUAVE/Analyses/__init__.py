@@ -9,13 +9,15 @@ from .Process   import Process
 from .Settings  import Settings
 from .Vehicle   import Vehicle
 
-from . import Aerodynamics
-from . import Stability
-from . import Energy
-from . import Weights
-from . import Mission
-from . import Atmospheric
-from . import Planets
-from . import Sizing
-from . import Noise
-from . import Costs
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Aerodynamics',
+                                             'Stability',
+                                             'Energy',
+                                             'Weights',
+                                             'Mission',
+                                             'Atmospheric',
+                                             'Planets',
+                                             'Sizing',
+                                             'Noise',
+                                             'Costs'])
\ No newline at end of file
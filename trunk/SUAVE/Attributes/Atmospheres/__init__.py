@@ -5,5 +5,6 @@
 # classes
 from .Atmosphere import Atmosphere
 
-# packages
-from . import Earth
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Earth'])
@@ -1,12 +1,13 @@
 ## @defgroup Attributes
 # Attributes provide objects that can be attached to various analyses.
 
-# packages
-from . import Constants
-from . import Gases
-from . import Planets
-from . import Atmospheres
-from . import Propellants
-from . import Airports
-from . import Solids
-from . import Cryogens
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Constants',
+                                             'Gases',
+                                             'Planets',
+                                             'Atmospheres',
+                                             'Propellants',
+                                             'Airports',
+                                             'Solids',
+                                             'Cryogens'])
\ No newline at end of file
@@ -12,6 +12,7 @@
 #           Jul 2021, R. Erhard
 #           Sep 2021, R. Erhard
 #           Feb 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -22,7 +23,7 @@ from SUAVE.Core import ContainerOrdered
 from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero import Rotor_Wake_Fidelity_Zero
 from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_One import Rotor_Wake_Fidelity_One
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations \
-     import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
+     import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss,stack_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import  orientation_product, orientation_transpose
 
@@ -151,6 +152,7 @@ class Rotor(Energy_Component):
 
         Inputs:
         self.inputs.omega                    [radian/s]
+        self.inputs.number_of_rotors         [-], rotors stacked along the control points, optional
         conditions.freestream.
           density                            [kg/m^3]
           dynamic_viscosity                  [kg/(m-s)]
@@ -214,6 +216,12 @@ class Rotor(Energy_Component):
         tc       = self.thickness_to_chord
         a_loc    = self.airfoil_polar_stations
         airfoils = self.Airfoils
+        
+        # stack the airfoil polars once for all BET iterations
+        if a_loc != None:
+            airfoil_polars = stack_airfoil_polars(airfoils,a_loc)
+        else:
+            airfoil_polars = None
  
 
         # Unpack rotor inputs and conditions
@@ -395,6 +403,8 @@ class Rotor(Energy_Component):
         wake_inputs.radius_distribution   = r
         wake_inputs.speed_of_sounds       = a
         wake_inputs.dynamic_viscosities   = nu
+        wake_inputs.airfoil_polars        = airfoil_polars
+        wake_inputs.number_of_rotors      = self.inputs.get('number_of_rotors',1)
 
         va, vt = self.Wake.evaluate(self,wake_inputs,conditions)
         
@@ -405,7 +415,8 @@ class Rotor(Energy_Component):
         lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
 
         # Compute aerodynamic forces based on specified input airfoil or surrogate
-        Cl, Cdval, alpha, Ma,W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+        Cl, Cdval, alpha, Ma,W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis,
+                                                              airfoil_polars)
         
         
         # compute HFW circulation at the blade
@@ -619,6 +630,7 @@ class Rotor(Energy_Component):
         There are two propeller frames, the vehicle frame describing the location and the propeller velocity frame.
         Velocity frame is X out the nose, Z towards the ground, and Y out the right wing
         Vehicle frame is X towards the tail, Z towards the ceiling, and Y out the right wing
+        The orientation euler angles can be given per control point
 
         Source:
         N/A
@@ -639,7 +651,8 @@ class Rotor(Energy_Component):
         # Go from vehicle frame to propeller vehicle frame: rot 1 including the extra body rotation
         cpts       = len(np.atleast_1d(self.inputs.y_axis_rotation))
         rots       = np.array(self.orientation_euler_angles) * 1.
-        rots       = np.repeat(rots[None,:], cpts, axis=0)
+        if np.ndim(rots) == 1:
+            rots   = np.repeat(rots[None,:], cpts, axis=0)
         rots[:,1] += np.atleast_2d(self.inputs.y_axis_rotation)[:,0]
         
         vehicle_2_prop_vec = sp.spatial.transform.Rotation.from_rotvec(rots).as_matrix()
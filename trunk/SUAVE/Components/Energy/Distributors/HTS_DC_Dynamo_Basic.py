@@ -13,7 +13,6 @@ import SUAVE
 import numpy as np
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Methods.Cryogenics.Dynamo.dynamo_efficiency import efficiency_curve
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  HTS DC Dynamo Class
@@ -10,6 +10,7 @@
 #           Aug 2021, M. Clarke
 #           Feb 2022, R. Erhard
 #           Mar 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,6 +24,7 @@ from SUAVE.Analyses.Mission.Segments.Conditions import Residuals
 from SUAVE.Components.Physical_Component import Container 
 from SUAVE.Methods.Power.Battery.pack_battery_conditions import pack_battery_conditions
 from SUAVE.Methods.Power.Battery.append_initial_battery_conditions import append_initial_battery_conditions
+from SUAVE.Methods.Propulsion.spin_rotors import spin_rotors
 from SUAVE.Core import Data , Units 
 import copy
 
@@ -170,14 +172,14 @@ class Battery_Propeller(Network):
             total_thrust        = 0. * state.ones_row(3)
             total_power         = 0.
             
-            # Iterate over motor/props
+            # Unpack the motors and props
+            motor_keys = list(motors.keys())[:n_evals]
+            prop_keys  = list(props.keys())[:n_evals]
+            
+            # Iterate over motors
             for ii in range(n_evals):
-                
-                # Unpack the motor and props
-                motor_key = list(motors.keys())[ii]
-                prop_key  = list(props.keys())[ii]
-                motor     = self.propeller_motors[motor_key]
-                prop      = self.propellers[prop_key]
+                motor     = self.propeller_motors[motor_keys[ii]]
+                prop      = self.propellers[prop_keys[ii]]
 
                 # Set rotor y-axis rotation                
                 prop.inputs.y_axis_rotation = conditions.propulsion.propeller_y_axis_rotation                    
@@ -192,8 +194,15 @@ class Battery_Propeller(Network):
                 # link
                 prop.inputs.omega           = motor.outputs.omega 
                 
-                # step 4
-                F, Q, P, Cp, outputs, etap = prop.spin(conditions)
+            # step 4, props with the same blades are spun together
+            spins = spin_rotors([self.propellers[prop_key] for prop_key in prop_keys],conditions)
+            
+            # Iterate over motor/props
+            for ii in range(n_evals):
+                motor     = self.propeller_motors[motor_keys[ii]]
+                prop      = self.propellers[prop_keys[ii]]
+                
+                F, Q, P, Cp, outputs, etap = spins[ii]
                     
                 # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
                 eta        = conditions.propulsion.throttle[:,0,None]
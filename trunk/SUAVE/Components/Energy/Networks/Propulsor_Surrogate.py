@@ -18,10 +18,6 @@ from SUAVE.Methods.Geometry.Three_Dimensional     import  orientation_product, o
 import numpy as np
 import scipy as sp
 from copy import deepcopy
-from sklearn import gaussian_process
-from sklearn.gaussian_process.kernels import RationalQuadratic, ConstantKernel, RBF, Matern
-from sklearn import neighbors
-from sklearn import svm, linear_model 
 
 # ----------------------------------------------------------------------
 #  Network
@@ -203,6 +199,9 @@ class Propulsor_Surrogate(Network):
         sfc     /= self.sfc_input_scale
        
        
+        from sklearn import gaussian_process, neighbors, svm, linear_model
+        from sklearn.gaussian_process.kernels import Matern
+        
         # Pick the type of process
         if self.surrogate_type  == 'gaussian':
             gp_kernel = Matern()
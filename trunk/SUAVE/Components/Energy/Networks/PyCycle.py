@@ -11,10 +11,6 @@
 import numpy as np
 from copy import deepcopy
 
-from sklearn import gaussian_process
-from sklearn.gaussian_process.kernels import Matern
-from sklearn import neighbors
-from sklearn import svm, linear_model
 
 # SUAVE imports
 from SUAVE.Core import Data, Units
@@ -186,6 +182,9 @@ class PyCycle(Propulsor_Surrogate):
         sfc     /= self.sfc_input_scale
        
        
+        from sklearn import gaussian_process, neighbors, svm, linear_model
+        from sklearn.gaussian_process.kernels import Matern
+        
         # Pick the type of process
         if self.surrogate_type  == 'gaussian':
             gp_kernel = Matern()
@@ -2,6 +2,7 @@
 # Simple_Propulsor.py
 # 
 # Created:  Ago 2018, M. Gallani
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -17,7 +18,8 @@ from SUAVE.Components.Energy.Networks import Network
 import scipy.interpolate
 from pathlib import Path
 import os
-from SUAVE.Core import Data, Units
+import tempfile
+from SUAVE.Core import Data, Units, Grid_Interpolator
 
 # ----------------------------------------------------------------------
 #  Network
@@ -64,96 +66,33 @@ class Turbofan_Raymer(Network):
 
         tool_path = Path(__file__).resolve().parents[3]
 
-        max_thrust_surrogate_path = os.path.join(tool_path, "Data_Files", "maxthrust.csv")
-        max_thrust_data = np.loadtxt(max_thrust_surrogate_path, delimiter=",", skiprows=1)
-
-        max_thrust_altitude_vector = np.unique(max_thrust_data[:, 0])
-        max_thrust_mach_vector = np.linspace(0, 0.9, 20)
-
-        max_thrust_over_all_altitudes_and_mach = np.array([])
-        for i, ALT in enumerate(max_thrust_altitude_vector):
-            if i == 0:
-                max_thrust_over_all_altitudes_and_mach = scipy.interpolate.interp1d(
-                    max_thrust_data[np.where(max_thrust_data[:, 0] == ALT)[0], 1],
-                    max_thrust_data[np.where(max_thrust_data[:, 0] == ALT)[0], 2],
-                    fill_value='extrapolate',
-                    kind='quadratic')(max_thrust_mach_vector)
-            else:
-                max_thrust_over_all_altitudes_and_mach = np.vstack((max_thrust_over_all_altitudes_and_mach,
-                                                                    scipy.interpolate.interp1d(
-                                                                        max_thrust_data[
-                                                                            np.where(max_thrust_data[:, 0] == ALT)[
-                                                                                0], 1],
-                                                                        max_thrust_data[
-                                                                            np.where(max_thrust_data[:, 0] == ALT)[
-                                                                                0], 2],
-                                                                        fill_value='extrapolate',
-                                                                        kind='quadratic')(max_thrust_mach_vector))
-                                                                   )
-        self.max_thrust_interp = scipy.interpolate.RegularGridInterpolator(
-            (max_thrust_altitude_vector, max_thrust_mach_vector), max_thrust_over_all_altitudes_and_mach, bounds_error=False, fill_value=70000)
-
-        tsfc_surrogate_path = os.path.join(tool_path, "Data_Files", "tsfc.csv")
-        tsfc_data = np.loadtxt(tsfc_surrogate_path, delimiter=",", skiprows=1)
-
-        tsfc_altitude_vector = np.unique(tsfc_data[:, 0])
-        tsfc_mach_vector = np.unique(tsfc_data[:, 1])
-        tsfc_throttle_vector = np.linspace(0, 1, 20)
-
-        for i, ALT in enumerate(tsfc_altitude_vector):
-            for j, MACH in enumerate(tsfc_mach_vector):
-                if j == 0:
-                    tsfc_data_alt_fit = tsfc_data[np.where(tsfc_data[:, 0] == ALT)]
-                    if MACH > max(tsfc_data_alt_fit[:, 1]):
-                        MACH = max(tsfc_data_alt_fit[:, 1])
-                    elif MACH < min(tsfc_data_alt_fit[:, 1]):
-                        MACH = min(tsfc_data_alt_fit[:, 1])
-
-                    points = np.array([ALT, MACH]).T
-                    max_thrust = self.max_thrust_interp(points)
-                    tsfc_thrust_vector = tsfc_throttle_vector * max_thrust
-                    tsfc_data_alt_and_mach_fit = tsfc_data_alt_fit[np.where(tsfc_data_alt_fit[:, 1] == MACH)]
-
-                    if np.ndim(tsfc_data_alt_and_mach_fit) == 2:
-                        tsfc_for_this_mach_total = scipy.interpolate.interp1d(
-                            tsfc_data_alt_and_mach_fit[:, 2],
-                            tsfc_data_alt_and_mach_fit[:, 3],
-                            fill_value='extrapolate',
-                            kind='linear')(tsfc_thrust_vector)
-                    else:
-                        tsfc_for_this_mach_total = 2 * np.ones_like(tsfc_thrust_vector)
-                else:
-                    tsfc_data_alt_fit = tsfc_data[np.where(tsfc_data[:, 0] == ALT)]
-                    if MACH > max(tsfc_data_alt_fit[:, 1]):
-                        MACH = max(tsfc_data_alt_fit[:, 1])
-                    elif MACH < min(tsfc_data_alt_fit[:, 1]):
-                        MACH = min(tsfc_data_alt_fit[:, 1])
-
-                    points = np.array([ALT, MACH]).T
-                    max_thrust = self.max_thrust_interp(points)
-                    tsfc_thrust_vector = tsfc_throttle_vector * max_thrust
-                    tsfc_data_alt_and_mach_fit = tsfc_data_alt_fit[np.where(tsfc_data_alt_fit[:, 1] == MACH)]
-
-                    if np.ndim(tsfc_data_alt_and_mach_fit) == 2:
-                        tsfc_for_this_mach_current = scipy.interpolate.interp1d(
-                            tsfc_data_alt_and_mach_fit[:, 2],
-                            tsfc_data_alt_and_mach_fit[:, 3],
-                            fill_value='extrapolate',
-                            kind='linear')(tsfc_thrust_vector)
-                    else:
-                        tsfc_for_this_mach_current = 2 * np.ones_like(tsfc_thrust_vector)
-
-                    tsfc_for_this_mach_total = np.vstack((tsfc_for_this_mach_total, tsfc_for_this_mach_current))
-
-            if i == 0:
-                tsfc_total = tsfc_for_this_mach_total
-            else:
-                tsfc_total = np.dstack((tsfc_total, tsfc_for_this_mach_total))
-
-        self.tsfc_interp = scipy.interpolate.RegularGridInterpolator(
-            (tsfc_mach_vector, tsfc_throttle_vector, tsfc_altitude_vector), tsfc_total, bounds_error=False, fill_value=0.55)
+        self.max_thrust_deck   = os.path.join(tool_path, "Data_Files", "maxthrust.csv")
+        self.tsfc_deck         = os.path.join(tool_path, "Data_Files", "tsfc.csv")
 
+    def engine_deck(self):
+        """ Returns the engine deck interpolators, which are shared by all networks using the same deck files.
     
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            deck.
+              max_thrust_interp    [Grid_Interpolator]
+              tsfc_interp          [Grid_Interpolator]
+    
+            Properties Used:
+            self.max_thrust_deck
+            self.tsfc_deck
+        """
+        
+        return load_engine_deck(self.max_thrust_deck, self.tsfc_deck)
+
     # manage process with a driver function
     def evaluate_thrust(self,state):
         """ Calculate thrust given the current state of the vehicle
@@ -194,19 +133,35 @@ class Turbofan_Raymer(Network):
         results.network_y_axis_rotation = conditions.ones_row(1) * 0.0
         return results
 
-    def get_max_thrust(self, altitude, mach):
+    def get_max_thrust(self, altitude, mach, derivatives=False):
+        """ Max thrust per engine from the engine deck, optionally with its derivatives
+            with respect to altitude and mach number.
+        """
         altitude = altitude / Units.ft
         points = np.array([altitude, mach]).T
-        maxthrust = self.max_thrust_interp(points)
-        maxthrust = maxthrust.T * Units.lbf * self.max_thrust_factor
-        return maxthrust
-
-    def get_tsfc(self, altitude, mach, throttle):
+        if not derivatives:
+            maxthrust = self.engine_deck().max_thrust_interp(points)
+            maxthrust = maxthrust.T * Units.lbf * self.max_thrust_factor
+            return maxthrust
+        
+        maxthrust, gradient = self.engine_deck().max_thrust_interp.evaluate(points, derivatives=True)
+        scale = Units.lbf * self.max_thrust_factor
+        return maxthrust.T * scale, gradient[...,0].T * scale / Units.ft, gradient[...,1].T * scale
+
+    def get_tsfc(self, altitude, mach, throttle, derivatives=False):
+        """ Tsfc from the engine deck, optionally with its derivatives with respect to
+            altitude, mach number and throttle.
+        """
         altitude = altitude / Units.ft
         points = np.array([mach, throttle, altitude]).T
-        tsfc = self.tsfc_interp(points)
-        tsfc = tsfc.T / 3600 * self.tsfc_factor
-        return tsfc
+        if not derivatives:
+            tsfc = self.engine_deck().tsfc_interp(points)
+            tsfc = tsfc.T / 3600 * self.tsfc_factor
+            return tsfc
+        
+        tsfc, gradient = self.engine_deck().tsfc_interp.evaluate(points, derivatives=True)
+        scale = self.tsfc_factor / 3600
+        return tsfc.T * scale, gradient[...,2].T * scale / Units.ft, gradient[...,0].T * scale, gradient[...,1].T * scale
 
     def scale_factors(self, design_cruise_altitude, design_cruise_mach, sea_level_static_thrust, throttle_mid_cruise, bucket_sfc=0.533981):
         self.tsfc_factor = 1.
@@ -293,6 +248,175 @@ class Turbofan_Raymer(Network):
             
     __call__ = evaluate_thrust
 
+# ----------------------------------------------------------------------
+#  Engine Decks
+# ----------------------------------------------------------------------
+
+# engine decks that have been loaded in this process, keyed by the deck files and their modification times
+_engine_decks = {}
+
+## @ingroup Components-Energy-Networks
+def load_engine_deck(max_thrust_path, tsfc_path):
+    """ Loads an engine deck once per process. The resampled grids are stored in an .npz
+        next to the deck files, so later processes skip the resampling as well.
+    
+        Assumptions:
+        The deck is rebuilt if the deck files change or the .npz cannot be read. The
+        returned interpolators are shared and must not be modified.
+    
+        Source:
+        N/A
+    
+        Inputs:
+        max_thrust_path    [str], csv of altitude, mach and max thrust
+        tsfc_path          [str], csv of altitude, mach, thrust and tsfc
+    
+        Outputs:
+        deck.
+          max_thrust_interp    [Grid_Interpolator]
+          tsfc_interp          [Grid_Interpolator]
+    
+        Properties Used:
+        N/A
+    """
+    
+    mtimes = np.array([os.path.getmtime(max_thrust_path), os.path.getmtime(tsfc_path)])
+    key    = (max_thrust_path, tsfc_path, tuple(mtimes))
+    if key in _engine_decks:
+        return _engine_decks[key]
+    
+    # load the resampled grids or build them from the deck files
+    cache_path = os.path.splitext(max_thrust_path)[0] + '_' + os.path.basename(os.path.splitext(tsfc_path)[0]) + '.npz'
+    grids      = None
+    try:
+        with np.load(cache_path) as cached:
+            if np.array_equal(cached['mtimes'], mtimes):
+                grids = dict(cached)
+    except Exception:
+        # a missing, truncated or corrupt cache is rebuilt
+        grids = None
+    if grids is None:
+        grids = build_engine_deck(max_thrust_path, tsfc_path)
+        save_engine_deck(cache_path, mtimes, grids)
+    
+    deck = Data()
+    deck.max_thrust_interp = Grid_Interpolator(
+        (grids['max_thrust_altitudes'], grids['max_thrust_machs']), grids['max_thrust'], fill_value=70000)
+    deck.tsfc_interp = Grid_Interpolator(
+        (grids['tsfc_machs'], grids['tsfc_throttles'], grids['tsfc_altitudes']), grids['tsfc'], fill_value=0.55)
+    
+    _engine_decks[key] = deck
+    
+    return deck
+
+## @ingroup Components-Energy-Networks
+def save_engine_deck(cache_path, mtimes, grids):
+    """ Stores the resampled grids of an engine deck. The grids are written to a temporary
+        file that replaces the cache at once, so other processes never read a partial file.
+    
+        Assumptions:
+        The cache is not stored if its directory is not writable.
+    
+        Source:
+        N/A
+    
+        Inputs:
+        cache_path         [str]
+        mtimes             [array], modification times of the deck files
+        grids              [dict of arrays]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        N/A
+    """
+    
+    temp_path = None
+    try:
+        handle, temp_path = tempfile.mkstemp(suffix='.npz', dir=os.path.dirname(os.path.abspath(cache_path)))
+        with os.fdopen(handle, 'wb') as temp_file:
+            np.savez(temp_file, mtimes=mtimes, **grids)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+    
+    return
+
+## @ingroup Components-Energy-Networks
+def build_engine_deck(max_thrust_path, tsfc_path):
+    """ Resamples the engine deck files onto regular grids of altitude, mach and throttle.
+    
+        Assumptions:
+        The max thrust is fit quadratically in mach at every altitude. The tsfc is
+        fit linearly in thrust at every altitude and mach, with the mach limited to
+        the range of the deck at that altitude.
+    
+        Source:
+        N/A
+    
+        Inputs:
+        max_thrust_path    [str]
+        tsfc_path          [str]
+    
+        Outputs:
+        grids              [dict of arrays]
+    
+        Properties Used:
+        N/A
+    """
+    
+    max_thrust_data = np.loadtxt(max_thrust_path, delimiter=",", skiprows=1)
+
+    max_thrust_altitude_vector = np.unique(max_thrust_data[:, 0])
+    max_thrust_mach_vector     = np.linspace(0, 0.9, 20)
+
+    max_thrust_over_all_altitudes_and_mach = np.zeros((len(max_thrust_altitude_vector), len(max_thrust_mach_vector)))
+    for i, ALT in enumerate(max_thrust_altitude_vector):
+        max_thrust_alt_fit = max_thrust_data[max_thrust_data[:, 0] == ALT]
+        max_thrust_over_all_altitudes_and_mach[i] = scipy.interpolate.interp1d(
+            max_thrust_alt_fit[:, 1],
+            max_thrust_alt_fit[:, 2],
+            fill_value='extrapolate',
+            kind='quadratic')(max_thrust_mach_vector)
+        
+    max_thrust_interp = scipy.interpolate.RegularGridInterpolator(
+        (max_thrust_altitude_vector, max_thrust_mach_vector), max_thrust_over_all_altitudes_and_mach, bounds_error=False, fill_value=70000)
+
+    tsfc_data = np.loadtxt(tsfc_path, delimiter=",", skiprows=1)
+
+    tsfc_altitude_vector = np.unique(tsfc_data[:, 0])
+    tsfc_mach_vector     = np.unique(tsfc_data[:, 1])
+    tsfc_throttle_vector = np.linspace(0, 1, 20)
+
+    tsfc_total = np.zeros((len(tsfc_mach_vector), len(tsfc_throttle_vector), len(tsfc_altitude_vector)))
+    for i, ALT in enumerate(tsfc_altitude_vector):
+        tsfc_data_alt_fit = tsfc_data[tsfc_data[:, 0] == ALT]
+        for j, MACH in enumerate(tsfc_mach_vector):
+            MACH = min(max(MACH, min(tsfc_data_alt_fit[:, 1])), max(tsfc_data_alt_fit[:, 1]))
+
+            max_thrust                 = max_thrust_interp(np.array([ALT, MACH]))
+            tsfc_thrust_vector         = tsfc_throttle_vector * max_thrust
+            tsfc_data_alt_and_mach_fit = tsfc_data_alt_fit[tsfc_data_alt_fit[:, 1] == MACH]
+
+            tsfc_total[j, :, i] = scipy.interpolate.interp1d(
+                tsfc_data_alt_and_mach_fit[:, 2],
+                tsfc_data_alt_and_mach_fit[:, 3],
+                fill_value='extrapolate',
+                kind='linear')(tsfc_thrust_vector)
+
+    grids = dict(max_thrust_altitudes = max_thrust_altitude_vector,
+                 max_thrust_machs     = max_thrust_mach_vector,
+                 max_thrust           = max_thrust_over_all_altitudes_and_mach,
+                 tsfc_machs           = tsfc_mach_vector,
+                 tsfc_throttles       = tsfc_throttle_vector,
+                 tsfc_altitudes       = tsfc_altitude_vector,
+                 tsfc                 = tsfc_total)
+
+    return grids
+
 if __name__ == '__main__':
     import matplotlib.pyplot as plt
 
@@ -3,20 +3,25 @@
 # 
 # Created:  Feb 2020, M. Clarke
 # Modified: Sep 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------------------------------------------------------------- 
 import SUAVE
-from SUAVE.Core   import Units , Data
+from SUAVE.Core   import Units , Data, Grid_Interpolator
 from .Lithium_Ion import Lithium_Ion 
 from SUAVE.Methods.Power.Battery.Cell_Cycle_Models.LiNiMnCoO2_cell_cycle_model import compute_NMC_cell_state_variables
 from SUAVE.Methods.Power.Battery.compute_net_generated_battery_heat            import compute_net_generated_battery_heat
 
 import numpy as np
 import os
+import hashlib
+import tempfile
 from scipy.integrate    import  cumtrapz
-from scipy.interpolate  import RegularGridInterpolator 
+
+# discharge performance maps that have been loaded in this process, keyed by the raw data file and its modification time
+_discharge_performance_maps = {}
 
 ## @ingroup Components-Energy-Storages-Batteries-Constant_Mass
 class Lithium_Ion_LiNiMnCoO2_18650(Lithium_Ion):
@@ -88,8 +93,7 @@ class Lithium_Ion_LiNiMnCoO2_18650(Lithium_Ion):
         self.cell.radial_thermal_conductivity = 0.4                                                      # [J/kgK]  
         self.cell.axial_thermal_conductivity  = 32.2                                                     # [J/kgK] # estimated  
                                               
-        battery_raw_data                      = load_battery_results()                                                   
-        self.discharge_performance_map        = create_discharge_performance_map(battery_raw_data)  
+        self.discharge_performance_map        = load_discharge_performance_map()  
         
         return  
     
@@ -488,6 +492,96 @@ class Lithium_Ion_LiNiMnCoO2_18650(Lithium_Ion):
       
         return  
 
+def load_discharge_performance_map():
+    """ Loads the discharge and charge response surface of LiNiMnCoO2 battery cells once
+        per process. The processed surfaces are stored in NMC_Discharge_Map.npz next to the
+        raw data, so the raw data only has to be processed when it changes.
+        
+        Source:
+        N/A
+        
+        Assumptions:
+        The map is rebuilt if the content of the raw data changes or the stored map cannot
+        be read. The returned map is shared by every battery and must not be modified.
+        
+        Inputs: 
+        None
+            
+        Outputs: 
+        battery_data
+
+        Properties Used:
+        N/A
+                                
+    """  
+    rel_path  = os.path.dirname(os.path.abspath(__file__)) + os.path.sep
+    raw_path  = rel_path + 'NMC_Raw_Data.res'
+    map_path  = rel_path + 'NMC_Discharge_Map.npz'
+    key       = (raw_path, os.path.getmtime(raw_path))
+    if key in _discharge_performance_maps:
+        return _discharge_performance_maps[key]
+    
+    # load the processed surfaces or build them from the raw data
+    with open(raw_path,'rb') as raw_file:
+        source_hash = hashlib.sha1(raw_file.read()).hexdigest()
+    processed_data = None
+    try:
+        with np.load(map_path) as cached:
+            if str(cached['source_hash']) == source_hash:
+                processed_data             = Data()
+                processed_data.Voltage     = cached['Voltage']
+                processed_data.Temperature = cached['Temperature']
+    except Exception:
+        # a missing, truncated or corrupt map is rebuilt
+        processed_data = None
+    if processed_data is None:
+        processed_data = process_raw_data(load_battery_results())
+        save_discharge_performance_map(map_path, source_hash, processed_data)
+    
+    battery_data = create_response_surface(processed_data)
+    
+    _discharge_performance_maps[key] = battery_data
+    
+    return battery_data
+
+def save_discharge_performance_map(map_path, source_hash, processed_data):
+    """ Stores the processed surfaces of the discharge performance map. They are written
+        to a temporary file that replaces the map at once, so other processes never read
+        a partial file.
+        
+        Source:
+        N/A
+        
+        Assumptions:
+        The map is not stored if its directory is not writable.
+        
+        Inputs: 
+        map_path        [str]
+        source_hash     [str], hash of the raw data
+        processed_data  
+          Voltage       [array]
+          Temperature   [array]
+            
+        Outputs: 
+        None
+
+        Properties Used:
+        N/A
+                                
+    """  
+    temp_path = None
+    try:
+        handle, temp_path = tempfile.mkstemp(suffix='.npz', dir=os.path.dirname(map_path))
+        with os.fdopen(handle,'wb') as temp_file:
+            np.savez(temp_file, source_hash=source_hash, Voltage=processed_data.Voltage, Temperature=processed_data.Temperature)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, map_path)
+    except OSError:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+    
+    return
+
 def create_discharge_performance_map(battery_raw_data):
     """ Creates discharge and charge response surface for 
         LiNiMnCoO2 battery cells 
@@ -522,8 +616,8 @@ def create_response_surface(processed_data):
     amps                    = np.linspace(0, 8, 5)
     temp                    = np.linspace(0, 50, 6) +  272.65
     SOC                     = np.linspace(0, 1, 15)
-    battery_map.Voltage     = RegularGridInterpolator((amps, temp, SOC), processed_data.Voltage,bounds_error=False,fill_value=None)
-    battery_map.Temperature = RegularGridInterpolator((amps, temp, SOC), processed_data.Temperature,bounds_error=False,fill_value=None) 
+    battery_map.Voltage     = Grid_Interpolator((amps, temp, SOC), processed_data.Voltage,fill_value=None)
+    battery_map.Temperature = Grid_Interpolator((amps, temp, SOC), processed_data.Temperature,fill_value=None) 
      
     return battery_map 
 
@@ -5,6 +5,8 @@
 
 
 from .Battery import Battery
-from . import Constant_Mass
-from . import Variable_Mass
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Constant_Mass',
+                                             'Variable_Mass'])
 
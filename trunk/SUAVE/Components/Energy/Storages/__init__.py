@@ -2,7 +2,9 @@
 #Energy components that store energy (such as batteries)
 # @ingroup Components-Energy
 
-from . import Batteries
-from . import Fuel_Tanks
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Batteries',
+                                             'Fuel_Tanks'])
 
 
@@ -6,14 +6,15 @@
 # classes
 from .Energy_Component import Energy_Component
 
-# packages
-from . import Storages
-from . import Converters
-from . import Distributors
-from . import Networks
-from . import Peripherals
-from . import Processes
-from . import Charging 
-from . import Cooling
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Storages',
+                                             'Converters',
+                                             'Distributors',
+                                             'Networks',
+                                             'Peripherals',
+                                             'Processes',
+                                             'Charging',
+                                             'Cooling'])
 
 
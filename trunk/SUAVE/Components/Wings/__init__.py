@@ -17,5 +17,6 @@ from .All_Moving_Surface        import All_Moving_Surface
 from .Stabilator                import Stabilator
 from .Vertical_Tail_All_Moving  import Vertical_Tail_All_Moving
 
-# packages
-from . import Control_Surfaces
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Control_Surfaces'])
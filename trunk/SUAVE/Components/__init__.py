@@ -11,13 +11,14 @@ from .Physical_Component import Physical_Component
 from .Lofted_Body import Lofted_Body
 from .Envelope import Envelope
 
-# packages
-from . import Wings
-from . import Fuselages
-from . import Payloads
-from . import Energy
-from . import Systems
-from . import Nacelles
-from . import Configs
-from . import Landing_Gear
-from . import Costs
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Wings',
+                                             'Fuselages',
+                                             'Payloads',
+                                             'Energy',
+                                             'Systems',
+                                             'Nacelles',
+                                             'Configs',
+                                             'Landing_Gear',
+                                             'Costs'])
\ No newline at end of file
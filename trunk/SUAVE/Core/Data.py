@@ -6,6 +6,7 @@
 #           May 2020, E. Botero
 #           Jul 2021, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 
@@ -15,6 +16,7 @@
 
 import numpy as np
 from .Arrays import atleast_2d_col, array_type, matrix_type, append_array
+from .Pack_Plan import Pack_Plan
 
 from copy import copy
 
@@ -28,6 +30,10 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 dictgetitem = dict.__getitem__
 objgetattrib = object.__getattribute__
 
+# the attribute names and base classes of every Data class, built on first use
+_class_attributes = {}
+_class_bases      = {}
+
 # ----------------------------------------------------------------------
 #   Data
 # ----------------------------------------------------------------------        
@@ -49,7 +55,7 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks up k as a key, and if it is not a key treats it as an object attribute
     
             Source:
             N/A
@@ -65,14 +71,16 @@ class Data(dict):
             """         
         try:
             return dictgetitem(self,k)
-        except:
+        except KeyError:
             return objgetattrib(self,k)
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object attribute if the class or the instance has it,
+            otherwise it treats it as a key. Attributes added to a class after its first
+            instance set an attribute are treated as keys.
     
             Source:
             N/A
@@ -87,18 +95,17 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
-            self[k] = v
-        else:          
+        if is_object_attribute(self, k):
             object.__setattr__(self, k, v) 
+        else:          
+            self[k] = v
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object attribute if the class or the instance has it,
+            otherwise it treats it as a key.
     
             Source:
             N/A
@@ -112,12 +119,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
-        else:
+        if is_object_attribute(self, k):
             object.__delattr__(self, k)
+        else:
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -163,11 +168,14 @@ class Data(dict):
         self = super(Data,cls).__new__(cls)
         super(Data,self).__init__() 
         
-        # get base class list
-        klasses = self.get_bases()
+        # get base class list, trunk to leaf
+        klasses = _class_bases.get(cls)
+        if klasses is None:
+            klasses = self.get_bases()[::-1]
+            _class_bases[cls] = klasses
                 
         # fill in defaults trunk to leaf
-        for klass in klasses[::-1]:
+        for klass in klasses:
             try:
                 klass.__defaults__(self)
             except:
@@ -329,6 +337,8 @@ class Data(dict):
         """           
 
         # handle input data (ala class factory)
+        if not args and not kwarg:
+            return
         input_data = Data.__base__(*args,**kwarg)
         
         # update this data with inputs
@@ -638,6 +648,14 @@ class Data(dict):
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # pack vectors with the plan of the last call if the tree still matches it
+        if vector:
+            M = self.pack_plan().pack(self)
+            if M is None:
+                M = self.pack_plan(rebuild=True).pack(self)
+            if M is not None:
+                return M
+        
         # list to pre-dump array elements
         M = []
         
@@ -724,6 +742,11 @@ class Data(dict):
         # check input type
         vector = M.ndim  == 1
         
+        # unpack vectors with the plan of the last call if the tree still matches it
+        if vector:
+            if self.pack_plan().unpack(self,M) or self.pack_plan(rebuild=True).unpack(self,M):
+                return self
+        
         # valid types for output
         valid_types = ( int, float,
                         array_type,
@@ -796,6 +819,35 @@ class Data(dict):
         # done!
         return self     
     
+    def pack_plan(self,rebuild=False):
+        """ Returns the layout of the data in the vector of pack_array, which is kept with the
+            data between calls
+    
+            Assumptions:
+            The plan is checked against the data every time it is used, and is rebuilt by
+            the caller when the structure of the data changed
+    
+            Source:
+            N/A
+    
+            Inputs:
+            rebuild - build a new plan from the current data
+            
+            Outputs:
+            plan    - Pack_Plan
+    
+            Properties Used:
+            N/A    
+        """
+        
+        attributes = objgetattrib(self,'__dict__')
+        plan       = attributes.get('_pack_plan')
+        if plan is None or rebuild:
+            plan = Pack_Plan(self)
+            attributes['_pack_plan'] = plan
+        
+        return plan
+    
     def do_recursive(self,method,other=None,default=None):
         """ Recursively applies a method of the class.
     
@@ -851,4 +903,34 @@ class Data(dict):
         # do the update!
         do_operation(self,other,result)    
     
-        return result
\ No newline at end of file
+        return result
+
+
+## @ingroup Core
+def is_object_attribute(data,k):
+    """ Checks if k is an attribute of the class or of the instance of a Data, rather than
+        a key. The attribute names of every class are collected once.
+
+        Assumptions:
+        Attributes that are added to a class after the first check are not found
+
+        Source:
+        N/A
+
+        Inputs:
+        data     [Data]
+        k        [str]
+
+        Outputs:
+        True if k is an object attribute
+
+        Properties Used:
+        N/A
+    """
+    klass      = type(data)
+    attributes = _class_attributes.get(klass)
+    if attributes is None:
+        attributes = frozenset(dir(klass))
+        _class_attributes[klass] = attributes
+
+    return k in attributes or k in objgetattrib(data,'__dict__')
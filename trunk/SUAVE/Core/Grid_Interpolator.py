@@ -0,0 +1,318 @@
+## @ingroup Core
+# Grid_Interpolator.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import itertools
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Grid Interpolator
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Grid_Interpolator(object):
+    """ Multilinear interpolation on a rectilinear grid, a drop in for the linear method
+        of scipy.interpolate.RegularGridInterpolator that also returns derivatives.
+
+        Assumptions:
+        The grid coordinates are strictly increasing. Points outside of the grid get the
+        fill value, or are extrapolated from the edge cells if the fill value is None.
+        Points with a NaN coordinate, or an infinite one if the fill value is None, are NaN.
+        The values may have trailing dimensions beyond the grid, which are interpolated
+        with the same weights. The grid and values are read-only, so copies of an
+        interpolator share them.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,points,values,fill_value=np.nan):
+        """ Sets up the grid
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            points       [tuple of 1D arrays], grid coordinates in each dimension
+            values       [array], of shape (n_1,...,n_d,...)
+            fill_value   [float or None]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        self.grid       = tuple([np.array(p,dtype=float) for p in points])
+        self.values     = np.array(values)
+        self.fill_value = fill_value
+        self.ndim       = len(self.grid)
+
+        for p,n in zip(self.grid,self.values.shape):
+            if p.ndim != 1 or len(p) != n:
+                raise ValueError('Grid coordinates do not match the shape of the values.')
+            if len(p) < 2 or np.any(np.diff(p) <= 0):
+                raise ValueError('Grid coordinates must be strictly increasing with at least two points.')
+
+        # grid bounds, the index of every grid point and the corners of a cell in the flattened values
+        shape              = self.values.shape[:self.ndim]
+        self.lower         = np.array([[p[0]]  for p in self.grid])
+        self.upper         = np.array([[p[-1]] for p in self.grid])
+        self.first_spacing = np.array([[p[1]  - p[0]]  for p in self.grid])
+        self.last_spacing  = np.array([[p[-1] - p[-2]] for p in self.grid])
+        self.last_cell     = np.array(shape)[:,None] - 2
+        self.positions     = [np.arange(n,dtype=float) for n in shape]
+        self.uniform       = all([np.allclose(np.diff(p),p[1] - p[0],rtol=1e-12,atol=0.) for p in self.grid])
+        self.strides       = np.cumprod((shape[1:] + (1,))[::-1])[::-1]
+        self.flat_values   = self.values.reshape((-1,) + self.values.shape[self.ndim:])
+        self.offsets       = np.array([[np.dot(corner,self.strides)] for corner in itertools.product((0,1),repeat=self.ndim)])
+
+        for array in self.grid + (self.values,self.flat_values):
+            array.flags.writeable = False
+
+    def __deepcopy__(self,memo):
+        """ Returns the interpolator itself, as it is not modified after it is set up
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            memo         [dict]
+
+            Outputs:
+            self
+
+            Properties Used:
+            N/A
+        """
+
+        return self
+
+    def __call__(self,xi):
+        """ Interpolates the values at the points
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            xi           [array], of shape (...,d)
+
+            Outputs:
+            values       [array], of shape (...) plus the trailing dimensions of the values
+
+            Properties Used:
+            N/A
+        """
+
+        return self.evaluate(xi)
+
+    def cells(self,xi):
+        """ Finds the cell of every point and its position inside the cell, which can be
+            reused for several evaluations at the same points
+
+            Assumptions:
+            Points on an interior grid line are put in the upper cell
+
+            Source:
+            N/A
+
+            Inputs:
+            xi           [array], of shape (...,d)
+
+            Outputs:
+            cells.
+              shape            [tuple], shape of the points
+              indices          [array], lower corner of the cell, (d,n)
+              distances        [array], position in the cell from 0 to 1, (d,n)
+              out_of_bounds    [array of bool], (n,)
+              undefined        [array of bool], points that are NaN, (n,)
+
+            Properties Used:
+            N/A
+        """
+
+        xi = np.asarray(xi,dtype=float)
+        if xi.ndim == 1:
+            xi = xi.reshape(-1,self.ndim)
+        if xi.shape[-1] != self.ndim:
+            raise ValueError('The points have dimension ' + str(xi.shape[-1]) + ' but the grid has dimension ' + str(self.ndim) + '.')
+
+        # the points are handled as (d,n), so that every dimension is contiguous
+        shape = xi.shape[:-1]
+        xi    = np.ascontiguousarray(xi.reshape(-1,self.ndim).T)
+
+        # fractional index of the points in every dimension, which extends linearly past the edges
+        if self.uniform:
+            u = (xi - self.lower)/self.first_spacing
+        else:
+            u = np.empty_like(xi)
+            for k,(p,positions) in enumerate(zip(self.grid,self.positions)):
+                u[k] = np.interp(xi[k],p,positions)
+
+        below         = xi < self.lower
+        above         = xi > self.upper
+        out_of_bounds = np.logical_or.reduce(below | above,axis=0)
+        if not self.uniform and self.fill_value is None and out_of_bounds.any():
+            u = np.where(below,(xi - self.lower)/self.first_spacing,u)
+            u = np.where(above,self.last_cell + 1 + (xi - self.upper)/self.last_spacing,u)
+
+        # points without a value are put in the first cell, as the floor of NaN is not an index
+        if self.fill_value is None:
+            undefined = np.logical_or.reduce(~np.isfinite(xi),axis=0)
+        else:
+            undefined = np.logical_or.reduce(np.isnan(xi),axis=0)
+        if undefined.any():
+            u = np.where(undefined,0.,u)
+
+        # ufuncs rather than np.clip, which has a large overhead for the few points of a mission
+        indices   = np.minimum(np.maximum(np.floor(u),0),self.last_cell).astype(int)
+        distances = u - indices
+
+        return Cells(shape,indices,distances,out_of_bounds,undefined)
+
+    def evaluate(self,xi,derivatives=False,cells=None):
+        """ Interpolates the values and optionally their derivatives with respect to every
+            grid coordinate
+
+            Assumptions:
+            The derivatives are those of the interpolant inside each cell. They are zero
+            where the fill value is used, and NaN at the points that are NaN.
+
+            Source:
+            N/A
+
+            Inputs:
+            xi           [array], of shape (...,d)
+            derivatives  [bool]
+            cells        [Cells], from self.cells(xi), optional
+
+            Outputs:
+            values       [array], of shape (...) plus the trailing dimensions of the values
+            gradient     [array], of shape (...,d) plus the trailing dimensions, if derivatives
+
+            Properties Used:
+            N/A
+        """
+
+        if cells is None:
+            cells = self.cells(xi)
+
+        ndim     = self.ndim
+        trailing = self.values.shape[ndim:]
+        n_pts    = len(cells.out_of_bounds)
+        expand   = (1,)*len(trailing)
+
+        # values at the corners of the cells, (2**d,n,...)
+        base = cells.indices[0]*self.strides[0]
+        for k in range(1,ndim):
+            base = base + cells.indices[k]*self.strides[k]
+        corner_values = self.flat_values[self.offsets + base]
+
+        # linear weights of the lower and upper corner in every dimension, (d,2,n)
+        factors          = np.empty((ndim,2,n_pts))
+        factors[:,0]     = 1. - cells.distances
+        factors[:,1]     = cells.distances
+
+        values = np.add.reduce(self.corner_weights(factors).reshape((-1,n_pts) + expand)*corner_values,axis=0)
+
+        if derivatives:
+            gradient = np.zeros((ndim,n_pts) + trailing)
+            for k in range(ndim):
+                h            = self.grid[k][cells.indices[k] + 1] - self.grid[k][cells.indices[k]]
+                slopes       = factors.copy()
+                slopes[k,0]  = -1./h
+                slopes[k,1]  =  1./h
+                gradient[k]  = np.add.reduce(self.corner_weights(slopes).reshape((-1,n_pts) + expand)*corner_values,axis=0)
+            gradient = np.moveaxis(gradient,0,1)
+
+        if self.fill_value is not None and np.any(cells.out_of_bounds):
+            values[cells.out_of_bounds] = self.fill_value
+            if derivatives:
+                gradient[cells.out_of_bounds] = 0.
+
+        if np.any(cells.undefined):
+            values[cells.undefined] = np.nan
+            if derivatives:
+                gradient[cells.undefined] = np.nan
+
+        values = values.reshape(cells.shape + trailing)
+        if derivatives:
+            return values, gradient.reshape(cells.shape + (ndim,) + trailing)
+
+        return values
+
+    def corner_weights(self,factors):
+        """ Multiplies the weights of every dimension into the weights of the corners
+
+            Assumptions:
+            The corners are ordered as the offsets
+
+            Source:
+            N/A
+
+            Inputs:
+            factors      [array], weights of the lower and upper corner in every dimension, (d,2,n)
+
+            Outputs:
+            weights      [array], (2**d,n)
+
+            Properties Used:
+            N/A
+        """
+
+        n_pts   = factors.shape[2]
+        weights = factors[0]
+        for k in range(1,self.ndim):
+            weights = (weights[:,None,:]*factors[k,None,:,:]).reshape(-1,n_pts)
+
+        return weights
+
+## @ingroup Core
+class Cells(object):
+    """ The cells of a set of points in a Grid_Interpolator
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,shape,indices,distances,out_of_bounds,undefined):
+        """ Stores the cells
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            See Grid_Interpolator.cells
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.shape         = shape
+        self.indices       = indices
+        self.distances     = distances
+        self.out_of_bounds = out_of_bounds
+        self.undefined     = undefined
@@ -0,0 +1,77 @@
+## @ingroup Core
+# Hashing.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import hashlib
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Hash Data
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def hash_data(data,skip=[]):
+    """ Hashes the content of a Data tree, so that equal trees give the same key in
+        any session. Used to key caches on the inputs of an analysis.
+
+        Assumptions:
+        Keys and values are walked in order. Arrays are hashed by dtype, shape and
+        bytes, functions and classes by their qualified name and everything else
+        by its repr. Files that are pointed to by name are not read.
+
+        Source:
+        N/A
+
+        Inputs:
+        data     [Data, dict, list, array or value]
+        skip     [list of str], keys that are left out at any depth
+
+        Outputs:
+        key      [str]
+
+        Properties Used:
+        N/A
+    """
+
+    key = hashlib.sha1()
+    _update_hash(key,data,skip)
+
+    return key.hexdigest()
+
+## @ingroup Core
+def _update_hash(key,value,skip):
+    """ Adds one value of a Data tree to a hash
+    """
+
+    if isinstance(value,dict):
+        key.update(('{' + type(value).__name__).encode())
+        for k,v in value.items():
+            if k in skip: continue
+            key.update(str(k).encode())
+            _update_hash(key,v,skip)
+        key.update(b'}')
+
+    elif isinstance(value,(list,tuple)):
+        key.update(b'[')
+        for v in value:
+            _update_hash(key,v,skip)
+        key.update(b']')
+
+    elif isinstance(value,np.ndarray) and value.dtype != object:
+        key.update((str(value.dtype) + str(value.shape)).encode())
+        key.update(np.ascontiguousarray(value).tobytes())
+
+    elif isinstance(value,np.ndarray):
+        key.update(str(value.shape).encode())
+        _update_hash(key,value.tolist(),skip)
+
+    elif callable(value) and hasattr(value,'__qualname__'):
+        key.update((getattr(value,'__module__','') + '.' + value.__qualname__).encode())
+
+    else:
+        key.update(repr(value).encode())
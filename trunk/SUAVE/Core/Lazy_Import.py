@@ -0,0 +1,52 @@
+## @ingroup Core
+# Lazy_Import.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+from importlib import import_module
+
+# ----------------------------------------------------------------------
+#   Lazy Import
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def lazy_import(package,submodules):
+    """ Makes the submodules of a package load on their first use, with the module
+        __getattr__ and __dir__ of PEP 562.
+
+        Assumptions:
+        A submodule is imported the first time it is an attribute of the package, and is
+        an ordinary attribute from then on. Importing a submodule directly, as in
+        from SUAVE.Methods.Aerodynamics import AVL, works as before.
+
+        Source:
+        PEP 562 -- Module __getattr__ and __dir__
+
+        Inputs:
+        package     [str], __name__ of the package
+        submodules  [list of str]
+
+        Outputs:
+        __getattr__ [function]
+        __dir__     [function]
+
+        Properties Used:
+        N/A
+    """
+
+    submodules = frozenset(submodules)
+
+    def __getattr__(name):
+        if name in submodules:
+            return import_module(package + '.' + name)
+        raise AttributeError('module {!r} has no attribute {!r}'.format(package,name))
+
+    def __dir__():
+        return sorted(submodules.union(vars(sys.modules[package])))
+
+    return __getattr__, __dir__
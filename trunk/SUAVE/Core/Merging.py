@@ -0,0 +1,325 @@
+## @ingroup Core
+# Merging.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import copy, deepcopy
+
+from .Arrays import array_type
+from .Data   import Data
+
+# ----------------------------------------------------------------------
+#   Merge Data
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def merge_data(datas,views=False):
+    """ Merges a sequence of Data trees as the first tree updated with Data.append_or_update
+        by each of the others, while every merged array is allocated once.
+
+        Assumptions:
+        The arrays of every leaf are collected over all trees and stacked at the end, so
+        merging N trees costs one copy of every array rather than N. Values that are not
+        arrays follow append_or_update. With views, the leaves of the trees are replaced by
+        views of their rows in the merged arrays, so that the trees and the merged tree
+        share one buffer per leaf.
+
+        Source:
+        N/A
+
+        Inputs:
+        datas    [list of Data]
+        views    [bool]
+
+        Outputs:
+        merged   [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    datas = list(datas)
+    first = datas[0]
+
+    # copy the first tree without its arrays, which are stacked at the end
+    memo = {}
+    for node in walk(first):
+        for v in node.values():
+            if isinstance(v,array_type):
+                memo[id(v)] = v
+    merged = deepcopy(first,memo)
+
+    collect_rows(merged,first)
+    for other in datas[1:]:
+        append_rows(merged,other)
+
+    stack_rows(merged,views)
+
+    return merged
+
+## @ingroup Core
+class Rows(object):
+    """ The arrays of one leaf of the merged tree, in the order they are stacked
+
+        Assumptions:
+        Arrays are stacked as np.vstack
+
+        Source:
+        N/A
+    """
+
+    def __init__(self):
+        """ Starts an empty leaf
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        self.arrays  = []
+        self.sources = []
+        self.rows    = []
+
+    def append(self,array,source=None,key=None):
+        """ Adds the rows of an array
+
+            Assumptions:
+            The array has to fit the rows before it, as in np.vstack
+
+            Source:
+            N/A
+
+            Inputs:
+            array    [array]
+            source   [dict], that holds the array, None if it is not replaced by a view
+            key      [str], of the array in the source
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        shape = row_shape(array)
+        if self.arrays and shape[1:] != self.trailing:
+            raise ValueError('all the input array dimensions except for the concatenation axis must match exactly')
+        self.trailing = shape[1:]
+        self.arrays.append(array)
+        self.sources.append((source,key))
+        self.rows.append(shape[0])
+
+    def stack(self,views=False):
+        """ Allocates the merged array and fills it
+
+            Assumptions:
+            A single array is copied and keeps its shape
+
+            Source:
+            N/A
+
+            Inputs:
+            views    [bool], replace the sources by views of the merged array
+
+            Outputs:
+            merged   [array]
+
+            Properties Used:
+            N/A
+        """
+        if len(self.arrays) == 1:
+            merged = np.array(self.arrays[0])
+        else:
+            merged = np.vstack(self.arrays)
+
+        if views:
+            row = 0
+            for array, (source, key), n_rows in zip(self.arrays,self.sources,self.rows):
+                if len(self.arrays) == 1:
+                    view = merged
+                elif array.ndim >= 2:
+                    view = merged[row:row+n_rows]
+                elif array.ndim == 1:
+                    view = merged[row]
+                else:
+                    view = None
+                if source is not None and view is not None and dict.get(source,key) is array:
+                    source[key] = view
+                row += n_rows
+
+        return merged
+
+## @ingroup Core
+def row_shape(array):
+    """ The shape of an array as a block of rows of np.vstack
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        array    [array]
+
+        Outputs:
+        shape    [tuple], of np.atleast_2d(array)
+
+        Properties Used:
+        N/A
+    """
+    if array.ndim >= 2:
+        return array.shape
+    elif array.ndim == 1:
+        return (1,) + array.shape
+    return (1,1)
+
+## @ingroup Core
+def walk(data):
+    """ Yields every dict of a tree once
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        data     [dict]
+
+        Outputs:
+        nodes    [generator of dicts]
+
+        Properties Used:
+        N/A
+    """
+    seen  = set()
+    nodes = [data]
+    while nodes:
+        node = nodes.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        yield node
+        nodes.extend([v for v in node.values() if isinstance(v,dict)])
+
+## @ingroup Core
+def collect_rows(merged,first):
+    """ Replaces the arrays of the copy of the first tree by their rows
+
+        Assumptions:
+        The copy has the keys of the first tree
+
+        Source:
+        N/A
+
+        Inputs:
+        merged   [Data], copy of the first tree
+        first    [Data]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+    for k,v in list(merged.items()):
+        if isinstance(v,array_type):
+            rows = Rows()
+            rows.append(v,first,k)
+            merged[k] = rows
+        elif isinstance(v,dict) and isinstance(dict.get(first,k),dict):
+            collect_rows(v,first[k])
+
+## @ingroup Core
+def append_rows(merged,other):
+    """ Updates the merged tree with another tree, as Data.append_or_update but with the
+        arrays collected as rows
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        merged   [Data]
+        other    [Data]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+    if not isinstance(other,dict):
+        raise TypeError('input is not a dictionary type')
+    for k,v in other.items():
+        # recurse only if self's value is a Dict()
+        if k.startswith('_'):
+            continue
+
+        # Check if v is an array and if k is a key in self
+        if isinstance(v,array_type) and hasattr(merged,k):
+            current = merged[k]
+            if isinstance(current,Rows):
+                current.append(v,other,k)
+            elif isinstance(current,array_type):
+                rows = Rows()
+                rows.append(current)
+                rows.append(v,other,k)
+                merged[k] = rows
+            else:
+                merged[k] = None
+        else:
+            current = dict.get(merged,k)
+            try:
+                if not isinstance(current,Data):
+                    raise AttributeError
+                append_rows(current,v)
+            except:
+                if isinstance(v,array_type):
+                    rows = Rows()
+                    rows.append(v,other,k)
+                    merged[k] = rows
+                else:
+                    merged[k] = copy(v)
+
+## @ingroup Core
+def stack_rows(merged,views=False):
+    """ Replaces the rows of every leaf of the merged tree by the merged array
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        merged   [Data]
+        views    [bool]
+
+        Outputs:
+        None
+
+        Properties Used:
+        N/A
+    """
+    for node in walk(merged):
+        for k,v in list(node.items()):
+            if isinstance(v,Rows):
+                node[k] = v.stack(views)
@@ -0,0 +1,216 @@
+## @ingroup Core
+# Pack_Plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+from .Arrays import array_type, matrix_type
+
+dictget = dict.get
+
+# ----------------------------------------------------------------------
+#   Pack Plan
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Pack_Plan(object):
+    """ The layout of a Data tree in the vector of Data.pack_array, which packs and unpacks
+        the tree without walking it again as long as its structure does not change.
+
+        Assumptions:
+        The plan holds the keys, types, shapes and dtypes of the tree, not the tree itself.
+        Every use checks the tree against the plan, including the order of the keys of every
+        dict, which sets the order of the vector, so a plan that does not match anymore
+        is found, and the caller builds a new one. Trees with matrices or rank 0 arrays
+        have no plan and are packed by walking them.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Walks the tree in the order of Data.pack_array
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            data         [Data]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        # every dict of the tree, as (parent, key, type, keys), and every value
+        # that is not a dict, as (dict, key, type, rank, shape, dtype, start, stop)
+        self.nodes  = []
+        self.leaves = []
+        self.valid  = True
+
+        valid_types = ( int, float,
+                        array_type,
+                        matrix_type )
+        dtypes      = []
+        size        = [0]
+
+        def do_plan(D,parent,key):
+            node = len(self.nodes)
+            self.nodes.append((parent,key,type(D),tuple(D.keys())))
+            for k,v in D.items():
+                if isinstance(v,dict):
+                    do_plan(v,node,k)
+                    continue
+
+                try:
+                    rank = v.ndim
+                except:
+                    rank = 0
+
+                if isinstance(v,matrix_type) or (isinstance(v,array_type) and rank == 0):
+                    self.valid = False
+                    return
+
+                shape = None
+                dtype = None
+                start = size[0]
+                if not isinstance(v,valid_types) or rank > 2:
+                    rank  = -1
+                elif isinstance(v,array_type):
+                    shape = v.shape
+                    dtype = v.dtype
+                    dtypes.append(dtype)
+                    size[0] += v.size
+                else:
+                    dtypes.append(np.array([v]).dtype)
+                    size[0] += 1
+
+                self.leaves.append((node,k,type(v),rank,shape,dtype,start,size[0]))
+
+        do_plan(data,-1,None)
+
+        self.size  = size[0]
+        self.dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+
+    def resolve(self,data):
+        """ Finds the dicts of the tree at the keys of the plan
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            data         [Data]
+
+            Outputs:
+            nodes        [list of dicts], None if the dicts do not match the plan
+
+            Properties Used:
+            N/A
+        """
+
+        nodes = []
+        for parent, key, klass, keys in self.nodes:
+            D = data if parent < 0 else dictget(nodes[parent],key)
+            if type(D) is not klass or tuple(D.keys()) != keys:
+                return None
+            nodes.append(D)
+
+        return nodes
+
+    def pack(self,data):
+        """ Packs the tree into a vector
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            data         [Data]
+
+            Outputs:
+            vector       [array], None if the tree does not match the plan
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid:
+            return None
+        nodes = self.resolve(data)
+        if nodes is None:
+            return None
+
+        vector = np.empty(self.size,dtype=self.dtype)
+        for node, key, klass, rank, shape, dtype, start, stop in self.leaves:
+            v = dictget(nodes[node],key)
+            if type(v) is not klass:
+                return None
+            if rank == 0:
+                vector[start] = v
+            elif rank > 0:
+                if v.shape != shape or v.dtype != dtype:
+                    return None
+                vector[start:stop] = v.ravel(order='F')
+
+        return vector
+
+    def unpack(self,data,M):
+        """ Unpacks a vector into the tree, as Data.unpack_array
+
+            Assumptions:
+            Arrays are updated in place, scalars are replaced
+
+            Source:
+            N/A
+
+            Inputs:
+            data         [Data]
+            M            [array], 1D
+
+            Outputs:
+            True if the tree matched the plan and was updated
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid:
+            return False
+        nodes = self.resolve(data)
+        if nodes is None:
+            return False
+
+        # check the whole tree before it is changed
+        values = []
+        for node, key, klass, rank, shape, dtype, start, stop in self.leaves:
+            v = dictget(nodes[node],key)
+            if type(v) is not klass or (rank > 0 and (v.shape != shape or v.dtype != dtype)):
+                return False
+            values.append(v)
+
+        for v, (node, key, klass, rank, shape, dtype, start, stop) in zip(values,self.leaves):
+            if rank == 0:
+                nodes[node][key] = M[start]
+            elif rank == 1:
+                v[:] = M[start:stop]
+            elif rank == 2:
+                v[:,:] = M[start:stop].reshape(shape[::-1]).T
+
+        if not M.shape[-1] == self.size: warn('did not unpack all values',RuntimeWarning)
+
+        return True
@@ -0,0 +1,258 @@
+## @ingroup Core
+# Parallel.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import multiprocessing
+
+# the function being mapped, inherited by the forked workers
+_function  = None
+_in_worker = False
+
+# ----------------------------------------------------------------------
+#   Parallel Map
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def parallel_map(function,items,number_of_processes=None):
+    """ Applies a function to every item on a pool of forked processes and returns
+        the results in the order of the items.
+
+        Assumptions:
+        The workers are forked, so the function can be a closure over vehicles,
+        analyses or missions without pickling them. Only the items and the
+        results are sent between processes and must be picklable.
+        Falls back to a serial map if only one process is requested, if fork is
+        not available on this platform, or if called from inside a worker.
+
+        Source:
+        N/A
+
+        Inputs:
+        function            [callable]
+        items               [iterable]
+        number_of_processes [int], defaults to the number of cpus
+
+        Outputs:
+        results             [list]
+
+        Properties Used:
+        N/A
+    """
+
+    global _function
+
+    items = list(items)
+
+    number_of_processes = number_of_workers(number_of_processes,len(items))
+
+    if number_of_processes <= 1:
+        return [function(item) for item in items]
+
+    _function = function
+    try:
+        context = multiprocessing.get_context('fork')
+        with context.Pool(number_of_processes,initializer=_initialize_worker) as pool:
+            results = pool.map(_call_function,items,chunksize=1)
+    finally:
+        _function = None
+
+    return results
+
+## @ingroup Core
+def parallel_imap(function,items,number_of_processes=None):
+    """ Applies a function to every item on a pool of forked processes and yields
+        the results in the order of the items as soon as they are available, so
+        that they can be reduced without holding all of them.
+
+        Assumptions:
+        As parallel_map. The results are consumed before another parallel map is
+        started.
+
+        Source:
+        N/A
+
+        Inputs:
+        function            [callable]
+        items               [iterable]
+        number_of_processes [int], defaults to the number of cpus
+
+        Outputs:
+        results             [generator]
+
+        Properties Used:
+        N/A
+    """
+
+    global _function
+
+    items = list(items)
+
+    number_of_processes = number_of_workers(number_of_processes,len(items))
+
+    if number_of_processes <= 1:
+        for item in items:
+            yield function(item)
+        return
+
+    _function = function
+    try:
+        context = multiprocessing.get_context('fork')
+        with context.Pool(number_of_processes,initializer=_initialize_worker) as pool:
+            for result in pool.imap(_call_function,items,chunksize=1):
+                yield result
+    finally:
+        _function = None
+
+## @ingroup Core
+def number_of_workers(number_of_processes=None,number_of_items=None):
+    """ Finds how many processes parallel_map will actually use
+
+        Assumptions:
+        Runs serially inside a worker or without fork
+
+        Source:
+        N/A
+
+        Inputs:
+        number_of_processes [int], defaults to the number of cpus
+        number_of_items     [int]
+
+        Outputs:
+        number_of_processes [int]
+
+        Properties Used:
+        N/A
+    """
+
+    if _in_worker or not 'fork' in multiprocessing.get_all_start_methods():
+        return 1
+
+    if number_of_processes is None:
+        number_of_processes = multiprocessing.cpu_count()
+    if number_of_items is not None:
+        number_of_processes = min(number_of_processes,number_of_items)
+
+    return max(number_of_processes,1)
+
+## @ingroup Core
+def _initialize_worker():
+    """ Marks a forked process as a worker so nested maps run serially
+    """
+    global _in_worker
+    _in_worker = True
+
+## @ingroup Core
+def _call_function(item):
+    """ Calls the inherited function on one item inside a worker
+    """
+    return _function(item)
+
+## @ingroup Core
+class Process_Pool(object):
+    """ A pool of forked processes that applies the same function to many lists of
+        items, so that an iterative method forks its workers once for the whole run.
+
+        Assumptions:
+        The workers are forked when the pool is opened and inherit the state of
+        this process at that time, later changes are not seen by them. Runs
+        serially for one process, without fork or inside a worker, as parallel_map.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,function,number_of_processes=None):
+        """ Forks the workers
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            function            [callable]
+            number_of_processes [int], defaults to the number of cpus
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        global _function
+
+        self.function            = function
+        self.number_of_processes = number_of_workers(number_of_processes)
+        self.pool                = None
+
+        if self.number_of_processes > 1:
+            _function = function
+            try:
+                context   = multiprocessing.get_context('fork')
+                self.pool = context.Pool(self.number_of_processes,initializer=_initialize_worker)
+            finally:
+                _function = None
+
+    def map(self,items):
+        """ Applies the function to every item and returns the results in the order
+            of the items
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            items               [iterable]
+
+            Outputs:
+            results             [list]
+
+            Properties Used:
+            N/A
+        """
+
+        items = list(items)
+
+        if self.pool is None:
+            return [self.function(item) for item in items]
+
+        return self.pool.map(_call_function,items,chunksize=1)
+
+    def close(self):
+        """ Stops the workers
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
@@ -9,4 +9,9 @@ from .Diffed_Data      import Diffed_Data, diff
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
 from .Utilities        import *
-from .Units            import Units
\ No newline at end of file
+from .Units            import Units
+from .Parallel         import parallel_map, parallel_imap, number_of_workers, Process_Pool
+from .Hashing          import hash_data
+from .Merging          import merge_data
+from .Grid_Interpolator import Grid_Interpolator
+from .Lazy_Import      import lazy_import
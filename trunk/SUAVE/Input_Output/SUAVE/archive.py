@@ -3,6 +3,7 @@
 #
 # Created:  Jan 2015, T. Lukaczyk
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -105,7 +106,7 @@ def build_dict_r(v):
     tv = type(v) # Get value type
     
     # Transform to basic python data type as appropriate
-    if (tv == np.ndarray) or (tv == np.float64):
+    if (tv == np.ndarray) or (tv == np.memmap) or (tv == np.float64):
         ret = v.tolist()
     elif (tv == str) or (tv == bool):
         ret = v
@@ -0,0 +1,174 @@
+## @ingroup Input_Output-SUAVE
+# archive_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import types
+import json
+import os
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+## @ingroup Input_Output-SUAVE
+def archive_binary(data,filename,append=False):
+    """Stores a SUAVE data structure in a binary archive, a directory with an index of the
+    structure in JSON and a file of the raw arrays for every entry.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists, as for archive.
+    Functions are ignored and all other data raises an error. Arrays of objects or of
+    records are stored as lists in the index. An archive holds a list of entries, so that
+    the results of a sweep can be appended one at a time.
+
+    Source:
+    N/A
+
+    Inputs:
+    data       SUAVE data structure
+    filename   <string> - directory of the archive
+    append     <boolean> - add the data as a new entry instead of replacing the archive
+
+    Outputs:
+    filename   Archive as specified
+
+    Properties Used:
+    N/A
+    """
+
+    index_file = os.path.join(filename,'index.json')
+
+    # the entries of the existing archive, which stay readable until the new index is in place
+    if os.path.exists(index_file):
+        with open(index_file) as f:
+            old_index = json.load(f)
+    else:
+        os.makedirs(filename,exist_ok=True)
+        old_index = {'entries':[]}
+
+    # start a new archive, or add to the entries of the existing one
+    if append and old_index['entries']:
+        index = old_index
+    else:
+        index = {'format':'SUAVE binary archive','version':1,'entries':[]}
+
+    # the new entry never reuses the file of an entry of the existing archive
+    numbers = [int(os.path.splitext(entry['file'])[0]) for entry in old_index['entries']]
+    name    = entry_file(max(numbers) + 1 if numbers else 0)
+
+    # write the arrays of the entry one after the other, aligned for memory mapping
+    with open(os.path.join(filename,name),'wb') as f:
+        def save(array):
+            offset = f.tell()
+            offset += -offset % alignment
+            f.seek(offset)
+            f.write(np.ascontiguousarray(array).tobytes())
+            return offset
+        entry = build_index_r(data,save)
+        entry['file'] = name
+
+    index['entries'].append(entry)
+
+    # replace the index once the arrays are written
+    with open(index_file + '.tmp','w') as f:
+        json.dump(index,f)
+    os.replace(index_file + '.tmp',index_file)
+
+    # then remove the files of the replaced entries
+    if index is not old_index:
+        for entry in old_index['entries']:
+            if os.path.exists(os.path.join(filename,entry['file'])):
+                os.remove(os.path.join(filename,entry['file']))
+
+    return
+
+## @ingroup Input_Output-SUAVE
+def entry_file(entry):
+    """The file of the arrays of an entry of a binary archive.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    entry      <int> - number of the file, one past the last file of the archive
+
+    Outputs:
+    name       <string> - relative to the archive
+
+    Properties Used:
+    N/A
+    """
+    return '%05d.bin' % entry
+
+# bytes between the starts of arrays in the file of an entry
+alignment = 64
+
+## @ingroup Input_Output-SUAVE
+def build_index_r(v,save):
+    """Builds the index of a SUAVE data structure and saves its arrays. This the recursive step.
+
+    Assumptions:
+    Data must be numpy arrays, strings, booleans, floats, ints, or lists.
+    Functions are ignored and all other data raises an error.
+
+    Source:
+    N/A
+
+    Inputs:
+    v       value in a data structure
+    save    function that writes an array and returns its offset in the file
+
+    Outputs:
+    ret     index of v, one of
+              {'data':  {key: index}}
+              {'array': offset, 'dtype': string, 'shape': list}
+              {'list':  list}
+              {'value': string, boolean, float, int or None}
+
+    Properties Used:
+    N/A
+    """
+    tv = type(v) # Get value type
+
+    # Transform to basic python data type as appropriate
+    if isinstance(v,np.ndarray):
+        if v.dtype.hasobject or v.dtype.names is not None:
+            ret = {'list':v.tolist()}
+        else:
+            ret = {'array':save(v),'dtype':v.dtype.str,'shape':list(v.shape)}
+    elif tv == np.float64:
+        ret = {'value':float(v)}
+    elif (tv == str) or (tv == bool):
+        ret = {'value':v}
+    elif tv == type(None):
+        ret = {'value':None}
+    elif (tv == float) or (tv == int):
+        ret = {'value':v}
+    elif tv == types.FunctionType: # Functions cannot be stored
+        ret = {'value':None}
+    elif tv == list:
+        ret = {'list':v}
+
+    else:
+        # Assume other data types are SUAVE data types and check
+        try:
+            keys = v.keys()
+        except:
+            if callable(tv):
+                return {'value':None}
+            else:
+                raise TypeError('Unexpected data type in SUAVE data structure')
+        # Recursively assign values
+        ret = {'data':{}}
+        for k in keys:
+            ret['data'][k] = build_index_r(v[k],save)
+
+    return ret
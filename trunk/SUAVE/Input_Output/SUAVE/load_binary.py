@@ -0,0 +1,175 @@
+## @ingroup Input_Output-SUAVE
+# load_binary.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import json
+import os
+from fnmatch import fnmatchcase
+from SUAVE.Core import Data, DataOrdered
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def load_binary(filename,keys=None,index=0,mmap_mode='r'):
+    """Converts a binary archive into a SUAVE data structure, as load does for JSON files.
+
+    Assumptions:
+    The archive was written by archive_binary. Arrays are memory-mapped views of the
+    file of the entry, so only the parts that are used are read from disk. Key patterns are dotted paths whose parts
+    may hold wildcards, such as 'segments.*.conditions.weights', and everything below a
+    matching path is loaded.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename   <string> - directory of the archive
+    keys       <string> or list of <string> - key patterns to load, None for all
+    index      <int> - entry of the archive, None for a list of all entries
+    mmap_mode  <string> - numpy memory-map mode of the arrays, None to read the file
+
+    Outputs:
+    data       SUAVE data structure, or a list of them
+
+    Properties Used:
+    N/A
+    """
+
+    with open(os.path.join(filename,'index.json')) as f:
+        archive_index = json.load(f)
+    entries = archive_index['entries']
+
+    if isinstance(keys,str):
+        keys = [keys]
+    patterns = None if keys is None else [key.split('.') for key in keys]
+
+    if index is None:
+        return [read_SUAVE_binary_index(entry,filename,patterns,mmap_mode) for entry in entries]
+
+    return read_SUAVE_binary_index(entries[index],filename,patterns,mmap_mode)
+
+## @ingroup Input_Output-SUAVE
+def read_SUAVE_binary_index(entry,filename,patterns=None,mmap_mode='r'):
+    """Builds a SUAVE data structure from an entry of a binary archive. This is initial case.
+
+    Assumptions:
+    The top level is a Data and the levels below are DataOrdered, as in load.
+
+    Source:
+    N/A
+
+    Inputs:
+    entry      index of the entry
+    filename   <string> - directory of the archive
+    patterns   list of key patterns split in parts, None for all
+    mmap_mode  <string>
+
+    Outputs:
+    SUAVE_data  SUAVE data structure
+
+    Properties Used:
+    N/A
+    """
+    SUAVE_data = Data() # initialize SUAVE data structure
+
+    # Map the arrays of the entry
+    path = os.path.join(filename,entry['file'])
+    if mmap_mode is not None and os.path.getsize(path):
+        buffer = np.memmap(path,dtype=np.uint8,mode=mmap_mode)
+    else:
+        buffer = np.fromfile(path,dtype=np.uint8)
+
+    # Assign all values
+    for k, v in entry['data'].items():
+        value = build_binary_data_r(v,buffer,[k],patterns) # recursive function
+        if value is not skipped:
+            SUAVE_data[str(k)] = value
+    return SUAVE_data
+
+# marks a value that is not selected by the key patterns
+skipped = object()
+
+## @ingroup Input_Output-SUAVE
+def build_binary_data_r(v,buffer,path,patterns):
+    """Builds a SUAVE data structure from the index of a binary archive. This is recursive step.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    v          index of a value
+    buffer     bytes of the arrays of the entry
+    path       list of the keys to the value
+    patterns   list of key patterns split in parts, None for all
+
+    Outputs:
+    ret        value converted to needed format, skipped if it is not selected
+
+    Properties Used:
+    N/A
+    """
+
+    # keep everything below a matching path, and only the parts of a tree that can still match
+    if patterns is not None:
+        patterns = [pattern for pattern in patterns if matches(path,pattern)]
+        if any([len(path) >= len(pattern) for pattern in patterns]):
+            patterns = None
+        elif not ('data' in v and patterns):
+            return skipped
+
+    # Transform to SUAVE data structure with appropriate types
+    if 'data' in v:
+        # Recursively assign values
+        ret = DataOrdered()
+        for k, value in v['data'].items():
+            value = build_binary_data_r(value,buffer,path + [k],patterns)
+            if value is not skipped:
+                ret[str(k)] = value
+        if patterns is not None and not ret:
+            return skipped
+    elif 'array' in v:
+        dtype  = np.dtype(v['dtype'])
+        start  = v['array']
+        stop   = start + dtype.itemsize*int(np.prod(v['shape']))
+        ret    = buffer[start:stop].view(dtype).reshape(v['shape'])
+    elif 'list' in v:
+        ret = np.array(v['list'])
+    elif 'value' in v:
+        ret = v['value']
+    else:
+        raise TypeError('Data type not expected in SUAVE binary archive')
+
+    return ret
+
+## @ingroup Input_Output-SUAVE
+def matches(path,pattern):
+    """Checks if a path and a key pattern match as far as both go.
+
+    Assumptions:
+    Every part of the pattern matches one key
+
+    Source:
+    N/A
+
+    Inputs:
+    path       list of keys
+    pattern    list of key patterns
+
+    Outputs:
+    True if the keys match the parts of the pattern
+
+    Properties Used:
+    N/A
+    """
+    return all([fnmatchcase(key,part) for key, part in zip(path,pattern)])
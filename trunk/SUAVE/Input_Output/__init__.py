@@ -1,12 +1,13 @@
 ## @defgroup Input_Output
 # These functions provide SUAVE data storage capabilities and capabilities to work with files for other programs.
 
-from . import SUAVE
-from . import FreeMind
-from . import D3JS
-from . import Results
-
-from . import XML
-from . import SU2
-from . import OpenVSP
-from . import GMSH
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['SUAVE',
+                                             'FreeMind',
+                                             'D3JS',
+                                             'Results',
+                                             'XML',
+                                             'SU2',
+                                             'OpenVSP',
+                                             'GMSH'])
@@ -2,8 +2,10 @@
 # Functions to perform calculations according to AERODAS models.
 # @ingroup Methods-Aerodynamics
 
-from . import AERODAS_setup
-from . import finite_aspect_ratio
-from . import post_stall_coefficients
-from . import pre_stall_coefficients
-from . import section_properties
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['AERODAS_setup',
+                                             'finite_aspect_ratio',
+                                             'post_stall_coefficients',
+                                             'pre_stall_coefficients',
+                                             'section_properties'])
\ No newline at end of file
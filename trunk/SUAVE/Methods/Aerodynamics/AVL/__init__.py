@@ -16,4 +16,6 @@ from .write_input_deck         import write_input_deck
 from .write_run_cases          import write_run_cases
 from .write_avl_airfoil_file   import write_avl_airfoil_file
 
-from . import Data
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Data'])
@@ -7,5 +7,6 @@ from .heads_method                      import heads_method
 from .hess_smith                        import hess_smith               
 from .infl_coeff                        import infl_coeff       
 from .panel_geometry                    import panel_geometry   
+from .pack_surface                      import pack_surface, unpack_surface, interpolate_surface
 from .thwaites_method                   import thwaites_method    
 from .velocity_distribution             import velocity_distribution 
\ No newline at end of file
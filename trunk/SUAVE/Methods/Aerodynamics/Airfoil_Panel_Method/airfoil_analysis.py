@@ -3,6 +3,7 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,12 +11,12 @@
 import SUAVE
 from SUAVE.Core import  Data
 import numpy as np
-from scipy.interpolate import interp1d 
 
 from .hess_smith      import hess_smith
 from .thwaites_method import thwaites_method
 from .heads_method    import heads_method
 from .aero_coeff      import aero_coeff 
+from .pack_surface    import pack_surface
 
 # ----------------------------------------------------------------------
 # airfoil_analysis.py
@@ -514,12 +515,11 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Properties Used:
     N/A  
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))  
-    
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
-    return FUNC
-    
\ No newline at end of file
+    # the points of the bottom surface, from the trailing edge, followed by those of the top surface
+    _, count_bot, (bot_func,) = pack_surface(np.ma.getmaskarray(X_BOT),[FUNC_BOT_SURF])
+    _, _,         (top_func,) = pack_surface(np.ma.getmaskarray(X_TOP),[FUNC_TOP_SURF])
+    rows = np.arange(npanel)[:,None]
+    FUNC = np.where(rows < count_bot,
+                    np.take_along_axis(bot_func,np.clip(count_bot - 1 - rows,0,npanel-1),axis=0),
+                    np.take_along_axis(top_func,np.clip(rows - count_bot,0,npanel-1),axis=0))
+    return np.reshape(FUNC,(npanel,ncases,ncpts))
@@ -3,14 +3,17 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint  
+from scipy.integrate import odeint
+
+from .pack_surface    import pack_surface, unpack_surface, interpolate_surface, interpolate_column
+from .thwaites_method import replace_nonconverged
 # ----------------------------------------------------------------------
 # heads_method.py 
 # ----------------------------------------------------------------------   
@@ -56,103 +59,76 @@ def heads_method(npanel,ncases,ncpts,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,
     N/A
     """   
      
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)       
- 
-          
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                theta_0      = THETA_0[case,cpt] 
-                Re_L         = RE_L[case,cpt] 
-                nu           = l/Re_L    
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]  
-                del_0        = DEL_0[case,cpt]
-                del_star_0   = DELTA_STAR_0[case,cpt]
-                H_0          = del_star_0 / theta_0
-                H1_0         = getH1(np.atleast_1d(H_0))[0]
-                if np.isnan(H1_0):
-                    H1_0     = (del_0 - del_star_0) / theta_0 
-                y0           = [theta_0, getVe(0,x_i,Ve_i)*theta_0*H1_0]     
-                y            = odeint(odefcn,y0,x_i,args=(Re_L/l, x_i, Ve_i, dVe_i))  
-                
-                # Compute momentum thickness, theta 
-                theta            = y[:,0]  
-                ind              = np.where(~np.isnan(theta))[0]
-                first, last      = ind[0], ind[-1]
-                theta[:first]    = theta[first]
-                dtheta_dx        = (theta[last]-theta[last-1])/(x_i[last]-x_i[last-1])
-                theta[last + 1:] = theta[last] + dtheta_dx*(x_i[last + 1:]-x_i[last])
-                
-                Ve_theta_H1            = y[:,1]  
-                ind                    = np.where(~np.isnan(Ve_theta_H1))[0]
-                first, last            = ind[0], ind[-1]
-                Ve_theta_H1[:first]    = Ve_theta_H1[first]
-                dVe_theta_H1_dx        = (Ve_theta_H1[last]-Ve_theta_H1[last-1])/(x_i[last]-x_i[last-1])
-                Ve_theta_H1[last + 1:] = Ve_theta_H1[last] + dVe_theta_H1_dx*(x_i[last + 1:]-x_i[last])
-                
-                # find theta values that do not converge and replace them with neighbor
-                idx1         = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol )[0]
-                if len(idx1)> 1: 
-                    np.put(theta,idx1 + 1, theta[idx1])    
-                idx1         = np.where(abs((Ve_theta_H1[1:] - Ve_theta_H1[:-1])/Ve_theta_H1[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(Ve_theta_H1,idx1 + 1, Ve_theta_H1[idx1])    
-                  
-                # Compute mass flow shape factor, H1
-                H1           = Ve_theta_H1/(theta*Ve_i)
-                
-                # Compute H 
-                H            = getH(np.atleast_1d(H1)) 
-                H[H<0]       = 1E-6    # H cannot be negative 
-                # find H values that do not converge and replace them with neighbor
-                idx1               = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(H,idx1 + 1, H[idx1])     
-                
-                # Compute Reynolds numbers based on momentum thickness  
-                Re_theta     = Re_L/l * Ve_i*theta 
-                
-                # Compute Reynolds numbers based on distance along airfoil
-                Re_x         = Ve_i* x_i / nu
-                
-                # Compute skin friction 
-                cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))) 
-                
-                # Compute displacement thickness
-                del_star     = H*theta   
-                
-                # Compute boundary layer thickness 
-                delta        = theta*H1 + del_star 
-                
-                # Reynolds number at x=0 cannot be negative (give nans)
-                Re_x[0]      = 1E-5                
-    
-                # Find where matrices are not masked 
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                
-                # Store results 
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,del_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices ,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta) 
+    shape        = (npanel,ncases,ncpts)
+    l            = np.reshape(TURBULENT_SURF,-1)
+    Re_L         = np.reshape(RE_L,-1)
+
+    # gather the turbulent points of every case and control point in a column, and keep the
+    # columns with a turbulent surface
+    order, count, (x_i, Ve_i, dVe_i) = pack_surface(np.ma.getmaskarray(TURBULENT_COORD),[TURBULENT_COORD,VE_I,DVE_I])
+    turbulent    = (l != 0.0)
+    l            = l[turbulent]
+    Re_L         = Re_L[turbulent]
+    nu           = l/Re_L
+    x_i          = x_i[:,turbulent]
+    Ve_i         = Ve_i[:,turbulent]
+    dVe_i        = dVe_i[:,turbulent]
+    n            = count[turbulent]
+    valid        = np.arange(npanel)[:,None] < n[None,:]
+
+    theta_0      = np.reshape(THETA_0,-1)[turbulent]
+    del_0        = np.reshape(DEL_0,-1)[turbulent]
+    del_star_0   = np.reshape(DELTA_STAR_0,-1)[turbulent]
+    H_0          = del_star_0 / theta_0
+    H1_0         = getH1(np.atleast_1d(H_0))
+    H1_0         = np.where(np.isnan(H1_0),(del_0 - del_star_0) / theta_0,H1_0)
+    y0           = np.stack([theta_0, getVe(0,x_i,Ve_i,n)*theta_0*H1_0],axis=-1)
+    y            = integrate_surface(y0,x_i,n,Re_L/l,Ve_i,dVe_i)
+
+    # Compute momentum thickness, theta
+    theta        = extrapolate_nans(y[:,:,0],x_i,n)
+    Ve_theta_H1  = extrapolate_nans(y[:,:,1],x_i,n)
+
+    # find theta values that do not converge and replace them with neighbor
+    theta        = replace_nonconverged(theta,valid,tol)
+    Ve_theta_H1  = replace_nonconverged(Ve_theta_H1,valid,tol)
+
+    # Compute mass flow shape factor, H1
+    H1           = Ve_theta_H1/(theta*Ve_i)
+
+    # Compute H
+    H            = getH(np.atleast_1d(H1))
+    H[H<0]       = 1E-6    # H cannot be negative
+    # find H values that do not converge and replace them with neighbor
+    H            = replace_nonconverged(H,valid,tol)
+
+    # Compute Reynolds numbers based on momentum thickness
+    Re_theta     = Re_L/l * Ve_i*theta
+
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x         = Ve_i* x_i / nu
+
+    # Compute skin friction
+    cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H)))
+
+    # Compute displacement thickness
+    del_star     = H*theta
+
+    # Compute boundary layer thickness
+    delta        = theta*H1 + del_star
+
+    # Reynolds number at x=0 cannot be negative (give nans)
+    Re_x[0]      = 1E-5
+
+    # Store results at the points that are not masked
+    X_H          = unpack_turbulent(x_i,turbulent,order,count,shape)
+    THETA_H      = unpack_turbulent(theta,turbulent,order,count,shape)
+    DELTA_STAR_H = unpack_turbulent(del_star,turbulent,order,count,shape)
+    H_H          = unpack_turbulent(H,turbulent,order,count,shape)
+    CF_H         = unpack_turbulent(cf,turbulent,order,count,shape)
+    RE_THETA_H   = unpack_turbulent(Re_theta,turbulent,order,count,shape)
+    RE_X_H       = unpack_turbulent(Re_x,turbulent,order,count,shape)
+    DELTA_H      = unpack_turbulent(delta,turbulent,order,count,shape)
 
     RESULTS = Data(
         X_H          = X_H,      
@@ -205,7 +181,108 @@ def getH1(H) :
     H1[idx1] = 3.3 + 1.5501*(H[idx1] - 0.6778)**-3.064
     return H1 
 
-def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i): 
+def integrate_surface(y0,x_i,n,ReL_div_L,Ve_i,dVe_i):
+    """ Integrates the boundary layer equations along every turbulent column of the
+    surface with the SciPy ODE solver
+
+    Assumptions:
+    The rows of a column past its last point repeat the value of that point. The
+    points after the solver stops, as near separation, are NaN
+
+    Source:
+    None
+
+    Inputs:
+    y0          - initial values of the functions, ncols x 2                      [unitless]
+    x_i         - x values of the surface, npanel x ncols                          [unitless]
+    n           - number of points of every column                                 [unitless]
+    ReL_div_L   - ratio of Reynolds number to length of surface                    [unitless]
+    Ve_i        - boundary layer velocity                                          [m/s]
+    dVe_i       - derivative of bounday layer velocity                             [m/s-m]
+
+    Outputs:
+    y           - functions at the points of the surface, npanel x ncols x 2      [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel, ncols = x_i.shape
+    y             = np.zeros((npanel,ncols,2))
+    for c in np.nonzero(n)[0]:
+        m       = n[c]
+        args    = (ReL_div_L[c],x_i[:m,c],Ve_i[:m,c],dVe_i[:m,c])
+        y_c, info = odeint(odefcn,y0[c],x_i[:m,c],args=args,full_output=1)
+
+        # the points after the solver stops are not set, they are extrapolated later
+        reached = np.cumprod(np.append(True,info['tcur'] >= x_i[1:m,c])).astype(bool)
+        y_c[~reached] = np.nan
+        y[:,c]  = y_c[np.minimum(np.arange(npanel),m-1)]
+    return y
+
+def extrapolate_nans(f,x_i,n):
+    """ Replaces the NaNs at the start of every column by its first value, and extrapolates
+    the values after its last value linearly
+
+    Assumptions:
+    A column with a single finite value is held constant at that value
+
+    Source:
+    None
+
+    Inputs:
+    f           - function along the surface, npanel x ncols       [unitless]
+    x_i         - x values of the surface, npanel x ncols          [unitless]
+    n           - number of points of every column                 [unitless]
+
+    Outputs:
+    f           - function without NaNs at its ends                [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel, ncols = f.shape
+    rows          = np.arange(npanel)[:,None]
+    columns       = np.arange(ncols)
+    finite        = ~np.isnan(f) & (rows < n[None,:])
+    first         = np.argmax(finite,axis=0)
+    last          = npanel - 1 - np.argmax(finite[::-1],axis=0)
+    slope         = last > first
+    prev          = np.where(slope,last - 1,last)
+    with np.errstate(all='ignore'):
+        df_dx     = (f[last,columns]-f[prev,columns])/(x_i[last,columns]-x_i[prev,columns])
+    df_dx         = np.where(slope,df_dx,0.)
+    f_extrap      = f[last,columns] + df_dx*(x_i - x_i[last,columns])
+    f             = np.where(rows < first,f[first,columns],f)
+    f             = np.where(rows > last,f_extrap,f)
+    return f
+
+def unpack_turbulent(f,turbulent,order,count,shape):
+    """ Scatters a function of the turbulent columns back to the points of the surface
+
+    Assumptions:
+    Columns without a turbulent surface are zero
+
+    Source:
+    None
+
+    Inputs:
+    f           - function along the surface, npanel x nturbulent         [unitless]
+    turbulent   - columns with a turbulent surface                         [boolean]
+    order       - surface point of every row of a column                   [unitless]
+    count       - number of points of every column                         [unitless]
+    shape       - shape of the surface, npanel x ncases x ncpts            [unitless]
+
+    Outputs:
+    F           - function on the surface, npanel x ncases x ncpts         [unitless]
+
+    Properties Used:
+    N/A
+    """
+    packed              = np.zeros(order.shape)
+    packed[:,turbulent] = f
+    return unpack_surface(packed,order,count,shape)
+
+def odefcn(y,x,ReL_div_L,x_i,Ve_i,dVe_i): 
     """ Computes boundary layer functions using SciPy ODE solver 
     Assumptions:
     None
@@ -227,59 +304,60 @@ def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i):
     """    
     theta       = y[0]
     Ve_theta_H1 = y[1]  
+    Ve          = interpolate_column(x,x_i,Ve_i)
 
     if theta == 0:
-        H1 = Ve_theta_H1 / (theta + 1e-6) / getVe(x,x_i,Ve_i)
+        H1 = Ve_theta_H1 / (theta + 1e-6) / Ve
     else:
-        H1 = Ve_theta_H1 / theta / getVe(x,x_i,Ve_i)
+        H1 = Ve_theta_H1 / theta / Ve
 
     H           = getH(np.atleast_1d(H1))
     Re_theta    = ReL_div_L * theta
     cf          = getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))
-    dydx_1      = 0.5*cf-(theta/getVe(x,x_i,Ve_i))*(2+H)*getdVe(x, x_i, dVe_i)
-    dydx_2      = getVe(x,x_i,Ve_i)*0.0306*(H1 - 3)**-0.6169 
-    f           = [dydx_1,dydx_2] 
+    dydx_1      = 0.5*cf-(theta/Ve)*(2+H)*interpolate_column(x,x_i,dVe_i)
+    dydx_2      = Ve*0.0306*(H1 - 3)**-0.6169 
+    f           = np.hstack([dydx_1,dydx_2])
     return f 
 
-def getVe(x,x_i,Ve_i):
+def getVe(x,x_i,Ve_i,count):
     """ Interpolates the bounday layer velocity over a new dimension of x 
     Assumptions:
-    None
+    Linear interpolation in every column, extrapolated past its first and last points
     Source:
     None
     Inputs: 
     x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
+    x_i       - old x dimension, npanel x ncols    [unitless]
     Ve_i      - old boundary layer velocity values [m/s] 
+    count     - number of points of every column   [unitless]
 
     Outputs:  
     Ve        - new boundary layer velocity values [m/s]
     Properties Used:
     N/A 
     """    
-    Ve_func = interp1d(x_i,Ve_i,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
+    Ve      = interpolate_surface(x,x_i,Ve_i,count)
     return Ve 
 
-def getdVe(x,x_i,dVe_i):
+def getdVe(x,x_i,dVe_i,count):
     """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x
 
     Assumptions:
-    None
+    Linear interpolation in every column, extrapolated past its first and last points
     Source:
     None
     Inputs: 
     x         - new x dimension                                  [unitless]
-    x_i       - old x dimension                                  [unitless]
+    x_i       - old x dimension, npanel x ncols                  [unitless]
     dVe_i     - old derivative of boundary layer velocity values [m/s-m] 
+    count     - number of points of every column                 [unitless]
 
     Outputs:  
     dVe       - new derivative of boundary layer velocity values [m/s-m]
     Properties Used:
     N/A 
     """        
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
+    dVe      = interpolate_surface(x,x_i,dVe_i,count)
     return dVe  
 
 def getcf(Re_theta,H): 
@@ -3,6 +3,7 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -43,38 +44,41 @@ def infl_coeff(x,y,xbar,ybar,st,ct,npanel,ncases,ncpts):
     ainfl                = np.zeros((ncases,ncpts,npanel+1,npanel+1))    
     pi2inv               = 1 / (2*np.pi) 
     
-    # convert 1d matrices to 4d 
-    x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
-    y_2d                 = np.repeat(np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
-    xbar_2d              = np.repeat(np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3)
-    ybar_2d              = np.repeat(np.swapaxes(np.swapaxes(ybar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
-    st_2d                = np.repeat(np.swapaxes(np.swapaxes(st,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
-    ct_2d                = np.repeat(np.swapaxes(np.swapaxes(ct,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
+    # convert 1d matrices to 4d, broadcast over the panels
+    x_2d                 = np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:]
+    y_2d                 = np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:]
+    xbar_2d              = np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis]
+    ybar_2d              = np.swapaxes(np.swapaxes(ybar,0, 2),0,1)[:,:,:,np.newaxis]
+    st_2d                = np.swapaxes(np.swapaxes(st,0, 2),0,1)[:,:,:,np.newaxis]
+    ct_2d                = np.swapaxes(np.swapaxes(ct,0, 2),0,1)[:,:,:,np.newaxis]
     st_2d_T              = np.swapaxes(st_2d,2,3)
     ct_2d_T              = np.swapaxes(ct_2d,2,3)  
     
     # Fill the elements of the matrix of aero influence coefficients
     sti_minus_j          = ct_2d_T*st_2d -  st_2d_T*ct_2d  
     cti_minus_j          = ct_2d_T*ct_2d +  st_2d_T*st_2d
-    rij                  = np.sqrt((xbar_2d-x_2d[:,:,:,:-1])**2 + (ybar_2d-y_2d[:,:,:,:-1])**2)
-    rij_plus_1           = np.sqrt((xbar_2d-x_2d[:,:,:,1:])**2 +  (ybar_2d-y_2d[:,:,:,1:])**2)
-    rij_dot_rij_plus_1   = (xbar_2d-x_2d[:,:,:,:-1])*(xbar_2d-x_2d[:,:,:,1:]) + (ybar_2d-y_2d[:,:,:,:-1])*(ybar_2d-y_2d[:,:,:,1:])  
-    anglesign            = np.sign((xbar_2d-x_2d[:,:,:,:-1])*(ybar_2d-y_2d[:,:,:,1:]) - (xbar_2d-x_2d[:,:,:,1:])*(ybar_2d-y_2d[:,:,:,:-1]))
+    dx                   = xbar_2d-x_2d[:,:,:,:-1]
+    dy                   = ybar_2d-y_2d[:,:,:,:-1]
+    dx_plus_1            = xbar_2d-x_2d[:,:,:,1:]
+    dy_plus_1            = ybar_2d-y_2d[:,:,:,1:]
+    rij                  = np.sqrt(dx**2 + dy**2)
+    rij_plus_1           = np.sqrt(dx_plus_1**2 +  dy_plus_1**2)
+    rij_dot_rij_plus_1   = dx*dx_plus_1 + dy*dy_plus_1  
+    anglesign            = np.sign(dx*dy_plus_1 - dx_plus_1*dy)
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # numerical noise 
     betaij               = np.real(anglesign*np.arccos(r_ratio))  
-    diag_indices         = list(np.tile(np.repeat(np.arange(npanel),ncases),ncpts))
-    aoas                 = list(np.tile(np.arange(ncases),ncpts*npanel))
-    res                  = list(np.repeat(np.arange(ncpts),ncases*npanel))   
-    betaij[aoas,res,diag_indices,diag_indices] = np.pi 
+    diag_indices         = np.arange(npanel)
+    betaij[:,:,diag_indices,diag_indices] = np.pi 
+    log_rij              = np.log(rij_plus_1/rij)
     
-    ainfl[:,:,:-1,:-1]   = pi2inv*(sti_minus_j*np.log(rij_plus_1/rij) + cti_minus_j*betaij)
-    mat_1                = np.sum(pi2inv*(cti_minus_j*np.log(rij_plus_1/rij)-sti_minus_j*betaij), axis = 3)
+    ainfl[:,:,:-1,:-1]   = pi2inv*(sti_minus_j*log_rij + cti_minus_j*betaij)
+    mat_1                = np.sum(pi2inv*(cti_minus_j*log_rij-sti_minus_j*betaij), axis = 3)
     ainfl[:,:,:-1,-1]    = mat_1  
     
-    mat_2                = pi2inv*(sti_minus_j*betaij - cti_minus_j*np.log(rij_plus_1/rij))
-    mat_3                = pi2inv*(sti_minus_j*np.log(rij_plus_1/rij) + cti_minus_j*betaij)
+    mat_2                = pi2inv*(sti_minus_j[:,:,[0,-1]]*betaij[:,:,[0,-1]] - cti_minus_j[:,:,[0,-1]]*log_rij[:,:,[0,-1]])
+    mat_3                = np.sum(ainfl[:,:,[0,-2],:-1],axis = 3)
     ainfl[:,:,-1,:-1]    = mat_2[:,:,0] + mat_2[:,:,-1]
-    ainfl[:,:,-1,-1]     = np.sum(mat_3,axis = 3)[:,:,0] + np.sum(mat_3,axis = 3)[:,:,-1]   
+    ainfl[:,:,-1,-1]     = mat_3[:,:,0] + mat_3[:,:,-1]   
     
     return  ainfl  
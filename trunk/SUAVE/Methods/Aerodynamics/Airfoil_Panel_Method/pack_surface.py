@@ -0,0 +1,142 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# pack_surface.py
+
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+import numpy as np
+
+# ----------------------------------------------------------------------
+# pack_surface.py
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def pack_surface(mask,arrays):
+    """Gathers the unmasked points of every case and control point of a surface at the
+    start of a column, so that all cases can be computed at once.
+
+    Assumptions:
+    The order of the points along the surface is kept. The rows of a column past its last
+    unmasked point repeat the value of that point.
+
+    Source:
+    None
+
+    Inputs:
+    mask     -  mask of the surface points, npanel x ncases x ncpts        [boolean]
+    arrays   -  list of surface properties, npanel x ncases x ncpts        [multiple units]
+
+    Outputs:
+    order    -  surface point of every row of a column, npanel x ncols     [unitless]
+    count    -  number of unmasked points of every column, ncols           [unitless]
+    packed   -  list of surface properties, npanel x ncols                 [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    npanel = mask.shape[0]
+    mask   = np.reshape(mask,(npanel,-1))
+    order  = np.argsort(mask,axis=0,kind='stable')
+    count  = np.sum(~mask,axis=0)
+
+    # rows past the last unmasked point repeat it
+    rows   = np.minimum(np.arange(npanel)[:,None],np.maximum(count-1,0)[None,:])
+    order  = np.take_along_axis(order,rows,axis=0)
+    packed = [np.take_along_axis(np.reshape(np.asarray(array),(npanel,-1)),order,axis=0) for array in arrays]
+
+    return order,count,packed
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def unpack_surface(packed,order,count,shape):
+    """Scatters the columns of a surface property packed by pack_surface back to the
+    unmasked points of the surface.
+
+    Assumptions:
+    Masked points are zero.
+
+    Source:
+    None
+
+    Inputs:
+    packed   -  surface property, npanel x ncols                           [multiple units]
+    order    -  surface point of every row of a column, npanel x ncols     [unitless]
+    count    -  number of unmasked points of every column, ncols           [unitless]
+    shape    -  shape of the surface, npanel x ncases x ncpts              [unitless]
+
+    Outputs:
+    array    -  surface property, npanel x ncases x ncpts                  [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    npanel, ncols = order.shape
+    valid         = np.arange(npanel)[:,None] < count[None,:]
+    columns       = np.broadcast_to(np.arange(ncols)[None,:],(npanel,ncols))
+    array         = np.zeros((npanel,ncols))
+    array[order[valid],columns[valid]] = packed[valid]
+
+    return np.reshape(array,shape)
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def interpolate_surface(x,x_i,f_i,count):
+    """Interpolates a surface property packed by pack_surface at one x value in every
+    column, and extrapolates it past the first and last points of a column.
+
+    Assumptions:
+    The x values of every column increase
+
+    Source:
+    None
+
+    Inputs: 
+    x         - new x value, scalar or ncols                      [unitless]
+    x_i       - old x dimension, npanel x ncols                   [unitless]
+    f_i       - old function values, npanel x ncols               [multiple units]
+    count     - number of points of every column                  [unitless]
+    
+    Outputs:  
+    f         - new function values, ncols                        [multiple units]
+
+    Properties Used:
+    N/A 
+    """
+    valid   = np.arange(x_i.shape[0])[:,None] < count[None,:]
+    k       = np.sum((x_i <= x) & valid,axis=0) - 1
+    k       = np.clip(k,0,np.maximum(count-2,0))[None,:]
+    x0, x1  = np.take_along_axis(x_i,k,axis=0)[0], np.take_along_axis(x_i,k+1,axis=0)[0]
+    f0, f1  = np.take_along_axis(f_i,k,axis=0)[0], np.take_along_axis(f_i,k+1,axis=0)[0]
+    slope   = np.divide(f1 - f0,x1 - x0,out=np.zeros_like(f0),where=(x1 != x0))
+    f       = f0 + (x - x0)*slope
+    return f
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def interpolate_column(x,x_i,f_i):
+    """Interpolates a surface property along a single column of the surface at one x
+    value, and extrapolates it past the first and last points of the column, as
+    interp1d does with fill_value = "extrapolate".
+
+    Assumptions:
+    The x values of the column increase
+
+    Source:
+    None
+
+    Inputs: 
+    x         - new x value                                       [unitless]
+    x_i       - old x dimension of the column, npoints            [unitless]
+    f_i       - old function values of the column, npoints        [multiple units]
+    
+    Outputs:  
+    f         - new function value, a 0-d array as from interp1d  [multiple units]
+
+    Properties Used:
+    N/A 
+    """
+    if len(x_i) < 2:
+        return np.asarray(f_i[0])
+    k       = min(max(np.searchsorted(x_i,x) - 1,0),len(x_i) - 2)
+    dx      = x_i[k+1] - x_i[k]
+    slope   = (f_i[k+1] - f_i[k])/dx if dx != 0 else 0.
+    f       = slope*(x - x_i[k]) + f_i[k]
+    return np.asarray(f)
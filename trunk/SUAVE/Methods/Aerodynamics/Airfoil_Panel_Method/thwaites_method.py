@@ -3,14 +3,16 @@
 
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint 
+from scipy.integrate import odeint
+
+from .pack_surface import pack_surface, unpack_surface, interpolate_surface, interpolate_column
 
 # ----------------------------------------------------------------------
 # thwaites_method
@@ -55,80 +57,62 @@ def thwaites_method(npanel,ncases,ncpts,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     N/A
     """
     
-    # Initialize vectors 
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):    
-            # compute laminar boundary layer properties  
-            l           = L[case,cpt]
-            theta_0     = THETA_0 
-            Re_L        = RE_L[case,cpt]
-            nu          = l/Re_L    
-            x_i         = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i        = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i       = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False] 
-            y0          = theta_0**2 * getVe(0,x_i,Ve_i)**6   
-            theta2_Ve6  = odeint(odefcn, y0,x_i , args=(nu, x_i, Ve_i))  
-            
-            # Compute momentum thickness, theta 
-            theta       = np.sqrt(theta2_Ve6[:,0]/ Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-            
-            # Thwaites separation criteria 
-            lambda_val  = theta**2 * dVe_i / nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i * theta / nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i * x_i/ nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val ,Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
-    
+    shape  = (npanel,ncases,ncpts)
+    nu     = np.asarray(L)/RE_L
+
+    # gather the points of the surface of every case and control point in a column
+    order, count, (x_i, Ve_i, dVe_i) = pack_surface(np.ma.getmaskarray(X_I),[X_I,VE_I,DVE_I])
+    nu     = np.reshape(nu,(1,-1))
+    valid  = np.arange(npanel)[:,None] < count[None,:]
+
+    # integrate every column from its first point, as each case was integrated before
+    y0          = THETA_0**2 * getVe(0,x_i,Ve_i,count)**6
+    theta2_Ve6  = integrate_surface(y0,x_i,Ve_i,np.broadcast_to(nu,(1,len(count)))[0],count)
+
+    # Compute momentum thickness, theta
+    theta       = np.sqrt(theta2_Ve6/ Ve_i**6)
+
+    # find theta values that do not converge and replace them with neighbor
+    theta       = replace_nonconverged(theta,valid,tol)
+
+    # Thwaites separation criteria
+    lambda_val  = theta**2 * dVe_i / nu
+
+    # Compute H
+    H           = getH(lambda_val)
+    H[H<0]      = 1E-6   # H cannot be negative
+    # find H values that do not converge and replace them with neighbor
+    H           = replace_nonconverged(H,valid,tol)
+
+    # Compute Reynolds numbers based on momentum thickness
+    Re_theta    = Ve_i * theta / nu
+
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x        = Ve_i * x_i/ nu
+
+    # Compute skin friction
+    cf          = abs(getcf(lambda_val ,Re_theta))
+
+    # Compute displacement thickness
+    del_star    = H*theta
+
+    # Compute boundary layer thickness
+    delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0
+
+    # Reynolds number at x=0 cannot be negative
+    Re_x[0]     = 1E-5
+
+    # Store results at the points that are not masked
+    X_T          = unpack_surface(x_i,order,count,shape)
+    THETA_T      = unpack_surface(theta,order,count,shape)
+    DELTA_STAR_T = unpack_surface(del_star,order,count,shape)
+    H_T          = unpack_surface(H,order,count,shape)
+    CF_T         = unpack_surface(cf,order,count,shape)
+    RE_THETA_T   = unpack_surface(Re_theta,order,count,shape)
+    RE_X_T       = unpack_surface(Re_x,order,count,shape)
+    DELTA_T      = unpack_surface(delta,order,count,shape)
+
     RESULTS = Data(
         X_T          = X_T,      
         THETA_T      = THETA_T,   
@@ -165,7 +149,38 @@ def getH(lambda_val ):
     H[idx1] = 2.61 - 3.75*lambda_val[idx1]  + 5.24*lambda_val[idx1]**2   
     return H 
     
-def odefcn(y,x, nu,x_i,Ve_i):
+def integrate_surface(y0,x_i,Ve_i,nu,count):
+    """ Integrates the boundary layer equation along every column of the surface with
+    the SciPy ODE solver
+
+    Assumptions:
+    The rows of a column past its last point repeat the value of that point
+
+    Source:
+    None
+
+    Inputs:
+    y0          - initial value of every column, ncols                   [unitless]
+    x_i         - x values of the surface, npanel x ncols                [unitless]
+    Ve_i        - boundary layer velocity, npanel x ncols                [m/s]
+    nu          - kinematic viscosity of every column, ncols             [m^2/s]
+    count       - number of points of every column                       [unitless]
+
+    Outputs:
+    theta2_Ve6  - theta**2*Ve**6 at the points of the surface            [unitless]
+
+    Properties Used:
+    N/A
+    """
+    npanel, ncols = x_i.shape
+    theta2_Ve6    = np.zeros((npanel,ncols))
+    for c in np.nonzero(count)[0]:
+        n      = count[c]
+        y      = odeint(odefcn,y0[c],x_i[:n,c],args=(nu[c],x_i[:n,c],Ve_i[:n,c]))
+        theta2_Ve6[:,c] = y[np.minimum(np.arange(npanel),n-1),0]
+    return theta2_Ve6
+
+def odefcn(y,x,nu,x_i,Ve_i):
     """ Computes boundary layer functions using SciPy ODE solver 
 
     Assumptions:
@@ -187,11 +202,12 @@ def odefcn(y,x, nu,x_i,Ve_i):
     Properties Used:
     N/A 
     """        
-    dydx = 0.45*getVe(x,x_i,Ve_i)**5*nu
+    dydx = 0.45*interpolate_column(x,x_i,Ve_i)**5*nu
     return dydx 
-    
-def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
+
+def replace_nonconverged(f,valid,tol):
+    """ Replaces the values of a function that do not converge with their neighbor, in
+    every column with more than one of them
 
     Assumptions:
     None
@@ -199,10 +215,38 @@ def getVe(x,x_i,Ve_i):
     Source:
     None
 
+    Inputs:
+    f           - function along the surface, npanel x ncols       [multiple units]
+    valid       - points of the surface in every column            [boolean]
+    tol         - boundary layer error correction tolerance        [unitless]
+
+    Outputs:
+    f           - function with the values replaced                [multiple units]
+
+    Properties Used:
+    N/A
+    """
+    with np.errstate(divide='ignore',invalid='ignore'):
+        jump   = (abs((f[1:] - f[:-1])/f[:-1]) > tol) & valid[1:]
+    replace    = jump & (np.sum(jump,axis=0) > 1)[None,:]
+    f          = f.copy()
+    f[1:][replace] = f[:-1][replace]
+    return f
+
+def getVe(x,x_i,Ve_i,count):
+    """ Interpolates the bounday layer velocity over a new dimension of x 
+
+    Assumptions:
+    Linear interpolation in every column, extrapolated past its first and last points
+
+    Source:
+    None
+
     Inputs: 
     x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
+    x_i       - old x dimension, npanel x ncols    [unitless]
     Ve_i      - old boundary layer velocity values [m/s] 
+    count     - number of points of every column   [unitless]
     
     Outputs:  
     Ve        - new boundary layer velocity values [m/s]
@@ -210,23 +254,23 @@ def getVe(x,x_i,Ve_i):
     Properties Used:
     N/A 
     """
-    Ve_func = interp1d(x_i,Ve_i, axis=0,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
+    Ve      = interpolate_surface(x,x_i,Ve_i,count)
     return Ve  
 
-def getdVe(x,x_i,dVe_i):
+def getdVe(x,x_i,dVe_i,count):
     """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x 
 
     Assumptions:
-    None
+    Linear interpolation in every column, extrapolated past its first and last points
 
     Source:
     None
 
     Inputs: 
     x         - new x dimension                                   [unitless]
-    x_i       - old x dimension                                   [unitless]
+    x_i       - old x dimension, npanel x ncols                   [unitless]
     dVe_i     - old derivative of boundary layer velocity values  [m/s-m]
+    count     - number of points of every column                  [unitless]
     
     Outputs:  
     dVe       - new derivative of boundary layer velocity values  [m/s-m]
@@ -234,8 +278,7 @@ def getdVe(x,x_i,dVe_i):
     Properties Used:
     N/A 
     """
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
+    dVe      = interpolate_surface(x,x_i,dVe_i,count)
     return dVe 
 
 def getcf(lambda_val , Re_theta):
@@ -3,6 +3,7 @@
 #
 # Created:  Mar 2021, M. Clarke
 # Modified: Sep 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -51,42 +52,44 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel):
     
     # flow tangency boundary condition - source distribution  
     vt_2d = ct *np.cos(alpha_2d) + st*np.sin(alpha_2d)
-    gamma = np.repeat(qg[-1,:,:][np.newaxis,:,:],npanel, axis = 0)  
+    gamma = qg[-1,:,:][np.newaxis,np.newaxis,:,:]
     
-    # convert 1d matrices to 2d 
-    qg_2d                = np.repeat(qg[:-1,:,:][np.newaxis,:,:,:],npanel, axis = 0) 
-    x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
-    y_2d                 = np.repeat(np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
-    xbar_2d              = np.repeat(np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3)
-    ybar_2d              = np.repeat(np.swapaxes(np.swapaxes(ybar,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
-    st_2d                = np.repeat(np.swapaxes(np.swapaxes(st,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
-    ct_2d                = np.repeat(np.swapaxes(np.swapaxes(ct,0, 2),0,1)[:,:,:,np.newaxis],npanel, axis = 3) 
+    # convert 1d matrices to 2d, broadcast over the panels 
+    qg_2d                = qg[:-1,:,:][np.newaxis,:,:,:]
+    x_2d                 = np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:]
+    y_2d                 = np.swapaxes(np.swapaxes(y,0, 2),0,1)[:,:,np.newaxis,:]
+    xbar_2d              = np.swapaxes(np.swapaxes(xbar,0, 2),0,1)[:,:,:,np.newaxis]
+    ybar_2d              = np.swapaxes(np.swapaxes(ybar,0, 2),0,1)[:,:,:,np.newaxis]
+    st_2d                = np.swapaxes(np.swapaxes(st,0, 2),0,1)[:,:,:,np.newaxis]
+    ct_2d                = np.swapaxes(np.swapaxes(ct,0, 2),0,1)[:,:,:,np.newaxis]
     st_2d_T              = np.swapaxes(st_2d,2,3)
     ct_2d_T              = np.swapaxes(ct_2d,2,3)  
     
     # Fill the elements of the matrix of aero influence coefficients
     sti_minus_j          = ct_2d_T*st_2d - st_2d_T*ct_2d 
     cti_minus_j          = ct_2d_T*ct_2d + st_2d_T*st_2d 
-    rij                  = np.sqrt((xbar_2d-x_2d[:,:,:,:-1])**2 + (ybar_2d-y_2d[:,:,:,:-1])**2)
-    rij_plus_1           = np.sqrt((xbar_2d-x_2d[:,:,:,1:])**2 +  (ybar_2d-y_2d[:,:,:,1:])**2)
-    rij_dot_rij_plus_1   = (xbar_2d-x_2d[:,:,:,:-1])*(xbar_2d-x_2d[:,:,:,1:]) + (ybar_2d-y_2d[:,:,:,:-1])*(ybar_2d-y_2d[:,:,:,1:])  
-    anglesign            = np.sign((xbar_2d-x_2d[:,:,:,:-1])*(ybar_2d-y_2d[:,:,:,1:]) - (xbar_2d-x_2d[:,:,:,1:])*(ybar_2d-y_2d[:,:,:,:-1]))
+    dx                   = xbar_2d-x_2d[:,:,:,:-1]
+    dy                   = ybar_2d-y_2d[:,:,:,:-1]
+    dx_plus_1            = xbar_2d-x_2d[:,:,:,1:]
+    dy_plus_1            = ybar_2d-y_2d[:,:,:,1:]
+    rij                  = np.sqrt(dx**2 + dy**2)
+    rij_plus_1           = np.sqrt(dx_plus_1**2 +  dy_plus_1**2)
+    rij_dot_rij_plus_1   = dx*dx_plus_1 + dy*dy_plus_1  
+    anglesign            = np.sign(dx*dy_plus_1 - dx_plus_1*dy)
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # numerical noise     
     betaij               = np.real(anglesign*np.arccos(r_ratio))    
-    diag_indices         =  list(np.tile(np.repeat(np.arange(npanel),nalpha),ncpts))
-    aoas                 = list(np.tile(np.arange(nalpha),ncpts*npanel))
-    res                  = list(np.repeat(np.arange(ncpts),nalpha*npanel))   
-    betaij[aoas,res,diag_indices,diag_indices] = np.pi      
+    diag_indices         = np.arange(npanel)
+    betaij[:,:,diag_indices,diag_indices] = np.pi      
+    log_rij              = np.log(rij_plus_1/rij)
     
     # swap axes 
     sti_minus_j_2d  = np.swapaxes(np.swapaxes(sti_minus_j,0,2),1,3)
     betaij_2d       = np.swapaxes(np.swapaxes(betaij,0,2),1,3)
     cti_minus_j_2d  = np.swapaxes(np.swapaxes(cti_minus_j,0,2),1,3)
-    rij_2d          = np.swapaxes(np.swapaxes(rij,0,2),1,3)
-    rij_plus_1_2d   = np.swapaxes(np.swapaxes(rij_plus_1,0,2),1,3)
+    log_rij_2d      = np.swapaxes(np.swapaxes(log_rij,0,2),1,3)
      
-    vt_2d += np.sum(qg_2d/2/np.pi*(sti_minus_j_2d*betaij_2d - cti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d)),1)  + \
-             np.sum(gamma/2/np.pi*(sti_minus_j_2d*np.log(rij_plus_1_2d/rij_2d) + cti_minus_j_2d*betaij_2d),1)
+    vt_2d += np.sum(qg_2d/2/np.pi*(sti_minus_j_2d*betaij_2d - cti_minus_j_2d*log_rij_2d),1)  + \
+             np.sum(gamma/2/np.pi*(sti_minus_j_2d*log_rij_2d + cti_minus_j_2d*betaij_2d),1)
     
     return  vt_2d
\ No newline at end of file
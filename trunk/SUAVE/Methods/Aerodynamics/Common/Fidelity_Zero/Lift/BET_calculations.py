@@ -2,16 +2,17 @@
 # BET_calculations.py
 # 
 # Created:  Jan 2022, R. Erhard
-# Modified:       
-from SUAVE.Core.Utilities import interp2d 
+# Modified: Oct 2026, SUAVE Team
+from SUAVE.Core import Data
 import numpy as np
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis):
+def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis,airfoil_polars=None):
     """
     Cl, Cdval = compute_airfoil_aerodynamics( beta,c,r,R,B,
                                               Wa,Wt,a,nu,
                                               airfoils,a_loc
-                                              ctrl_pts,Nr,Na,tc,use_2d_analysis )
+                                              ctrl_pts,Nr,Na,tc,use_2d_analysis,
+                                              airfoil_polars )
 
     Computes the aerodynamic forces at sectional blade locations. If airfoil
     geometry and locations are specified, the forces are computed using the
@@ -20,6 +21,9 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
 
     If the airfoils are not specified, an approximation is used.
 
+    The polars of all airfoils can be stacked once with stack_airfoil_polars and
+    passed in, so that repeated calls inside the BET iterations reuse them.
+
     Assumptions:
     N/A
 
@@ -43,6 +47,7 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
        Na                         Number of azimuthal blade stations              [-]
        tc                         Thickness to chord                              [-]
        use_2d_analysis            Specifies 2d disc vs. 1d single angle analysis  [Boolean]
+       airfoil_polars             Stacked airfoil polars, optional                [-]
 
     Outputs:
        Cl                       Lift Coefficients                         [-]
@@ -57,30 +62,12 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
 
     # If propeller airfoils are defined, use airfoil surrogate
     if a_loc != None:  
-        # Compute blade Cl and Cd distribution from the airfoil data 
-        if use_2d_analysis:
-            # return the 2D Cl and CDval of shape (ctrl_pts, Nr, Na)
-            Cl      = np.zeros((ctrl_pts,Nr,Na))
-            Cdval   = np.zeros((ctrl_pts,Nr,Na))
-            for jj,airfoil in enumerate(airfoils):
-                pd              = airfoil.polars
-                Cl_af           = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients) 
-                Cdval_af        = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs            = np.where(np.array(a_loc) == jj )
-                Cl[:,locs,:]    = Cl_af[:,locs,:]
-                Cdval[:,locs,:] = Cdval_af[:,locs,:]
-        else:
-            # return the 1D Cl and CDval of shape (ctrl_pts, Nr)
-            Cl      = np.zeros((ctrl_pts,Nr))
-            Cdval   = np.zeros((ctrl_pts,Nr))
-
-            for jj,airfoil in enumerate(airfoils):
-                pd            = airfoil.polars
-                Cl_af         = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                Cdval_af      = interp2d(Re,alpha,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)
-                locs          = np.where(np.array(a_loc) == jj )
-                Cl[:,locs]    = Cl_af[:,locs]
-                Cdval[:,locs] = Cdval_af[:,locs]
+        if airfoil_polars is None:
+            airfoil_polars = stack_airfoil_polars(airfoils,a_loc)
+            
+        # Compute blade Cl and Cd distribution from the airfoil data, each station against its own airfoil
+        # returns the 2D Cl and CDval of shape (ctrl_pts, Nr, Na) or the 1D of shape (ctrl_pts, Nr)
+        Cl, Cdval = interpolate_airfoil_polars(airfoil_polars,Re,alpha)
     else:
         # Estimate Cl max
         tc_1 = tc*100
@@ -113,6 +100,119 @@ def compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts
 
     return Cl, Cdval, alpha, Ma, W
 
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def stack_airfoil_polars(airfoils,a_loc):
+    """
+    Stacks the polars of all airfoils of a rotor into padded arrays indexed by
+    airfoil, along with the airfoil of every radial station.
+
+    Assumptions:
+    Shorter Reynolds number and angle of attack grids are padded with inf and
+    their coefficients with zeros, the padding is never interpolated
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoils                   Airfoils with polars                            [-]
+       a_loc                      Airfoil index of each radial station            [-]
+
+    Outputs:
+       airfoil_polars.
+          stations                   airfoil index of each radial station         [-]
+          reynolds_numbers           (airfoil, Re)                                [-]
+          angle_of_attacks           (airfoil, AoA)                               [rad]
+          lift_coefficients          (airfoil, Re, AoA)                           [-]
+          drag_coefficients          (airfoil, Re, AoA)                           [-]
+          number_of_reynolds_numbers length of each Reynolds number grid          [-]
+          number_of_angle_of_attacks length of each angle of attack grid          [-]
+    """
+    
+    polars = [airfoil.polars for airfoil in airfoils]
+    n_af   = len(polars)
+    n_re   = np.array([len(pd.reynolds_numbers) for pd in polars])
+    n_aoa  = np.array([len(pd.angle_of_attacks) for pd in polars])
+    
+    airfoil_polars                            = Data()
+    airfoil_polars.stations                   = np.array(a_loc,dtype=int)
+    airfoil_polars.number_of_reynolds_numbers = n_re
+    airfoil_polars.number_of_angle_of_attacks = n_aoa
+    airfoil_polars.reynolds_numbers           = np.full((n_af,max(n_re)),np.inf)
+    airfoil_polars.angle_of_attacks           = np.full((n_af,max(n_aoa)),np.inf)
+    airfoil_polars.lift_coefficients          = np.zeros((n_af,max(n_re),max(n_aoa)))
+    airfoil_polars.drag_coefficients          = np.zeros((n_af,max(n_re),max(n_aoa)))
+    
+    for jj,pd in enumerate(polars):
+        airfoil_polars.reynolds_numbers[jj,:n_re[jj]]               = pd.reynolds_numbers
+        airfoil_polars.angle_of_attacks[jj,:n_aoa[jj]]              = pd.angle_of_attacks
+        airfoil_polars.lift_coefficients[jj,:n_re[jj],:n_aoa[jj]]   = pd.lift_coefficients
+        airfoil_polars.drag_coefficients[jj,:n_re[jj],:n_aoa[jj]]   = pd.drag_coefficients
+        
+    return airfoil_polars
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def interpolate_airfoil_polars(airfoil_polars,Re,alpha):
+    """
+    Bilinear interpolation of the lift and drag coefficients of every radial station
+    in the polar of its own airfoil. The cells are found once per station and shared
+    by the lift and drag.
+
+    Assumptions:
+    Same as SUAVE.Core.Utilities.interp2d, points outside of the polar are
+    extrapolated from the edge cells
+
+    Source:
+    N/A
+
+    Inputs:
+       airfoil_polars             Stacked airfoil polars                          [-]
+       Re                         Reynolds number, (ctrl_pts, Nr) or (ctrl_pts, Nr, Na) [-]
+       alpha                      angle of attack, same shape as Re               [rad]
+
+    Outputs:
+       Cl                         Lift Coefficients                               [-]
+       Cdval                      Drag Coefficients  (before scaling)             [-]
+    """
+    
+    stations = airfoil_polars.stations
+    xp       = airfoil_polars.reynolds_numbers
+    yp       = airfoil_polars.angle_of_attacks
+    
+    # airfoil of every point
+    k  = np.broadcast_to(np.reshape(stations,(1,-1) + (1,)*(np.ndim(Re)-2)),np.shape(Re))
+    
+    # find the cells of the points of each airfoil
+    ix = np.ones(np.shape(Re),dtype=int)
+    iy = np.ones(np.shape(Re),dtype=int)
+    for jj in range(len(xp)):
+        locs       = stations == jj
+        n_re       = airfoil_polars.number_of_reynolds_numbers[jj]
+        n_aoa      = airfoil_polars.number_of_angle_of_attacks[jj]
+        ix[:,locs] = np.clip(np.searchsorted(xp[jj,:n_re], Re[:,locs], side="right"), 1, n_re - 1)
+        iy[:,locs] = np.clip(np.searchsorted(yp[jj,:n_aoa], alpha[:,locs], side="right"), 1, n_aoa - 1)
+        
+    # interpolation weights
+    x1 = xp[k,ix]
+    x0 = xp[k,ix-1]
+    y1 = yp[k,iy]
+    y0 = yp[k,iy-1]
+    
+    coefficients = []
+    for zp in [airfoil_polars.lift_coefficients,airfoil_polars.drag_coefficients]:
+        z_11 = zp[k, ix - 1, iy - 1]
+        z_21 = zp[k, ix, iy - 1]
+        z_12 = zp[k, ix - 1, iy]
+        z_22 = zp[k, ix, iy]
+        
+        z_xy1 = (x1 - Re) / (x1 - x0) * z_11 + (Re - x0) / (x1 - x0) * z_21
+        z_xy2 = (x1 - Re) / (x1 - x0) * z_12 + (Re - x0) / (x1 - x0) * z_22
+        
+        coefficients.append((y1 - alpha) / (y1 - y0) * z_xy1 + (alpha - y0) / (y1 - y0) * z_xy2)
+        
+    Cl, Cdval = coefficients
+    
+    return Cl, Cdval
+
 
 
 def compute_inflow_and_tip_loss(r,R,Wa,Wt,B,et1=1,et2=1,et3=1):
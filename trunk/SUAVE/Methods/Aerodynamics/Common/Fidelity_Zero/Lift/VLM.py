@@ -4,6 +4,7 @@
 # Created:  Oct 2020, E. Botero
 # Modified: May 2021, E. Botero   
 #           Jul 2021, A. Blaufox     
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,11 +12,17 @@
 
 # package imports 
 import numpy as np 
-from SUAVE.Core import Data
+from scipy.linalg import lu_factor, lu_solve
+from collections import OrderedDict
+from SUAVE.Core import Data, hash_data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution       import generate_vortex_distribution 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
 
+# LU factors of the influence matrices of recent vortex distributions, capped in bytes
+_influence_factors        = OrderedDict()
+_influence_factors_memory = 2**28
+
 # ----------------------------------------------------------------------
 #  Vortex Lattice
 # ----------------------------------------------------------------------
@@ -93,6 +100,7 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [np.float16/32/64]
+    settings.influence_matrix_memory_budget    [bytes], optional, evaluates the induced velocities in blocks
        
     conditions.aerodynamics.angle_of_attack    [radians]
     conditions.aerodynamics.side_slip_angle    [radians]
@@ -248,26 +256,34 @@ def VLM(conditions,settings,geometry):
     # This is not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    memory_budget = settings.get('influence_matrix_memory_budget',None)
+    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True,memory_budget=memory_budget)
     
-    C_mn  = C_mn_small[inv,:,:,:]
     RFLAG = RFLAG_small[inv,:]
     EW    = EW_small[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
     
-    # Build Aerodynamic Influence Coefficient Matrix
+    # Build Aerodynamic Influence Coefficient Matrix, one per unique mach number
     use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
     if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
+        first   = np.unique(inv,return_index=True)[1]
+        delta_m = delta[first]
+        phi_m   = phi[first]
+        A =   np.multiply(C_mn_small[:,:,:,0],np.atleast_3d(np.sin(delta_m)*np.cos(phi_m))) \
+            + np.multiply(C_mn_small[:,:,:,1],np.atleast_3d(np.cos(delta_m)*np.sin(phi_m))) \
+            - np.multiply(C_mn_small[:,:,:,2],np.atleast_3d(np.cos(phi_m)*np.cos(delta_m)))   # validated from book eqn 7.42 
     else:
-        A = EW
+        A = EW_small
 
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    # Compute vortex strength, factorizing once per mach number for all conditions at that mach
+    VD_key = hash_data(VD) + str(use_VORLAX_induced_velocity)
+    GAMMA  = np.zeros(np.shape(RHS))
+    for i in range(len(m_unique)):
+        rows        = inv == i
+        factors     = influence_matrix_factors(A[i],VD_key + repr(m_unique[i,0]))
+        GAMMA[rows] = lu_solve(factors,RHS[rows].T).T
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -578,6 +594,45 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     
     return CLE
 
+# ----------------------------------------------------------------------
+#  Influence matrix factorization
+# ----------------------------------------------------------------------
+def influence_matrix_factors(A,key):
+    """ This returns the LU factors of an influence matrix. Factors are kept for
+    later calls with the same vortex distribution and mach number, dropping the
+    least recently used beyond a fixed amount of memory.
+    
+    Assumptions:
+    The key identifies the matrix
+    
+    Source:
+    N/A
+    
+    Inputs:
+    A        [array]
+    key      [str]
+    
+    Outputs:
+    factors  [tuple], LU factors and pivots as returned by scipy.linalg.lu_factor
+    
+    Properties Used:
+    N/A
+    """
+    
+    if key in _influence_factors:
+        _influence_factors.move_to_end(key)
+        return _influence_factors[key]
+    
+    factors = lu_factor(A)
+    
+    _influence_factors[key] = factors
+    memory = sum([lu.nbytes + piv.nbytes for lu, piv in _influence_factors.values()])
+    while memory > _influence_factors_memory and len(_influence_factors) > 1:
+        lu, piv = _influence_factors.popitem(last=False)[1]
+        memory -= lu.nbytes + piv.nbytes
+    
+    return factors
+
 # ----------------------------------------------------------------------
 #  Vectorized cumsum from indices
 # ----------------------------------------------------------------------
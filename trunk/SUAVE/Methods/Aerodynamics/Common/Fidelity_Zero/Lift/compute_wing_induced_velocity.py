@@ -4,6 +4,7 @@
 # Created:  Dec 2020, E. Botero
 # Modified: May 2021, E. Botero  
 #           Jun 2021, E. Botero  
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,7 +14,7 @@
 import numpy as np 
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_wing_induced_velocity(VD,mach,compute_EW=False):
+def compute_wing_induced_velocity(VD,mach,compute_EW=False,memory_budget=None,precision=np.float32):
     """ This computes the induced velocities at each control point of the vehicle vortex lattice 
 
     Assumptions: 
@@ -21,6 +22,10 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     Outside of a call to the VLM() function itself, EW does not need to be computed, as C_mn 
     provides the same information in the body-frame. 
+    
+    With a memory budget the receiving points are evaluated in blocks, so that the temporaries 
+    of a block stay within the budget. The blocks are written into the preallocated outputs and 
+    the results are identical to evaluating all points at once.
 
     Source:  
     1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
@@ -29,8 +34,11 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     2. VORLAX Source Code
 
     Inputs: 
-    VD       - vehicle vortex distribution                    [Unitless] 
-    mach                                                      [Unitless] 
+    VD            - vehicle vortex distribution                    [Unitless] 
+    mach                                                           [Unitless] 
+    compute_EW                                                     [boolean]
+    memory_budget - bytes for the temporaries, None for no blocks  [bytes]
+    precision     - floating point type of the calculation         [np.float32/64]
     
     Outputs:                                
     C_mn     - total induced velocity matrix                  [Unitless] 
@@ -48,32 +56,32 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     TE_ind       = VD.trailing_edge_indices
     n_cp         = VD.n_cp
     n_mach       = len(mach)
-    mach         = np.array(mach,dtype=np.float32)
+    mach         = np.array(mach,dtype=precision)
 
     # Control points from the VLM 
-    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=np.float32)
-    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=np.float32)
-    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=np.float32)
-    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=np.float32)
-    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=np.float32)
-    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=np.float32)
-    XA1   = np.array(np.atleast_2d(VD.XA1*1.),dtype=np.float32)
-    YA1   = np.array(np.atleast_2d(VD.YA1*1.),dtype=np.float32)
-    ZA1   = np.array(np.atleast_2d(VD.ZA1*1.),dtype=np.float32)
-    XB1   = np.array(np.atleast_2d(VD.XB1*1.),dtype=np.float32)
-    YB1   = np.array(np.atleast_2d(VD.YB1*1.),dtype=np.float32)
-    ZB1   = np.array(np.atleast_2d(VD.ZB1*1.),dtype=np.float32)
-    XA2   = np.array(np.atleast_2d(VD.XA2*1.),dtype=np.float32)
-    YA2   = np.array(np.atleast_2d(VD.YA2*1.),dtype=np.float32)
-    ZA2   = np.array(np.atleast_2d(VD.ZA2*1.),dtype=np.float32)
-    XB2   = np.array(np.atleast_2d(VD.XB2*1.),dtype=np.float32)
-    YB2   = np.array(np.atleast_2d(VD.YB2*1.),dtype=np.float32)
-    ZB2   = np.array(np.atleast_2d(VD.ZB2*1.),dtype=np.float32)
-    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=np.float32)
-    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=np.float32)
-    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=np.float32)
-    XA_TE = np.array(np.atleast_2d(VD.XA_TE*1.),dtype=np.float32)
-    XB_TE = np.array(np.atleast_2d(VD.XB_TE*1.),dtype=np.float32)
+    XAH   = np.array(np.atleast_2d(VD.XAH*1.),dtype=precision)
+    YAH   = np.array(np.atleast_2d(VD.YAH*1.),dtype=precision)
+    ZAH   = np.array(np.atleast_2d(VD.ZAH*1.),dtype=precision)
+    XBH   = np.array(np.atleast_2d(VD.XBH*1.),dtype=precision)
+    YBH   = np.array(np.atleast_2d(VD.YBH*1.),dtype=precision)
+    ZBH   = np.array(np.atleast_2d(VD.ZBH*1.),dtype=precision)
+    XA1   = np.array(np.atleast_2d(VD.XA1*1.),dtype=precision)
+    YA1   = np.array(np.atleast_2d(VD.YA1*1.),dtype=precision)
+    ZA1   = np.array(np.atleast_2d(VD.ZA1*1.),dtype=precision)
+    XB1   = np.array(np.atleast_2d(VD.XB1*1.),dtype=precision)
+    YB1   = np.array(np.atleast_2d(VD.YB1*1.),dtype=precision)
+    ZB1   = np.array(np.atleast_2d(VD.ZB1*1.),dtype=precision)
+    XA2   = np.array(np.atleast_2d(VD.XA2*1.),dtype=precision)
+    YA2   = np.array(np.atleast_2d(VD.YA2*1.),dtype=precision)
+    ZA2   = np.array(np.atleast_2d(VD.ZA2*1.),dtype=precision)
+    XB2   = np.array(np.atleast_2d(VD.XB2*1.),dtype=precision)
+    YB2   = np.array(np.atleast_2d(VD.YB2*1.),dtype=precision)
+    ZB2   = np.array(np.atleast_2d(VD.ZB2*1.),dtype=precision)
+    XC    = np.array(np.atleast_2d(VD.XC*1.),dtype=precision)
+    YC    = np.array(np.atleast_2d(VD.YC*1.),dtype=precision)
+    ZC    = np.array(np.atleast_2d(VD.ZC*1.),dtype=precision)
+    XA_TE = np.array(np.atleast_2d(VD.XA_TE*1.),dtype=precision)
+    XB_TE = np.array(np.atleast_2d(VD.XB_TE*1.),dtype=precision)
     
     
     # Panel Dihedral Angle, using AH and BH location
@@ -126,6 +134,84 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     x1bar = (xb - xc)
     y1bar = (yb - yc)*costheta + (zb - zc)*sintheta
     
+    # Preallocate the outputs, the receiving points are the rows and the vortices the columns
+    shape_0 = np.shape(xo)[0]
+    shape_1 = np.shape(xc)[1]
+    C_mn    = np.zeros((n_mach,shape_0,shape_1,3),dtype=precision)
+    RFLAG   = np.ones((n_mach,shape_1),dtype=np.int8)
+    if compute_EW == True:
+        EW  = np.zeros((n_mach,shape_0,shape_1),dtype=precision)
+    else:
+        # Assume that this function is being used outside of VLM, EW is not needed
+        EW  = np.nan
+        
+    # Split the receiving points into blocks that fit in the memory budget
+    block_size = induced_velocity_block_size(memory_budget,n_mach,shape_0,shape_1,precision)
+    
+    for r0 in range(0,shape_0,block_size):
+        r1 = min(r0+block_size,shape_0)
+        
+        U, V, W, RFLAG = induced_velocity_block(VD,mach,xo[r0:r1],yo[r0:r1],zo[r0:r1],xc,yc,zc,costheta,sintheta,\
+                                                x1bar,y1bar,r0,shape_0,precision)
+    
+        # Rotate into the vehicle frame and pack into a velocity matrix
+        C_mn[:,r0:r1,:,0] = U
+        C_mn[:,r0:r1,:,1] = V*costheta - W*sintheta
+        C_mn[:,r0:r1,:,2] = V*sintheta + W*costheta
+        
+        if compute_EW == True:
+            # Calculate the W velocity in the VORLAX frame for later calcs
+            # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
+            COS1   = np.cos(DL.T[r0:r1] - DL)
+            SIN1   = np.sin(DL.T[r0:r1] - DL) 
+            WEIGHT = 1
+            
+            EW[:,r0:r1,:] = (W*COS1-V*SIN1)*WEIGHT
+            
+    # The semispan is the same for every receiving point
+    s = np.broadcast_to(np.abs(y1bar),(shape_0,shape_1))
+
+    return C_mn, s, RFLAG, EW
+
+def induced_velocity_block(VD,mach,xo,yo,zo,xc,yc,zc,costheta,sintheta,x1bar,y1bar,r0,n_rows,precision):
+    """ This computes the induced velocities of every horseshoe vortex on a block of 
+    receiving points
+    
+    Assumptions: 
+    Trailing vortex legs infinity are alligned to freestream
+
+    Source:  
+    1. Miranda, Luis R., Robert D. Elliot, and William M. Baker. "A generalized vortex 
+    lattice method for subsonic and supersonic flow applications." (1977). (NASA CR)
+    
+    2. VORLAX Source Code
+
+    Inputs: 
+    VD                 - vehicle vortex distribution               [Unitless] 
+    mach                                                           [Unitless] 
+    xo, yo, zo         - receiving points of the block             [m]
+    xc, yc, zc         - middle front of the vortices              [m]
+    costheta, sintheta - inclination of the vortices               [-]
+    x1bar, y1bar       - end of the vortices in the rotated axes   [m]
+    r0                 - index of the first receiving point        [-]
+    n_rows             - total number of receiving points          [-]
+    precision          - floating point type of the calculation    [np.float32/64]
+    
+    Outputs:           
+    U       X velocity        [unitless]
+    V       Y velocity        [unitless]
+    W       Z velocity        [unitless]
+    RFLAG   sonic vortex flag [boolean] 
+
+    Properties Used:
+    N/A
+    """      
+    
+    LE_ind       = VD.leading_edge_indices
+    TE_ind       = VD.trailing_edge_indices
+    n_cp         = VD.n_cp
+    n_mach       = len(mach)
+    
     xobar = (xo - xc)
     yobar = (yo - yc)*costheta + (zo - zc)*sintheta
     zobar =-(yo - yc)*sintheta + (zo - zc)*costheta
@@ -172,9 +258,9 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     RO2_sub  = B2_sub*RTV2
     
     # ZERO-OUT PERTURBATION VELOCITY COMPONENTS
-    U = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    V = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)
-    W = np.zeros((n_mach,shape_0,shape_1),dtype=np.float32)    
+    U = np.zeros((n_mach,shape_0,shape_1),dtype=precision)
+    V = np.zeros((n_mach,shape_0,shape_1),dtype=precision)
+    W = np.zeros((n_mach,shape_0,shape_1),dtype=precision)    
     
     if np.sum(sub)>0:
         # COMPUTATION FOR SUBSONIC HORSESHOE VORTEX
@@ -193,28 +279,42 @@ def compute_wing_induced_velocity(VD,mach,compute_EW=False):
     
     if np.sum(sup)>0:
         U[sup], V[sup], W[sup], RFLAG[sup,:] = supersonic(zobar,XSQ1,RO1_sup,XSQ2,RO2_sup,XTY,t,B2_sup,ZSQ,TOLSQ,TOL,TOLSQ2,\
-                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind)
-         
-    
-    # Rotate into the vehicle frame and pack into a velocity matrix
-    C_mn = np.stack([U, V*costheta - W*sintheta, V*sintheta + W*costheta],axis=-1)
+                                                    X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind,LE_ind,r0,n_rows,precision)
+        
+    return U, V, W, RFLAG
+
+def induced_velocity_block_size(memory_budget,n_mach,n_rows,n_cols,precision):
+    """ This finds how many receiving points can be evaluated at once within a memory budget
     
+    Assumptions: 
+    About 30 mach dependent and 30 mach independent temporaries per receiving point and vortex, 
+    the supersonic calculation being the largest
+
+    Source:  
+    N/A
+
+    Inputs: 
+    memory_budget                       [bytes]
+    n_mach                              [-]
+    n_rows - number of receiving points [-]
+    n_cols - number of vortices         [-]
+    precision                           [np.float32/64]
     
-    if compute_EW == True:
-        # Calculate the W velocity in the VORLAX frame for later calcs
-        # The angles are Dihedral angle of the current panel - dihedral angle of the influencing panel
-        COS1   = np.cos(DL.T - DL)
-        SIN1   = np.sin(DL.T - DL) 
-        WEIGHT = 1
-        
-        EW = (W*COS1-V*SIN1)*WEIGHT
-    else:
-        # Assume that this function is being used outside of VLM, EW is not needed
-        EW = np.nan
-        
+    Outputs:           
+    block_size                          [-]
 
-    return C_mn, s, RFLAG, EW
+    Properties Used:
+    N/A
+    """     
+    
+    if memory_budget is None:
+        return max(n_rows,1)
+    
+    bytes_per_row = 30*(n_mach + 1)*n_cols*np.dtype(precision).itemsize
+    block_size    = int(memory_budget // bytes_per_row)
     
+    return min(max(block_size,1),max(n_rows,1))
+
 def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for subsonic mach numbers
@@ -285,7 +385,8 @@ def subsonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,X1,Y1,X2,Y2,RTV1,RTV2):
     
     return U, V, W
 
-def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind):
+def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV1,RTV2,CUTOFF,CHORD,RNMAX,n_cp,TE_ind, LE_ind,
+               r0=0,n_rows=None,precision=np.float32):
     """  This computes the induced velocities at each control point 
     of the vehicle vortex lattice for supersonic mach numbers
 
@@ -321,6 +422,9 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     n_cp         number of control points                     [-]
     TE_ind       indices of the trailing edge                 [-]
     LE_ind       indices of the leading edge                  [-]
+    r0           index of the first receiving point           [-]
+    n_rows       total number of receiving points             [-]
+    precision    floating point type of the calculation       [np.float32/64]
     
 
     
@@ -422,7 +526,7 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # DETERMINE IF TRANSVERSE VORTEX LEG OF HORSESHOE ASSOCIATED TO THE
     # CONTROL POINT UNDER CONSIDERATION IS SONIC (SWEPT PARALLEL TO MACH
     # LINE)? IF SO THEN RFLAG = 0.0, OTHERWISE RFLAG = 1.0.
-    size   = shape[1]
+    size   = shape[2]
     n_mach = shape[0]    
     T2S = np.atleast_2d(T2[0,:])*np.ones((n_mach,1))
     T2F = np.zeros((n_mach,size))
@@ -449,14 +553,18 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     
     FLAG_bool          = np.zeros_like(TRANS,dtype=bool)
     FLAG_bool[TRANS<0] = True
-    FLAG_bool          = np.reshape(FLAG_bool,(n_mach,size,-1))
+    
+    # The receiving points of this block
+    if n_rows is None:
+        n_rows = shape[1]
+    rows = np.arange(r0,r0+shape[1])
     
 
     # COMPUTE THE GENERALIZED PRINCIPAL PART OF THE VORTEX-INDUCED VELOCITY INTEGRAL, WWAVE.
     # FROM LINE 2647 VORLAX, the IR .NE. IRR means that we're looking at vortices that affect themselves
-    WWAVE   = np.zeros(shape,dtype=np.float32)
+    WWAVE   = np.zeros(shape,dtype=precision)
     COX     = CHORD /RNMAX
-    eye     = np.eye(n_cp,dtype=np.int8)
+    eye     = np.array(rows[:,None] == np.arange(size)[None,:],dtype=np.int8)
     T2      = np.broadcast_to(T2,shape)*eye
     B2_full = np.broadcast_to(B2,shape)*eye
     COX     = np.broadcast_to(COX,shape)*eye
@@ -471,27 +579,22 @@ def supersonic(Z,XSQ1,RO1,XSQ2,RO2,XTY,T,B2,ZSQ,TOLSQ,TOL,TOLSQ2,X1,Y1,X2,Y2,RTV
     # IN FRONT OF AND BEHIND IT.
     
     # Zero out the row
-    FLAG_bool_rep     = np.broadcast_to(FLAG_bool,shape)
+    FLAG_bool_rep     = np.broadcast_to(np.atleast_3d(FLAG_bool[:,rows]),shape)
     W[FLAG_bool_rep]  = 0. # Default to zero
 
-    # The self velocity goes to 2
-    FLAG_bool_split   = np.array(np.split(FLAG_bool.ravel(),n_mach))
-    FLAG_ind          = np.array(np.where(FLAG_bool_split))
-    squares           = np.zeros((size,size,n_mach))
-    squares[FLAG_ind[1],FLAG_ind[1],FLAG_ind[0]] = 1
-    squares           = np.ravel(squares,order='F')
-    
-    FLAG_bool_self    = np.where(squares==1)[0]
-    W                 = W.ravel()
-    W[FLAG_bool_self] = 2. # It's own value, -2
+    # The self velocity goes to 2, indexed in the full matrix of all receiving points
+    FLAG_ind          = np.array(np.where(FLAG_bool))
+    FLAG_bool_self    = FLAG_ind[0]*n_rows*size + FLAG_ind[1]*size + FLAG_ind[1]
+    full_shape        = (n_mach,n_rows,size)
     
     # The panels before and after go to -1
     FLAG_bool_bef = FLAG_bool_self - 1
     FLAG_bool_aft = FLAG_bool_self + 1
-    W[FLAG_bool_bef] = -1.
-    W[FLAG_bool_aft] = -1.
     
-    W = np.reshape(W,shape)
+    for flat, value in ((FLAG_bool_self,2.),(FLAG_bool_bef,-1.),(FLAG_bool_aft,-1.)):
+        M, R, C = np.unravel_index(flat % np.prod(full_shape),full_shape)
+        in_block = (R >= r0) & (R < r0 + shape[1])
+        W[M[in_block],R[in_block]-r0,C[in_block]] = value
 
     return U, V, W, RFLAG
 
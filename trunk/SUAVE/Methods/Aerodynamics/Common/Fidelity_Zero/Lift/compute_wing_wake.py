@@ -9,7 +9,6 @@
 # ----------------------------------------------------------------------
 import copy
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity import compute_wing_induced_velocity
@@ -140,6 +139,7 @@ def compute_wing_wake(geometry, conditions, x, grid_settings, VLM_settings, eval
         zplot_v = np.reshape(v, (len(grid_points.yline),len(grid_points.zline))).T
            
         
+        import pylab as plt
         fig  = plt.figure(figsize=(10,4))
         axes = fig.add_subplot(131)
         a = axes.contourf(xplot,yplot,zplot_w, levels=100,cmap='hot')
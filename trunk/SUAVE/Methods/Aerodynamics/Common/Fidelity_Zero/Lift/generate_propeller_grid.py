@@ -8,7 +8,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 
 def generate_propeller_grid(prop, grid_settings, plot_grid=True):
@@ -79,6 +78,7 @@ def generate_propeller_grid(prop, grid_settings, plot_grid=True):
     
     if plot_grid:
         
+        import pylab as plt
         # plot the grid points
         fig  = plt.figure()
         axes = fig.add_subplot(1,1,1)
@@ -8,7 +8,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
-import pylab as plt
 from SUAVE.Core import Data
 
 
@@ -82,6 +81,7 @@ def generate_wing_wake_grid(geometry, H, L, hf, x_plane, Nzo=20, Nzf=35, Nyo=20,
         wing_y = np.array([yL, yR])
         wing_z = np.array([0,0])
         
+        import pylab as plt
         # plot the grid points
         fig  = plt.figure()
         axes = fig.add_subplot(1,1,1)
@@ -2,6 +2,8 @@
 # Low-fidelity methods that are used by many analyses.
 # @ingroup Methods-Aerodynamics-Common
 
-from . import Drag
-from . import Lift
-from . import Helper_Functions
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Drag',
+                                             'Lift',
+                                             'Helper_Functions'])
\ No newline at end of file
@@ -2,5 +2,7 @@
 # These are methods that are used by several analyses.
 # @ingroup Methods-Aerodynamics
 
-from . import Fidelity_Zero
-from . import Gas_Dynamics
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Fidelity_Zero',
+                                             'Gas_Dynamics'])
\ No newline at end of file
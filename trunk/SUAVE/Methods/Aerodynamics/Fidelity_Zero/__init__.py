@@ -2,4 +2,6 @@
 # Functions to perform low-fidelity calculations
 # @ingroup Methods-Aerodynamics
 
-from . import Lift
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Lift'])
@@ -1,4 +1,6 @@
 ## @defgroup Methods-Aerodynamics-Supersonic_Zero Supersonic_Zero
 # Functions to perform low-fidelity calculations including supersonics
 # @ingroup Methods-Aerodynamics
-from . import Drag
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Drag'])
\ No newline at end of file
@@ -2,10 +2,12 @@
 # Aerodynamic methods contain the functions for the aerodynamic analyses.
 # @ingroup Methods
 
-from . import Airfoil_Panel_Method
-from . import AVL
-from . import AERODAS
-from . import Fidelity_Zero
-from . import Common
-from . import Lifting_Line
-from . import Supersonic_Zero
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Airfoil_Panel_Method',
+                                             'AVL',
+                                             'AERODAS',
+                                             'Fidelity_Zero',
+                                             'Common',
+                                             'Lifting_Line',
+                                             'Supersonic_Zero'])
\ No newline at end of file
@@ -1,2 +1,4 @@
-from . import Industrial_Costs
-from . import Operating_Costs
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Industrial_Costs',
+                                             'Operating_Costs'])
\ No newline at end of file
@@ -2,4 +2,6 @@
 # This contains functions that can compute costs associated with building and operating an aircraft.
 # Currently there are modules for industrial cost and operating cost.
 # @ingroup Methods
-from . import Correlations
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Correlations'])
\ No newline at end of file
@@ -1,6 +1,8 @@
 ## @defgroup Methods-Cryogenics
 # This contains functions that can compute calculations associated with cryogenic components
 # @ingroup Methods
-from . import Leads
-from . import Dynamo
-from . import Cryocooler
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Leads',
+                                             'Dynamo',
+                                             'Cryocooler'])
\ No newline at end of file
@@ -20,7 +20,6 @@ from SUAVE.Core import Data, Units
 from SUAVE.Analyses import Analysis
 # package imports
 import numpy as np
-import pylab as plt
 
 
 # ----------------------------------------------------------------------
@@ -248,6 +247,7 @@ class Figure_of_Merit(Analysis):
 
         # DIRECT OPERATING COSTS PLOT
         if settings.plot_flag == True:
+            import pylab as plt
             labels = 'energy', 'crew', 'maintenance', 'capital', 'fees'
             sizes = [doc.energy, doc.crew, doc.maintenance, doc.capital, doc.fees]
             fig1, ax1 = plt.subplots()
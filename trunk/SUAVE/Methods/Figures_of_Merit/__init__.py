@@ -7,4 +7,6 @@ from .noise_certification import noise_certification
 from .global_warming_potential import global_warming_potential
 from .technology_readyness_level import technology_readyness_level
 from .Figure_of_Merit import Figure_of_Merit
-from . import Supporting_Functions
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Supporting_Functions'])
\ No newline at end of file
@@ -9,7 +9,6 @@
 # ----------------------------------------------------------------------
 import numpy as np
 import copy
-import matplotlib.pyplot as plt
 import SUAVE
 from SUAVE.Core import Units
 from SUAVE.Core import Data
@@ -1,6 +1,8 @@
 ## @defgroup Methods-Flight_Dynamics-Dynamic_Stability Dynamic_Stability
 # @ingroup Methods-Flight_Dynamics
 
-from . import Approximations
-from . import Full_Linearized_Equations
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Approximations',
+                                             'Full_Linearized_Equations'])
 from .compute_dynamic_flight_modes import compute_dynamic_flight_modes
\ No newline at end of file
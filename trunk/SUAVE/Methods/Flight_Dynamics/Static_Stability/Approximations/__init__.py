@@ -2,5 +2,7 @@
 # @ingroup Methods-Flight_Dynamics-Static_Stability
 
 from .datcom import datcom
-from . import Tube_Wing
-from . import Supporting_Functions
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Tube_Wing',
+                                             'Supporting_Functions'])
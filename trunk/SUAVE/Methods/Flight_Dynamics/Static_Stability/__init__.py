@@ -1,5 +1,7 @@
 ## @defgroup Methods-Flight_Dynamics-Static_Stability Static_Stability
 # @ingroup Methods-Flight_Dynamics
 
-from . import Approximations
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Approximations'])
 from .compute_aero_derivatives import compute_aero_derivatives
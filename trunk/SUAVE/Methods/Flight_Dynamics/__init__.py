@@ -2,5 +2,7 @@
 # Description
 # @ingroup Methods
 
-from . import Static_Stability
-from . import Dynamic_Stability
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Static_Stability',
+                                             'Dynamic_Stability'])
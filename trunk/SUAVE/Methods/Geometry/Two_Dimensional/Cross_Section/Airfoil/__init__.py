@@ -7,4 +7,5 @@ from .compute_airfoil_properties  import compute_airfoil_properties
 from .import_airfoil_dat          import import_airfoil_dat
 from .import_airfoil_geometry     import import_airfoil_geometry 
 from .import_airfoil_polars       import import_airfoil_polars
-from .convert_airfoil_to_meshgrid import convert_airfoil_to_meshgrid
\ No newline at end of file
+from .convert_airfoil_to_meshgrid import convert_airfoil_to_meshgrid
+from .airfoil_cache               import set_airfoil_cache_directory, clear_airfoil_cache
\ No newline at end of file
@@ -0,0 +1,185 @@
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+# airfoil_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data, hash_data
+from SUAVE.Input_Output.SUAVE import archive_binary, load_binary
+from collections import OrderedDict
+import numpy as np
+import hashlib
+import shutil
+import copy
+import os
+
+# the version of the cached data, changed when the functions that compute it change
+cache_version = 1
+
+# directory of the binary cache shared between processes, None to keep the cache in memory
+cache_settings = {'directory':os.environ.get('SUAVE_AIRFOIL_CACHE')}
+
+# airfoil data of this process, by key, of which the most recently used are kept
+airfoil_data_cache      = OrderedDict()
+airfoil_data_cache_size = 32
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def set_airfoil_cache_directory(directory):
+    """Sets the directory of the binary cache of airfoil geometries and polars, which is
+    shared by every process that uses the same directory.
+
+    Assumptions:
+    The directory defaults to the SUAVE_AIRFOIL_CACHE environment variable. Without a
+    directory the airfoil data is only cached in the memory of this process.
+
+    Source:
+    None
+
+    Inputs:
+    directory   <string> or None
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    cache_settings['directory'] = directory
+    airfoil_data_cache.clear()
+
+    return
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def clear_airfoil_cache(remove_files=False):
+    """Empties the cache of airfoil geometries and polars of this process, and optionally
+    the binary cache directory.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    remove_files   <boolean> - also remove the entries of the cache directory
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    airfoil_data_cache.clear()
+
+    directory = cache_settings['directory']
+    if remove_files and directory is not None and os.path.isdir(directory):
+        for name in os.listdir(directory):
+            shutil.rmtree(os.path.join(directory,name),ignore_errors=True)
+
+    return
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def hash_airfoil_file(filename):
+    """Hashes the content of an airfoil geometry or polar file, so that a cache entry
+    is replaced as soon as the file changes.
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs:
+    filename    <string>
+
+    Outputs:
+    key         <string>
+
+    Properties Used:
+    N/A
+    """
+    with open(filename,'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def cached_airfoil_data(name,inputs,compute):
+    """Returns airfoil data from the cache, or computes and stores it.
+
+    Assumptions:
+    The key of an entry is a hash of the inputs, which hold the content hashes of the
+    files that are read. Entries of the cache directory are binary archives, whose arrays
+    are memory-mapped copy on write: processes share the pages of the file, and changes
+    to the arrays that are returned stay private. An entry is written under a temporary
+    name and renamed, so processes that compute the same entry at once do not clash.
+    Without a directory, only the last airfoil_data_cache_size entries that were used are
+    kept in memory.
+
+    Source:
+    None
+
+    Inputs:
+    name        <string> - name of the data, the start of the key
+    inputs      list of the inputs the data depends on
+    compute     function that computes the data
+
+    Outputs:
+    data        <data_structure>
+
+    Properties Used:
+    N/A
+    """
+    key       = name + '_' + hash_data([cache_version,inputs])
+    directory = cache_settings['directory']
+
+    if directory is None:
+        if key not in airfoil_data_cache:
+            airfoil_data_cache[key] = compute()
+        airfoil_data_cache.move_to_end(key)
+        while len(airfoil_data_cache) > airfoil_data_cache_size:
+            airfoil_data_cache.popitem(last=False)
+        return copy.deepcopy(airfoil_data_cache[key])
+
+    path = os.path.join(directory,key)
+    if not os.path.exists(os.path.join(path,'index.json')):
+        data      = compute()
+        temporary = path + '.%d.tmp' % os.getpid()
+        archive_binary(data,temporary)
+        try:
+            os.rename(temporary,path)
+        except OSError:
+            # another process stored the entry first
+            shutil.rmtree(temporary,ignore_errors=True)
+
+    return to_data_r(load_binary(path,mmap_mode='c'))
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def to_data_r(data):
+    """Converts a loaded binary archive to the Data structures that were archived.
+
+    Assumptions:
+    Memory-mapped arrays are returned as ndarray views of the mapping.
+
+    Source:
+    None
+
+    Inputs:
+    data        <data_structure>
+
+    Outputs:
+    data        <data_structure>
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(data,np.memmap):
+        return data.view(np.ndarray)
+    if not isinstance(data,dict):
+        return data
+
+    ret = Data()
+    for k, v in data.items():
+        ret[k] = to_data_r(v)
+
+    return ret
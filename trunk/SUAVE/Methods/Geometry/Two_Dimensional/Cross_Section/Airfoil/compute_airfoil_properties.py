@@ -6,6 +6,7 @@
 #           Jan 2021, E. Botero
 #           Jan 2021, R. Erhard
 #           Nov 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,6 +19,7 @@ from SUAVE.Methods.Aerodynamics.AERODAS.post_stall_coefficients
 from SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis                    import airfoil_analysis
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_polars  import import_airfoil_polars 
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series   import compute_naca_4series   
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache          import cached_airfoil_data, hash_airfoil_file
 import numpy as np
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
@@ -27,6 +29,62 @@ def compute_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_
     obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
     are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
     
+    Assumptions:
+        The properties are cached by the airfoil geometry and the content of the polar files,
+        see cached_airfoil_data
+        
+    Source
+        None
+        
+    Inputs:
+    airfoil_geometry                        <data_structure>
+    airfoil_polar_files                     <string>
+    boundary_layer_files                    <string>
+    use_pre_stall_data                      [Boolean]
+    Outputs:
+    airfoil_data.
+        cl_polars                           [unitless]
+        cd_polars                           [unitless]      
+        aoa_sweep                           [unitless]
+        
+        # raw data                          [unitless]
+        theta_lower_surface                 [unitless]
+        delta_lower_surface                 [unitless]
+        delta_star_lower_surface            [unitless] 
+        sa_lower_surface                    [unitless]
+        ue_lower_surface                    [unitless]
+        cf_lower_surface                    [unitless]
+        dcp_dx_lower_surface                [unitless] 
+        Ret_lower_surface                   [unitless]
+        H_lower_surface                     [unitless]
+        theta_upper_surface                 [unitless]
+        delta_upper_surface                 [unitless]
+        delta_star_upper_surface            [unitless] 
+        sa_upper_surface                    [unitless]
+        ue_upper_surface                    [unitless]
+        cf_upper_surface                    [unitless]
+        dcp_dx_upper_surface                [unitless] 
+        Ret_upper_surface                   [unitless]
+        H_upper_surface                     [unitless] 
+    
+    Properties Used:
+    N/A
+    """     
+    if airfoil_polar_files != None:
+        polar_keys = [hash_airfoil_file(polar_file) for polar_file in airfoil_polar_files]
+    else:
+        polar_keys = None
+    inputs = [airfoil_geometry,polar_keys,use_pre_stall_data]
+    
+    return cached_airfoil_data('properties',inputs,lambda: compute_extended_airfoil_properties(airfoil_geometry,airfoil_polar_files,use_pre_stall_data))
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def compute_extended_airfoil_properties(airfoil_geometry, airfoil_polar_files = None,use_pre_stall_data=True):
+    """This computes the aerodynamic properties and coefficients of an airfoil in stall regimes using pre-stall
+    characterstics and AERODAS formation for post stall characteristics. This is useful for 
+    obtaining a more accurate prediction of wing and blade loading as well as aeroacoustics. Pre stall characteristics 
+    are obtained in the form of a text file of airfoil polar data obtained from airfoiltools.com
+    
     Assumptions:
         None 
         
@@ -11,11 +11,13 @@
 #           May 2021, R. Erhard
 #           Jun 2021, E. Botero
 #           Aug 2021, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ---------------------------------------------------------------------- 
 from SUAVE.Core import Data  
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache import cached_airfoil_data, hash_airfoil_file
 import numpy as np
 from scipy import interpolate
 
@@ -25,6 +27,39 @@ def import_airfoil_geometry(airfoil_geometry_file, npoints = 200,surface_interpo
     the coordinates of upper and lower surfaces as well as the mean
     camberline
     
+    Assumptions:
+    Works for Selig and Lednicer airfoil formats. Automatically detects which format based off first line of data. Assumes it is one of those two.
+    The geometry is cached by the content of the file, see cached_airfoil_data
+    Source:
+    airfoiltools.com/airfoil/index - method for determining format and basic error checking
+    Inputs:
+    airfoil_geometry_files   <list of strings>
+    surface_interpolation   - type of interpolation used in the SciPy function. Preferable options are linear, quardratic and cubic. 
+    Full list of options can be found here : 
+    https://docs.scipy.org/doc/scipy/reference/generated/scipy.interpolate.interp1d.html#scipy.interpolate.interp1d
+    Outputs:
+    airfoil_data.
+        thickness_to_chord 
+        x_coordinates 
+        y_coordinates
+        x_upper_surface
+        x_lower_surface
+        y_upper_surface
+        y_lower_surface
+        camber_coordinates  
+    Properties Used:
+    N/A
+    """  
+    inputs = [hash_airfoil_file(airfoil_geometry_file),npoints,surface_interpolation]
+    
+    return cached_airfoil_data('geometry',inputs,lambda: read_airfoil_geometry(airfoil_geometry_file,npoints,surface_interpolation))
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def read_airfoil_geometry(airfoil_geometry_file, npoints = 200,surface_interpolation = 'cubic'):
+    """This reads an airfoil geometry from a text file  and store
+    the coordinates of upper and lower surfaces as well as the mean
+    camberline
+    
     Assumptions:
     Works for Selig and Lednicer airfoil formats. Automatically detects which format based off first line of data. Assumes it is one of those two.
     Source:
@@ -6,17 +6,40 @@
 #           Sep 2020, M. Clarke 
 #           May 2021, R. Erhard
 #           Nov 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data, Units 
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.airfoil_cache import cached_airfoil_data, hash_airfoil_file
 import numpy as np
 
 ## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
 def  import_airfoil_polars(airfoil_polar_files,angel_of_attack_discretization = 89):
     """This imports airfoil polars from a text file output from XFOIL or Airfoiltools.com
     
+    Assumptions:
+    Input airfoil polars file is obtained from XFOIL or from Airfoiltools.com
+    The polars are cached by the content of the files, see cached_airfoil_data
+    Source:
+    http://airfoiltools.com/
+    Inputs:
+    airfoil polar files   <list of strings>
+    Outputs:
+    data       numpy array with airfoil data
+    Properties Used:
+    N/A
+    """      
+    
+    inputs = [[hash_airfoil_file(polar_file) for polar_file in airfoil_polar_files],angel_of_attack_discretization]
+    
+    return cached_airfoil_data('polars',inputs,lambda: read_airfoil_polars(airfoil_polar_files,angel_of_attack_discretization))
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def  read_airfoil_polars(airfoil_polar_files,angel_of_attack_discretization = 89):
+    """This reads airfoil polars from a text file output from XFOIL or Airfoiltools.com
+    
     Assumptions:
     Input airfoil polars file is obtained from XFOIL or from Airfoiltools.com
     Source:
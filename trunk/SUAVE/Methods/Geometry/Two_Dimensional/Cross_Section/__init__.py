@@ -1,5 +1,7 @@
 ## @defgroup Methods-Geometry-Two_Dimensional-Cross_Section Cross Section
 # Geometry functions for two dimensional cross sections.
 # @ingroup Methods-Geometry-Two_Dimensional
-from . import Airfoil
-from . import Propulsion
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Airfoil',
+                                             'Propulsion'])
\ No newline at end of file
@@ -1,5 +1,7 @@
 ## @defgroup Methods-Geometry-Two_Dimensional Two Dimensional
 # Geometry functions for two dimensions
 # @ingroup Methods-Geometry
-from . import Cross_Section
-from . import Planform
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Cross_Section',
+                                             'Planform'])
\ No newline at end of file
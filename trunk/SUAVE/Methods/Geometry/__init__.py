@@ -3,5 +3,7 @@
 # belong here.
 # @ingroup Methods
 
-from . import Two_Dimensional
-from . import Three_Dimensional
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Two_Dimensional',
+                                             'Three_Dimensional'])
\ No newline at end of file
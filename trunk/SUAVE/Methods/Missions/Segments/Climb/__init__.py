@@ -2,19 +2,21 @@
 # Climb mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Common
-from . import Constant_Speed_Constant_Rate
-from . import Constant_Mach_Constant_Rate
-from . import Constant_Mach_Constant_Angle
-from . import Linear_Mach_Constant_Rate
-from . import Linear_Speed_Constant_Rate
-from . import Constant_Throttle_Constant_Speed
-from . import Constant_Dynamic_Pressure_Constant_Rate
-from . import Constant_Speed_Constant_Angle
-from . import Constant_Speed_Constant_Angle_Noise
-from . import Constant_EAS_Constant_Rate
-from . import Constant_CAS_Constant_Rate
-from . import Constant_Mach_Linear_Altitude
-from . import Constant_Dynamic_Pressure_Constant_Angle
-from . import Constant_Speed_Linear_Altitude
-from . import Optimized
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Common',
+                                             'Constant_Speed_Constant_Rate',
+                                             'Constant_Mach_Constant_Rate',
+                                             'Constant_Mach_Constant_Angle',
+                                             'Linear_Mach_Constant_Rate',
+                                             'Linear_Speed_Constant_Rate',
+                                             'Constant_Throttle_Constant_Speed',
+                                             'Constant_Dynamic_Pressure_Constant_Rate',
+                                             'Constant_Speed_Constant_Angle',
+                                             'Constant_Speed_Constant_Angle_Noise',
+                                             'Constant_EAS_Constant_Rate',
+                                             'Constant_CAS_Constant_Rate',
+                                             'Constant_Mach_Linear_Altitude',
+                                             'Constant_Dynamic_Pressure_Constant_Angle',
+                                             'Constant_Speed_Linear_Altitude',
+                                             'Optimized'])
\ No newline at end of file
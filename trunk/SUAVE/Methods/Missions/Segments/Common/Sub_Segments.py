@@ -6,15 +6,20 @@
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+import os
+
 from SUAVE.Analyses import Process
-from SUAVE.Core import Data
+from SUAVE.Core import Data, parallel_map, number_of_workers, redirect
 from SUAVE.Methods.skip import skip
+from SUAVE.Methods.Missions.Segments.converge_root import iterate
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -137,6 +142,100 @@ def sequential_sub_segments(segment):
         sub_segment.evaluate()
 
 
+# ----------------------------------------------------------------------
+#  Speculative Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def speculative_sub_segments(segment):
+    
+    """ Pre-solves all the segments of a mission at once from predicted initial
+        states on a process pool, then corrects them one by one
+    
+        Assumptions:
+        The predicted initial state of a segment is the current state of the segment
+        before it, either from the last solve or from the initial guess. The
+        pre-solved unknowns are only used as the starting point of the correction if
+        they give smaller residuals than the current unknowns, and the correction is
+        repeated from the current unknowns if it does not converge.
+        Without more than one process this is the same as sequential_sub_segments.
+        
+        Inputs:
+        segment.settings.number_of_processes [int]
+            
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    tags                = list(segment.segments.keys())
+    number_of_processes = number_of_workers(segment.settings.number_of_processes,len(tags)-1)
+    
+    # the pre-solve has to happen on copies of the segments
+    if number_of_processes < 2:
+        sequential_sub_segments(segment)
+        return
+    
+    # pre-solves from a poor prediction may not converge, keep them quiet
+    def presolve(tag):
+        sub_segment = segment.segments[tag]
+        with redirect.output(os.devnull):
+            sub_segment.evaluate()
+        return sub_segment.state.unknowns.pack_array()
+    
+    predictions = parallel_map(presolve,tags[1:],number_of_processes)
+    
+    for ii,tag in enumerate(tags):
+        sub_segment = segment.segments[tag]
+        guess       = sub_segment.state.unknowns.pack_array()
+        if ii > 0 and warm_start_sub_segment(sub_segment,predictions[ii-1]):
+            sub_segment.evaluate()
+            if sub_segment.state.numerics.converged is not False:
+                continue
+            sub_segment.state.unknowns.unpack_array(guess)
+        sub_segment.evaluate()
+
+
+## @ingroup Methods-Missions-Segments-Common
+def warm_start_sub_segment(segment,unknowns):
+    
+    """ Replaces the unknowns of a segment with a predicted set if the prediction
+        is closer to the solution at the current initial state
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        unknowns                 [array]
+            
+        Outputs:
+        segment.state.unknowns   [Data]
+        used                     [bool]
+
+        Properties Used:
+        N/A
+                                
+    """           
+    
+    current = segment.state.unknowns.pack_array()
+    if len(current) != len(unknowns):
+        return False
+    
+    segment.process.initialize(segment)
+    
+    current_residual   = np.linalg.norm(iterate(current,segment))
+    predicted_residual = np.linalg.norm(iterate(unknowns,segment))
+    
+    used = predicted_residual < current_residual
+    if not used:
+        segment.state.unknowns.unpack_array(current)
+        
+    return used
+
+
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
 # ----------------------------------------------------------------------
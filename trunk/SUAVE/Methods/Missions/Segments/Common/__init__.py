@@ -2,10 +2,12 @@
 # Climb mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Sub_Segments
-from . import Aerodynamics
-from . import Energy
-from . import Noise 
-from . import Frames
-from . import Numerics
-from . import Weights
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Sub_Segments',
+                                             'Aerodynamics',
+                                             'Energy',
+                                             'Noise',
+                                             'Frames',
+                                             'Numerics',
+                                             'Weights'])
@@ -2,14 +2,16 @@
 # Cruise mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Common
-from . import Constant_Mach_Constant_Altitude
-from . import Constant_Speed_Constant_Altitude
-from . import Constant_Mach_Constant_Altitude_Loiter
-from . import Constant_Throttle_Constant_Altitude
-from . import Variable_Cruise_Distance
-from . import Constant_Dynamic_Pressure_Constant_Altitude_Loiter
-from . import Constant_Acceleration_Constant_Altitude
-from . import Constant_Pitch_Rate_Constant_Altitude
-from . import Constant_Dynamic_Pressure_Constant_Altitude
-from . import Constant_Speed_Constant_Altitude_Loiter
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Common',
+                                             'Constant_Mach_Constant_Altitude',
+                                             'Constant_Speed_Constant_Altitude',
+                                             'Constant_Mach_Constant_Altitude_Loiter',
+                                             'Constant_Throttle_Constant_Altitude',
+                                             'Variable_Cruise_Distance',
+                                             'Constant_Dynamic_Pressure_Constant_Altitude_Loiter',
+                                             'Constant_Acceleration_Constant_Altitude',
+                                             'Constant_Pitch_Rate_Constant_Altitude',
+                                             'Constant_Dynamic_Pressure_Constant_Altitude',
+                                             'Constant_Speed_Constant_Altitude_Loiter'])
\ No newline at end of file
@@ -2,9 +2,11 @@
 # Descent mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Constant_Speed_Constant_Rate
-from . import Linear_Mach_Constant_Rate
-from . import Constant_Speed_Constant_Angle
-from . import Constant_Speed_Constant_Angle_Noise
-from . import Constant_EAS_Constant_Rate
-from . import Constant_CAS_Constant_Rate
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Constant_Speed_Constant_Rate',
+                                             'Linear_Mach_Constant_Rate',
+                                             'Constant_Speed_Constant_Angle',
+                                             'Constant_Speed_Constant_Angle_Noise',
+                                             'Constant_EAS_Constant_Rate',
+                                             'Constant_CAS_Constant_Rate'])
\ No newline at end of file
@@ -2,7 +2,9 @@
 # Descent mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Common
-from . import Takeoff
-from . import Landing
-from . import Battery_Charge_Discharge
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Common',
+                                             'Takeoff',
+                                             'Landing',
+                                             'Battery_Charge_Discharge'])
\ No newline at end of file
@@ -2,7 +2,9 @@
 # Hover mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Climb
-from . import Hover
-from . import Common
-from . import Descent
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Climb',
+                                             'Hover',
+                                             'Common',
+                                             'Descent'])
\ No newline at end of file
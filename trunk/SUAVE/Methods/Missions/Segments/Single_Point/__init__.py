@@ -2,6 +2,8 @@
 # Single Point mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Set_Speed_Set_Altitude
-from . import Set_Speed_Set_Throttle
-from . import Set_Speed_Set_Altitude_No_Propulsion
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Set_Speed_Set_Altitude',
+                                             'Set_Speed_Set_Throttle',
+                                             'Set_Speed_Set_Altitude_No_Propulsion'])
\ No newline at end of file
@@ -2,5 +2,7 @@
 # Transition mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
-from . import Constant_Acceleration_Constant_Pitchrate_Constant_Altitude
-from . import Constant_Acceleration_Constant_Angle_Linear_Climb 
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Constant_Acceleration_Constant_Pitchrate_Constant_Altitude',
+                                             'Constant_Acceleration_Constant_Angle_Linear_Climb'])
\ No newline at end of file
@@ -3,14 +3,17 @@
 # @ingroup Methods-Missions
 
 from .converge_root import converge_root
+from .colored_jacobian import colored_jacobian
 from .expand_state  import expand_state
 from .optimize      import converge_opt
 
-from . import Common
-from . import Cruise
-from . import Climb
-from . import Descent
-from . import Ground
-from . import Hover
-from . import Single_Point
-from . import Transition
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Common',
+                                             'Cruise',
+                                             'Climb',
+                                             'Descent',
+                                             'Ground',
+                                             'Hover',
+                                             'Single_Point',
+                                             'Transition'])
\ No newline at end of file
@@ -0,0 +1,255 @@
+## @ingroup Methods-Missions-Segments
+# colored_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#  Colored Jacobian
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def colored_jacobian(unknowns, segment, residuals=None):
+    """Computes the Jacobian of the segment residuals with respect to the unknowns
+    using colored finite differences. Columns of the Jacobian that do not share a
+    nonzero row are perturbed together, so one Jacobian costs one evaluation per
+    color instead of one evaluation per unknown.
+
+    Assumptions:
+    The sparsity pattern is either supplied in state.numerics.jacobian_sparsity or
+    derived from the differentiate and integrate operators of the numerics.
+
+    Source:
+    Curtis, Powell and Reid, "On the estimation of sparse Jacobian matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    unknowns                              [array]
+    segment.state.numerics.step_size      [Unitless]
+    segment.state.numerics.jacobian_sparsity [array]
+    residuals                             [array], residuals at the unknowns if already evaluated
+
+    Outputs:
+    jacobian                              [array]
+
+    Properties Used:
+    N/A
+    """
+
+    from .converge_root import iterate
+
+    numerics = segment.state.numerics
+    colors   = jacobian_coloring(segment,len(unknowns))
+    sparsity = numerics.jacobian_sparsity
+
+    # finite difference step, same scaling as MINPACK
+    epsfcn = numerics.step_size
+    if epsfcn is None:
+        epsfcn = 0.
+    eps = np.sqrt(np.maximum(epsfcn,np.finfo(float).eps))
+    x   = np.array(unknowns,dtype=float)
+    h   = eps*np.abs(x)
+    h[h==0.] = eps
+
+    # evaluate the baseline, unless the root finder already has, and one perturbation per color
+    f0       = iterate(x, segment) if residuals is None else residuals
+    jacobian = np.zeros((len(f0),len(x)))
+    for color in range(np.max(colors)+1):
+        columns     = colors == color
+        dx          = np.zeros_like(x)
+        dx[columns] = h[columns]
+        df          = iterate(x + dx, segment) - f0
+
+        # scatter the differences into the columns of this color
+        mask                = sparsity[:,columns]
+        jacobian[:,columns] = np.where(mask,df[:,None]/h[columns][None,:],0.)
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def jacobian_coloring(segment,n_unknowns):
+    """Finds the coloring of the Jacobian columns of a segment, building it once per
+    segment structure. No residuals are evaluated.
+
+    Assumptions:
+    The sparsity pattern is either supplied in state.numerics.jacobian_sparsity or
+    derived from the differentiate and integrate operators of the numerics.
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.numerics.jacobian_sparsity [array]
+    segment.state.numerics.jacobian_coloring [array]
+    n_unknowns                               [int]
+
+    Outputs:
+    colors                                   [array of ints]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+
+    colors = numerics.jacobian_coloring
+    if colors is None or len(colors) != n_unknowns:
+        sparsity = numerics.jacobian_sparsity
+        if sparsity is None or np.shape(sparsity)[1] != n_unknowns:
+            sparsity = jacobian_sparsity(segment)
+        numerics.jacobian_sparsity = np.asarray(sparsity,dtype=bool)
+        numerics.jacobian_coloring = color_jacobian(sparsity)
+
+    return numerics.jacobian_coloring
+
+## @ingroup Methods-Missions-Segments
+def jacobian_sparsity(segment):
+    """Builds the structural sparsity pattern of the residuals with respect to the
+    unknowns. Each packed entry of a value with one row per control point is
+    associated with its control point. Two control points are coupled if the
+    differentiate or integrate operators of the numerics connect them, directly or
+    through a chain of operators. Entries that are not tied to a control point are
+    assumed to couple to everything.
+
+    Assumptions:
+    Residual i depends on unknown j only if their control points are coupled. If the
+    operators are not set up, all control points are coupled.
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.state.unknowns                                 [Data]
+    segment.state.residuals                                [Data]
+    segment.state.numerics.number_control_points           [int]
+    segment.state.numerics.dimensionless.differentiate     [array]
+    segment.state.numerics.dimensionless.integrate         [array]
+
+    Outputs:
+    sparsity                                               [array of bools]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+    n_cp     = numerics.number_control_points
+
+    # control points connected by an operator, closed over chains of operators
+    operators = [numerics.dimensionless.differentiate,numerics.dimensionless.integrate]
+    if all([np.shape(operator) == (n_cp,n_cp) for operator in operators]):
+        coupling = np.eye(n_cp,dtype=bool)
+        for operator in operators:
+            coupling = coupling | (operator != 0.)
+        while True:
+            chained = np.dot(coupling.astype(int),coupling.astype(int)) > 0
+            if np.array_equal(chained,coupling):
+                break
+            coupling = chained
+    else:
+        coupling = np.ones((n_cp,n_cp),dtype=bool)
+
+    row_points = control_point_index(segment.state.residuals,n_cp)
+    col_points = control_point_index(segment.state.unknowns,n_cp)
+
+    sparsity = coupling[row_points[:,None],col_points[None,:]] | \
+               (row_points[:,None] == -1) | (col_points[None,:] == -1)
+
+    return sparsity
+
+## @ingroup Methods-Missions-Segments
+def control_point_index(data,n_cp):
+    """Finds the control point of every entry of a packed Data vector, following
+    the same ordering as Data.pack_array.
+
+    Assumptions:
+    Values with n_cp rows are indexed by row, everything else returns -1.
+
+    Source:
+    N/A
+
+    Inputs:
+    data      [Data]
+    n_cp      [int]
+
+    Outputs:
+    index     [array of ints]
+
+    Properties Used:
+    N/A
+    """
+
+    valid_types = ( int, float,
+                    array_type,
+                    matrix_type )
+
+    index = []
+
+    def do_index(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_index(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+
+            v = np.atleast_1d(v)
+            if v.ndim > 2: continue
+            if v.ndim == 1:
+                v = v[:,None]
+
+            n,m = v.shape
+            if n == n_cp:
+                index.append(np.tile(np.arange(n),m))
+            else:
+                index.append(-np.ones(n*m,dtype=int))
+
+    do_index(data)
+
+    if index:
+        index = np.hstack(index)
+    else:
+        index = np.array([],dtype=int)
+
+    return index
+
+## @ingroup Methods-Missions-Segments
+def color_jacobian(sparsity):
+    """Groups the columns of a sparse Jacobian so that no two columns of the same
+    group share a nonzero row.
+
+    Assumptions:
+    Greedy coloring in column order
+
+    Source:
+    N/A
+
+    Inputs:
+    sparsity   [array of bools]
+
+    Outputs:
+    colors     [array of ints]
+
+    Properties Used:
+    N/A
+    """
+
+    sparsity  = np.asarray(sparsity,dtype=bool)
+    n_cols    = sparsity.shape[1]
+    conflicts = np.dot(sparsity.T.astype(int),sparsity.astype(int)) > 0
+    colors    = -np.ones(n_cols,dtype=int)
+
+    for j in range(n_cols):
+        used = np.unique(colors[conflicts[j] & (colors >= 0)])
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+
+    return colors
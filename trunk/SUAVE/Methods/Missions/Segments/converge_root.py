@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,9 @@
 import scipy.optimize
 import numpy as np
 
+from SUAVE.Core import Data
 from SUAVE.Core.Arrays import array_type
+from .colored_jacobian import colored_jacobian, jacobian_coloring
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -24,6 +27,14 @@ def converge_root(segment):
     Assumptions:
     N/A
 
+    The Jacobian is set by state.numerics.solver_jacobian:
+    "none"     - the root finder builds it with dense finite differences
+    "colored"  - colored finite differences over the sparsity of the numerics operators,
+                 the same as "none" if the coloring needs a color per unknown
+    function   - a user supplied jacobian(unknowns,segment)
+    If a supplied Jacobian fails to converge the segment is resolved with "none",
+    starting from where the supplied Jacobian stopped.
+
     Source:
     N/A
 
@@ -31,6 +42,7 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string or function]
 
     Outputs:
     state.unknowns                     [Any]
@@ -46,14 +58,59 @@ def converge_root(segment):
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    # remember the last residuals and jacobian, the root finder asks for the jacobian at
+    # unknowns it has just evaluated, and fsolve checks the jacobian at the guess first
+    last = Data()
+    last.unknowns          = None
+    last.residuals         = None
+    last.jacobian_unknowns = None
+    last.jacobian          = None
+    
+    def function(x, segment):
+        last.unknowns  = np.array(x)
+        last.residuals = iterate(x, segment)
+        return last.residuals
+    
+    def reused_jacobian(x, segment):
+        if not np.array_equal(last.jacobian_unknowns,x):
+            residuals              = last.residuals if np.array_equal(last.unknowns,x) else None
+            last.jacobian          = colored_jacobian(x, segment, residuals)
+            last.jacobian_unknowns = np.array(x)
+        return last.jacobian
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    solver_jacobian = segment.state.numerics.solver_jacobian
+    if callable(solver_jacobian):
+        fprime = solver_jacobian
+    elif solver_jacobian == 'colored' and colored_jacobian_pays(segment,unknowns):
+        fprime = reused_jacobian
+    else:
+        fprime = None
+    
+    ier = 0
+    if fprime is not None:
+        solution,infodict,ier,msg = root_finder( function,
+                                             unknowns,
+                                             args = segment,
+                                             fprime = fprime,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             epsfcn = segment.state.numerics.step_size,
+                                             full_output = 1)
+        
+        # the fall back continues from where the supplied jacobian stopped
+        if ier!=1 and np.all(np.isfinite(solution)):
+            unknowns = solution
+    
+    # the dense finite difference jacobian, also the fall back
+    if ier!=1:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             epsfcn = segment.state.numerics.step_size,
+                                             full_output = 1)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -70,6 +127,32 @@ def converge_root(segment):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+## @ingroup Methods-Missions-Segments
+def colored_jacobian_pays(segment,unknowns):
+    """Checks if the colored Jacobian needs fewer evaluations than dense finite differences.
+
+    Assumptions:
+    The dense operators of the Chebyshev and linear numerics couple every control point,
+    so the colored Jacobian only pays with a sparser supplied pattern.
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                            [Data]
+    unknowns                           [array]
+
+    Outputs:
+    pays                               [bool]
+
+    Properties Used:
+    N/A
+    """
+    
+    colors = jacobian_coloring(segment,len(unknowns))
+    
+    return len(colors) > 0 and np.max(colors) + 1 < len(unknowns)
+
 ## @ingroup Methods-Missions-Segments
 def iterate(unknowns, segment):
     
@@ -2,4 +2,6 @@
 # Mission methods contain the functions for setting up and solving a mission.
 # @ingroup Methods
 
-from . import Segments
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Segments'])
\ No newline at end of file
@@ -2,4 +2,6 @@
 # Description
 # @ingroup Methods
 
-from . import lift_equivalent_area
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['lift_equivalent_area'])
\ No newline at end of file
@@ -0,0 +1,193 @@
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+# microphone_geometry.py
+#
+# Created: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ---------------------------------------------------------------------
+import numpy as np
+from scipy.spatial import cKDTree
+from collections import OrderedDict
+
+from SUAVE.Core.Hashing import hash_data
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.generate_microphone_points import generate_ground_microphone_points
+
+# microphone geometries that have been built in this process, keyed by the microphone settings,
+# of which the most recently used are kept
+_microphone_geometries = OrderedDict()
+microphone_geometry_cache_size = 8
+
+# ----------------------------------------------------------------------
+#  Microphone Geometry
+# ---------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def microphone_geometry(settings):
+    """This returns the microphone geometry of a set of noise settings, which is built once
+    per process and shared by every segment and mission with the same microphones.
+
+    Assumptions:
+        The returned geometry is shared and must not be modified. Only the geometries of
+        the last microphone_geometry_cache_size settings that were used are kept.
+
+    Source:
+        N/A
+
+    Inputs:
+        settings.
+          level_ground_microphone_min_x, max_x, min_y, max_y      - extent of the ground grid       [meters]
+          level_ground_microphone_x_resolution, y_resolution      - microphones per axis            [unitless]
+          urban_canyon_microphone_locations                       - building microphones or None    [meters]
+
+    Outputs:
+        geometry   - Microphone_Geometry
+
+    Properties Used:
+        N/A
+    """
+    ground = [settings.level_ground_microphone_min_x,
+              settings.level_ground_microphone_max_x,
+              settings.level_ground_microphone_min_y,
+              settings.level_ground_microphone_max_y,
+              settings.level_ground_microphone_x_resolution,
+              settings.level_ground_microphone_y_resolution]
+    ucml   = settings.urban_canyon_microphone_locations
+    key    = hash_data([ground,ucml])
+
+    if key not in _microphone_geometries:
+        if type(ucml) is not np.ndarray:
+            ucml = None
+        _microphone_geometries[key] = Microphone_Geometry(generate_ground_microphone_points(*ground),ucml)
+    _microphone_geometries.move_to_end(key)
+    while len(_microphone_geometries) > microphone_geometry_cache_size:
+        _microphone_geometries.popitem(last=False)
+
+    return _microphone_geometries[key]
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+class Microphone_Geometry(object):
+    """The ground and building microphones in one contiguous array with a spatial index, which
+    gives the relative locations and angles of every microphone to the aircraft and the
+    microphones that are close enough to a segment to be evaluated.
+
+    Assumptions:
+        Acoustic scattering is not modeled
+
+    Source:
+        N/A
+    """
+
+    def __init__(self,ground_locations,building_locations=None):
+        """This stores the microphones and builds their spatial index.
+
+        Assumptions:
+            None
+
+        Source:
+            N/A
+
+        Inputs:
+            ground_locations     - microphone locations on the ground, (num_gm_mic,3)          [meters]
+            building_locations   - microphone locations on buildings, (num_b_mic,3) or None    [meters]
+
+        Outputs:
+            None
+
+        Properties Used:
+            N/A
+        """
+        if building_locations is None:
+            building_locations = np.empty((0,3))
+
+        self.ground_locations            = np.array(ground_locations,dtype=float)
+        self.building_locations          = np.array(building_locations,dtype=float)
+        self.locations                   = np.ascontiguousarray(np.concatenate((self.ground_locations,self.building_locations),axis=0))
+        self.number_ground_microphones   = len(self.ground_locations)
+        self.number_building_microphones = len(self.building_locations)
+        self.number_of_microphones       = len(self.locations)
+        self.tree                        = cKDTree(self.locations) if self.number_of_microphones > 0 else None
+
+        for array in (self.ground_locations,self.building_locations,self.locations):
+            array.flags.writeable = False
+
+    def relative_locations(self,position_vector):
+        """This computes the vectors from every microphone to the aircraft and their angles.
+
+        Assumptions:
+            None
+
+        Source:
+            N/A
+
+        Inputs:
+            position_vector    - inertial position of the aircraft, (ctrl_pts,3)             [meters]
+
+        Outputs:
+            THETA      - angle measured from microphone in the x-z plane from microphone to aircraft
+            PHI        - angle measured from microphone in the y-z plane from microphone to aircraft
+            ML         - microphone to aircraft vectors, (ctrl_pts,num_mic,3)               [meters]
+
+        Properties Used:
+            N/A
+        """
+        ML         = aircraft_locations(position_vector)[:,None,:] - self.locations[None,:,:]
+        THETA      = np.arctan(ML[:,:,2]/ML[:,:,0])
+        PHI        = np.arctan(ML[:,:,2]/ML[:,:,1])
+
+        return THETA, PHI, ML
+
+    def audible_microphones(self,position_vector,distance):
+        """This finds the microphones within a distance of the flight path of a segment.
+
+        Assumptions:
+            The flight path is a straight line between control points, so the distance is
+            extended by half of the longest step between them.
+
+        Source:
+            N/A
+
+        Inputs:
+            position_vector    - inertial position of the aircraft, (ctrl_pts,3)             [meters]
+            distance           - audibility distance, None for all microphones              [meters]
+
+        Outputs:
+            indices    - sorted indices of the microphones within the distance              [unitless]
+
+        Properties Used:
+            N/A
+        """
+        if distance is None or self.tree is None:
+            return np.arange(self.number_of_microphones)
+
+        aircraft = aircraft_locations(position_vector)
+        steps    = np.linalg.norm(np.diff(aircraft,axis=0),axis=1)
+        radius   = distance + (0.5*np.max(steps) if len(steps) > 0 else 0.)
+        nearby   = self.tree.query_ball_point(aircraft,radius)
+
+        return np.unique(np.concatenate([np.array(idx,dtype=int) for idx in nearby]))
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def aircraft_locations(position_vector):
+    """This converts the inertial position of the aircraft to the frame of the microphones, with
+    z pointing up.
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        position_vector    - inertial position of the aircraft, (ctrl_pts,3)                 [meters]
+
+    Outputs:
+        aircraft           - aircraft location, (ctrl_pts,3)                                [meters]
+
+    Properties Used:
+        N/A
+    """
+    aircraft        = np.array(position_vector,dtype=float)
+    aircraft[:,2]   = -aircraft[:,2]
+
+    return aircraft
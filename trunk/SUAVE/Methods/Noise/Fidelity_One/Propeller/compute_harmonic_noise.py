@@ -4,6 +4,7 @@
 # Created:  Mar 2021, M. Clarke
 # Modified: Jul 2021, E. Botero
 #           Feb 2022, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -25,7 +26,8 @@ def compute_harmonic_noise(harmonics,freestream,angle_of_attack,position_vector,
     in the frequency domain
 
     Assumptions:
-    Compactness of thrust and torque along blade radius from root to tip
+    Compactness of thrust and torque along blade radius from root to tip. The microphones are
+    evaluated in blocks that fit the memory budget of the settings.
 
     Source:
     1) Hanson, Donald B. "Helicoidal surface theory for harmonic noise of rotors in the far field."
@@ -44,6 +46,7 @@ def compute_harmonic_noise(harmonics,freestream,angle_of_attack,position_vector,
         rotors                        - data structure of rotors                                                   [None]
         aeroacoustic_data             - data structure of acoustic data                                            [None]
         settings                      - accoustic settings                                                         [None] 
+            harmonic_noise_memory_budget - bytes for a block of microphones, None for all at once                 [bytes]
         res                           - results data structure                                                     [None] 
 
     Outputs 
@@ -71,80 +74,168 @@ def compute_harmonic_noise(harmonics,freestream,angle_of_attack,position_vector,
     # ----------------------------------------------------------------------------------
     # Rotational Noise  Thickness and Loading Noise
     # ----------------------------------------------------------------------------------  
-    # [control point ,microphones, rotors, radial distribution, harmonics]  
-    m              = np.tile(harmonics[None,None,None,None,:],(num_cpt,num_mic,num_rot,num_r,1))                 # harmonic number 
+    # [control point ,microphones, rotors, radial distribution, harmonics], every term is kept at
+    # the shape it depends on and broadcast against the others
+    m              = harmonics[None,None,None,None,:]                                                            # harmonic number 
     m_1d           = harmonics                                                                                         
     p_ref          = 2E-5                                                                                        # referece atmospheric pressure
-    a              = np.tile(freestream.speed_of_sound[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))      # speed of sound
-    rho            = np.tile(freestream.density[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))             # air density   
-    alpha          = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))           
-    x              = np.tile(position_vector[:,:,:,0][:,:,:,None,None],(1,1,1,num_r,num_h))                      # x component of position vector of rotor to microphone 
-    y              = np.tile(position_vector[:,:,:,1][:,:,:,None,None],(1,1,1,num_r,num_h))                      # y component of position vector of rotor to microphone
-    z              = np.tile(position_vector[:,:,:,2][:,:,:,None,None],(1,1,1,num_r,num_h))                      # z component of position vector of rotor to microphone
-    Vx             = np.tile(velocity_vector[:,0][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # x velocity of rotor  
-    Vy             = np.tile(velocity_vector[:,1][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # y velocity of rotor 
-    Vz             = np.tile(velocity_vector[:,2][:,None,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # z velocity of rotor 
+    a              = freestream.speed_of_sound[:,:,None,None,None]                                               # speed of sound
+    rho            = freestream.density[:,:,None,None,None]                                                      # air density   
+    alpha          = (angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None]           
+    Vx             = velocity_vector[:,0][:,None,None,None,None]                                                 # x velocity of rotor  
+    Vy             = velocity_vector[:,1][:,None,None,None,None]                                                 # y velocity of rotor 
+    Vz             = velocity_vector[:,2][:,None,None,None,None]                                                 # z velocity of rotor 
     B              = rotor.number_of_blades                                                                      # number of rotor blades
-    omega          = np.tile(aeroacoustic_data.omega[:,:,None,None,None],(1,num_mic,num_rot,num_r,num_h))        # angular velocity       
-    dT_dr          = np.tile(aeroacoustic_data.blade_dT_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))      # nondimensionalized differential thrust distribution 
-    dQ_dr          = np.tile(aeroacoustic_data.blade_dQ_dr[:,None,None,:,None],(1,num_mic,num_rot,1,num_h))      # nondimensionalized differential torque distribution
-    R              = np.tile(rotor.radius_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # radial location     
-    c              = np.tile(rotor.chord_distribution[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h))  # blade chord    
+    omega          = aeroacoustic_data.omega[:,:,None,None,None]                                                 # angular velocity       
+    dT_dr          = aeroacoustic_data.blade_dT_dr[:,None,None,:,None]                                           # nondimensionalized differential thrust distribution 
+    dQ_dr          = aeroacoustic_data.blade_dQ_dr[:,None,None,:,None]                                           # nondimensionalized differential torque distribution
+    R              = rotor.radius_distribution[None,None,None,:,None]                                            # radial location     
+    c              = rotor.chord_distribution[None,None,None,:,None]                                             # blade chord    
     R_tip          = rotor.tip_radius                                                     
-    t_c            = np.tile(rotor.thickness_to_chord[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h))  # thickness to chord ratio
-    MCA            = np.tile(rotor.mid_chord_alignment[None,None,None,:,None],(num_cpt,num_mic,num_rot,1,num_h)) # Mid Chord Alighment  
-    res.f          = B*omega*m/(2*np.pi) 
+    t_c            = rotor.thickness_to_chord[None,None,None,:,None]                                             # thickness to chord ratio
+    MCA            = rotor.mid_chord_alignment[None,None,None,:,None]                                            # Mid Chord Alighment  
+    res.f          = np.broadcast_to(B*omega*m/(2*np.pi),(num_cpt,num_mic,num_rot,num_r,num_h)) 
     D              = 2*R[0,0,0,-1,:]                                                                             # rotor diameter    
     r              = R/R[0,0,0,-1,:]                                                                             # non dimensional radius distribution  
-    S              = np.sqrt(x**2 + y**2 + z**2)                                                                 # distance between rotor and the observer    
-    theta          = np.arccos(x/S)                                                            
-    Y              = np.sqrt(y**2 + z**2)                                                                        # observer distance from rotor axis          
     V              = np.sqrt(Vx**2 + Vy**2 + Vz**2)                                                              # velocity magnitude
     M_x            = V/a                                                                                         
     V_tip          = R_tip*omega                                                                                 # blade_tip_speed 
     M_t            = V_tip/a                                                                                     # tip Mach number 
     M_r            = np.sqrt(M_x**2 + (r**2)*(M_t**2))                                                           # section relative Mach number     
     B_D            = c/D                                                                                         
-    phi            = np.arctan(z/y)                                                                              # tangential angle   
-
-    # retarted  theta angle in the retarded reference frame
-    theta_r        = np.arccos(np.cos(theta)*np.sqrt(1 - (M_x**2)*(np.sin(theta))**2) + M_x*(np.sin(theta))**2 )   
-    theta_r_prime  = np.arccos(np.cos(theta_r)*np.cos(alpha) + np.sin(theta_r)*np.sin(phi)*np.sin(alpha) )
-
-    # initialize thickness and loading noise matrices
-    psi_L          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
-    psi_V          = np.zeros((num_cpt,num_mic,num_rot,num_r,num_h))
-
-    # normalized thickness  and loading shape functions                
-    k_x               = ((2*m*B*B_D*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))      # wave number 
-    psi_V[:,:,:,0,:]  = 2/3   
-    psi_L[:,:,:,0,:]  = 1     
-    psi_V[:,:,:,1:,:] = (8/(k_x[:,:,:,1:,:]**2))*((2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:]) - np.cos(0.5*k_x[:,:,:,1:,:]))    
-    psi_L[:,:,:,1:,:] = (2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:])                  
-
-    # sound pressure for thickness noise   
-    Jmb               = jv(m*B,((m*B*r*M_t*np.sin(theta_r_prime))/(1 - M_x*np.cos(theta_r))))  
-    phi_s             = ((2*m*B*M_t)/(M_r*(1 - M_x*np.cos(theta_r))))*(MCA/D)
-    phi_prime_var     = (np.sin(theta_r)/np.sin(theta_r_prime))*np.cos(phi)
-    phi_prime_var[phi_prime_var>1.0] = 1.0
-    phi_prime         = np.arccos(phi_prime_var)      
-    S_r               = Y/(np.sin(theta_r))                                # distance in retarded reference frame                                                                             
-    exponent_fraction = np.exp(1j*m_1d*B*((omega*S_r/a) +  phi_prime - np.pi/2))/(1 - M_x*np.cos(theta_r))
-    p_mT_H_integral   = -((M_r**2)*(t_c)*np.exp(1j*phi_s)*Jmb*(k_x**2)*psi_V ) * ((rho*(a**2)*B*np.sin(theta_r))/(4*np.sqrt(2)*np.pi*(Y/D)))* exponent_fraction
-    p_mT_H            = np.trapz(p_mT_H_integral,x = r[0,0,0,:,0], axis =3) 
-
-    p_mT_H_abs        = abs(p_mT_H)             
-    p_mL_H_integral   = (((np.cos(theta_r_prime)/(1 - M_x*np.cos(theta_r)))*dT_dr - (1/((r**2)*M_t*R_tip))*dQ_dr)
-                         * np.exp(1j*phi_s)*Jmb * psi_L)*(m_1d*B*M_t*np.sin(theta_r)/ (2*np.sqrt(2)*np.pi*Y*R_tip)) *exponent_fraction
-    p_mL_H            = np.trapz(p_mL_H_integral,x = r[0,0,0,:,0], axis = 3 ) 
-    p_mL_H_abs        =  abs(p_mL_H)  
+
+    # terms that do not depend on the observer
+    k_x_num        = 2*m*B*B_D*M_t
+    phi_s_num      = 2*m*B*M_t
+    Jmb_num        = m*B*r*M_t
+    dQ_dr_term     = (1/((r**2)*M_t*R_tip))*dQ_dr
+    
+    SPL_bpf        = np.zeros((num_cpt,num_mic,num_rot,num_h))
+    mic_block      = harmonic_noise_microphone_block_size(settings.get('harmonic_noise_memory_budget',None),num_cpt,num_mic,num_rot,num_r,num_h)
+    
+    for m0 in range(0,num_mic,mic_block):
+        mics = slice(m0,min(m0+mic_block,num_mic))
+        
+        x              = position_vector[:,mics,:,0][:,:,:,None,None]                                            # x component of position vector of rotor to microphone 
+        y              = position_vector[:,mics,:,1][:,:,:,None,None]                                            # y component of position vector of rotor to microphone
+        z              = position_vector[:,mics,:,2][:,:,:,None,None]                                            # z component of position vector of rotor to microphone
+        S              = np.sqrt(x**2 + y**2 + z**2)                                                             # distance between rotor and the observer    
+        theta          = np.arccos(x/S)                                                            
+        Y              = np.sqrt(y**2 + z**2)                                                                    # observer distance from rotor axis          
+        phi            = np.arctan(z/y)                                                                          # tangential angle   
+    
+        # retarted  theta angle in the retarded reference frame
+        theta_r        = np.arccos(np.cos(theta)*np.sqrt(1 - (M_x**2)*(np.sin(theta))**2) + M_x*(np.sin(theta))**2 )   
+        theta_r_prime  = np.arccos(np.cos(theta_r)*np.cos(alpha) + np.sin(theta_r)*np.sin(phi)*np.sin(alpha) )
+        doppler        = 1 - M_x*np.cos(theta_r)
+    
+        # normalized thickness  and loading shape functions                
+        k_x               = (k_x_num/(M_r*doppler))                                # wave number 
+        shape             = k_x.shape
+        psi_V             = np.zeros(shape)
+        psi_L             = np.zeros(shape)
+        psi_V[:,:,:,0,:]  = 2/3   
+        psi_L[:,:,:,0,:]  = 1     
+        psi_V[:,:,:,1:,:] = (8/(k_x[:,:,:,1:,:]**2))*((2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:]) - np.cos(0.5*k_x[:,:,:,1:,:]))    
+        psi_L[:,:,:,1:,:] = (2/k_x[:,:,:,1:,:])*np.sin(0.5*k_x[:,:,:,1:,:])                  
+    
+        # sound pressure for thickness noise   
+        Jmb               = retarded_bessel_terms(m*B,Jmb_num,M_t,np.sin(theta_r_prime),doppler,shape)
+        phi_s             = (phi_s_num/(M_r*doppler))*(MCA/D)
+        exp_phi_s         = np.exp(1j*phi_s)
+        phi_prime_var     = (np.sin(theta_r)/np.sin(theta_r_prime))*np.cos(phi)
+        phi_prime_var[phi_prime_var>1.0] = 1.0
+        phi_prime         = np.arccos(phi_prime_var)      
+        S_r               = Y/(np.sin(theta_r))                                # distance in retarded reference frame                                                                             
+        exponent_fraction = np.exp(1j*m_1d*B*((omega*S_r/a) +  phi_prime - np.pi/2))/doppler
+        p_mT_H_integral   = -((M_r**2)*(t_c)*exp_phi_s*Jmb*(k_x**2)*psi_V ) * ((rho*(a**2)*B*np.sin(theta_r))/(4*np.sqrt(2)*np.pi*(Y/D)))* exponent_fraction
+        p_mT_H            = np.trapz(p_mT_H_integral,x = r[0,0,0,:,0], axis =3) 
+        p_mT_H_abs        = abs(p_mT_H)             
+        del p_mT_H_integral
+        
+        p_mL_H_integral   = (((np.cos(theta_r_prime)/doppler)*dT_dr - dQ_dr_term)
+                             * exp_phi_s*Jmb * psi_L)*(m_1d*B*M_t*np.sin(theta_r)/ (2*np.sqrt(2)*np.pi*Y*R_tip)) *exponent_fraction
+        p_mL_H            = np.trapz(p_mL_H_integral,x = r[0,0,0,:,0], axis = 3 ) 
+        p_mL_H_abs        =  abs(p_mL_H)  
+
+        SPL_bpf[:,mics]   = 20*np.log10((abs(p_mL_H_abs + p_mT_H_abs))/p_ref) 
 
     # sound pressure levels  
-    res.SPL_prop_harmonic_bpf_spectrum     = 20*np.log10((abs(p_mL_H_abs + p_mT_H_abs))/p_ref) 
+    res.SPL_prop_harmonic_bpf_spectrum     = SPL_bpf
     res.SPL_prop_harmonic_bpf_spectrum_dBA = A_weighting(res.SPL_prop_harmonic_bpf_spectrum,res.f[:,:,:,0,:]) 
     res.SPL_prop_harmonic_1_3_spectrum     = SPL_harmonic_to_third_octave(res.SPL_prop_harmonic_bpf_spectrum,res.f[:,0,0,0,:],settings)         
     res.SPL_prop_harmonic_1_3_spectrum_dBA = SPL_harmonic_to_third_octave(res.SPL_prop_harmonic_bpf_spectrum_dBA,res.f[:,0,0,0,:],settings)  
     res.SPL_prop_harmonic_1_3_spectrum[np.isinf(res.SPL_prop_harmonic_1_3_spectrum)]         = 0
     res.SPL_prop_harmonic_1_3_spectrum_dBA[np.isinf(res.SPL_prop_harmonic_1_3_spectrum_dBA)] = 0
 
-    return
\ No newline at end of file
+    return
+
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def retarded_bessel_terms(order,Jmb_num,M_t,sin_theta_r_prime,doppler,shape):
+    '''This computes the Bessel function of the thickness and loading noise once for every
+    distinct tip Mach number and observer angle, and copies it to the control points and 
+    observers that share them
+
+    Assumptions:
+    The argument of the Bessel function only depends on the control point through the tip
+    Mach number and on the observer through the retarded angles. Control points of a steady
+    segment and observers at the same angles get the same values.
+
+    Source:
+    None
+
+    Inputs: 
+        order                         - Bessel order m*B, (1,1,1,1,harmonics)                                      [Unitless]
+        Jmb_num                       - m*B*r*M_t, (control points,1,1,radial,harmonics)                          [Unitless]
+        M_t                           - tip Mach number, (control points,1,1,1,1)                                  [Unitless]
+        sin_theta_r_prime             - sine of the retarded angle, (control points,microphones,rotors,1,1)       [Unitless]
+        doppler                       - Doppler factor 1 - M_x cos(theta_r), same shape as sin_theta_r_prime      [Unitless]
+        shape                         - shape of the result                                                        [Unitless]
+
+    Outputs 
+        Jmb                           - Bessel function, of the shape                                              [Unitless]
+
+    Properties Used:
+        N/A   
+    '''
+    num_cpt, num_mic, num_rot = np.shape(doppler)[:3]
+    tip_mach = np.broadcast_to(M_t[:,:,:,0,0],(num_cpt,num_mic,num_rot))
+    keys     = np.stack([tip_mach.ravel(),sin_theta_r_prime.ravel(),doppler.ravel()],axis=1)
+    unique, first, inverse = np.unique(keys,axis=0,return_index=True,return_inverse=True)
+
+    if len(unique) == len(keys):
+        return jv(order,((Jmb_num*sin_theta_r_prime)/doppler))
+
+    cpts     = first // (num_mic*num_rot)
+    Jmb_uniq = jv(order[0,0],((Jmb_num[cpts,0,0]*unique[:,1,None,None])/unique[:,2,None,None]))
+    
+    return Jmb_uniq[inverse.ravel()].reshape(shape)
+
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def harmonic_noise_microphone_block_size(memory_budget,num_cpt,num_mic,num_rot,num_r,num_h):
+    '''This finds how many microphones the harmonic noise can be computed for at once within a
+    memory budget
+
+    Assumptions:
+    About 16 double precision temporaries per control point, microphone, rotor, radial station
+    and harmonic, counting complex temporaries twice
+
+    Source:
+    None
+
+    Inputs: 
+        memory_budget                 - None for all microphones at once                                           [bytes]
+        num_cpt, num_mic, num_rot, num_r, num_h                                                                     [Unitless]
+
+    Outputs 
+        mic_block                     - microphones per block                                                      [Unitless]
+
+    Properties Used:
+        N/A   
+    '''
+    if memory_budget is None:
+        return max(num_mic,1)
+
+    bytes_per_mic = 16*num_cpt*num_rot*num_r*num_h*8 
+    
+    return min(max(int(memory_budget // bytes_per_mic),1),max(num_mic,1))
@@ -0,0 +1,105 @@
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+# propeller_noise_tiles.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data, parallel_imap
+from SUAVE.Components.Physical_Component import Container
+from SUAVE.Methods.Noise.Fidelity_One.Propeller.propeller_mid_fidelity import propeller_mid_fidelity
+
+import numpy as np
+
+# -------------------------------------------------------------------------------------
+#  Rotor Noise in Microphone Tiles
+# -------------------------------------------------------------------------------------
+## @ingroup Methods-Noise-Fidelity_One-Propeller
+def propeller_noise_tiles(rotors,acoustic_data,identical_rotors,segment,settings,microphone_indices=None):
+    ''' This computes the sound pressure level and the 1/3 octave band spectrum of the rotors
+    of a network at every microphone. The microphones are split in tiles that are evaluated
+    on a pool of processes, and the rotors are added up as the tiles finish, so that only one
+    tile of the mid-fidelity noise model is in memory per process.
+
+    Assumptions:
+    The noise at a microphone does not depend on the other microphones. Identical rotors use
+    the acoustic data of the first rotor. Non-identical rotors are evaluated one at a time with
+    the rotors before them, as in the serial evaluation, and their pressure ratios are summed.
+    Microphones that are not evaluated are left at zero.
+
+    Source:
+    None
+
+    Inputs:
+        rotors                  - data structure of rotors                            [None]
+        acoustic_data           - acoustic data of every rotor                        [None]
+        identical_rotors        - rotors share the acoustic data of the first rotor   [Boolean]
+        segment                 - flight segment data structure                       [None]
+        settings                - accoustic settings                                  [None]
+            microphone_tile_size    - microphones per tile, None for a single tile    [Unitless]
+            number_of_processes     - processes evaluating the tiles                  [Unitless]
+        microphone_indices      - microphones to evaluate, None for all of them       [Unitless]
+
+    Outputs:
+        Results.
+            SPL_dBA             - dbA-Weighted SPL, (control points, microphones)     [dBA]
+            SPL_1_3_spectrum    - 1/3 octave band spectrum of SPL,
+                                  (control points, microphones, center frequencies)   [dB]
+
+    Properties Used:
+        N/A
+    '''
+
+    # unpack
+    conditions           = segment.state.conditions
+    microphone_locations = conditions.noise.total_microphone_locations
+    ctrl_pts             = len(conditions.frames.inertial.velocity_vector)
+    num_mic              = len(microphone_locations[0,:,0])
+    num_cf               = len(settings.center_frequencies)
+    tile_size            = settings.get('microphone_tile_size',None)
+    if microphone_indices is None:
+        microphone_indices = np.arange(num_mic)
+    if tile_size is None:
+        tile_size = len(microphone_indices)
+    tile_size            = max(int(tile_size),1)
+
+    # every tile of microphones, once for identical rotors or once per rotor otherwise
+    tiles = [microphone_indices[m0:m0+tile_size] for m0 in range(0,len(microphone_indices),tile_size)]
+    if identical_rotors:
+        items = [(tile,None) for tile in tiles]
+    else:
+        items = [(tile,r_idx) for tile in tiles for r_idx in range(len(rotors))]
+
+    def evaluate_tile(item):
+        tile, r_idx = item
+        if r_idx is None:
+            tile_rotors       = rotors
+            aeroacoustic_data = acoustic_data[list(acoustic_data.keys())[0]]
+        else:
+            tile_rotors = Container()
+            for rotor in list(rotors.values())[:r_idx+1]:
+                tile_rotors.append(rotor)
+            aeroacoustic_data = acoustic_data[rotor.tag]
+        noise = propeller_mid_fidelity(tile_rotors,aeroacoustic_data,segment,settings,microphone_locations[:,tile])
+        return noise.SPL_dBA, noise.SPL_1_3_spectrum
+
+    Results                  = Data()
+    Results.SPL_dBA          = np.zeros((ctrl_pts,num_mic))
+    Results.SPL_1_3_spectrum = np.zeros((ctrl_pts,num_mic,num_cf))
+
+    # store or add up the pressure ratios of the tiles as they finish
+    tile_results = parallel_imap(evaluate_tile,items,settings.get('number_of_processes',1))
+    for (tile, r_idx), (SPL_dBA, SPL_1_3_spectrum) in zip(items,tile_results):
+        if r_idx is None:
+            Results.SPL_dBA[:,tile]          = SPL_dBA
+            Results.SPL_1_3_spectrum[:,tile] = SPL_1_3_spectrum
+        else:
+            Results.SPL_dBA[:,tile]          += 10**(SPL_dBA/10)
+            Results.SPL_1_3_spectrum[:,tile] += 10**(SPL_1_3_spectrum/10)
+
+    if not identical_rotors:
+        Results.SPL_dBA[:,microphone_indices]          = 10*np.log10(Results.SPL_dBA[:,microphone_indices])
+        Results.SPL_1_3_spectrum[:,microphone_indices] = 10*np.log10(Results.SPL_1_3_spectrum[:,microphone_indices])
+
+    return Results
@@ -2,7 +2,9 @@
 # Description
 # @ingroup Methods-Noise
 
-from . import Airframe
-from . import Engine
-from . import Propeller
-from . import Noise_Tools
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Airframe',
+                                             'Engine',
+                                             'Propeller',
+                                             'Noise_Tools'])
\ No newline at end of file
@@ -2,6 +2,8 @@
 # Description
 # @ingroup Methods
 
-from . import Fidelity_Zero
-from . import Fidelity_One
-from . import Certification
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Fidelity_Zero',
+                                             'Fidelity_One',
+                                             'Certification'])
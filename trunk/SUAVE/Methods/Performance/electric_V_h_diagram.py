@@ -14,7 +14,6 @@ from SUAVE.Core import Units
 from SUAVE.Methods.Performance.propeller_single_point import propeller_single_point
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Flight Envelope Function
@@ -176,6 +175,7 @@ def electric_V_h_diagram(vehicle,
         speed_space             = np.transpose(speed_space)
         alt_space               = np.transpose(alt_space) / Units.ft
 
+        import matplotlib.pyplot as plt
         # Make Contour Plot of Climb Rates 
         CS = plt.contour(speed_space, alt_space, climb_rate)  
         plt.xlabel('Airspeed (m/s)')
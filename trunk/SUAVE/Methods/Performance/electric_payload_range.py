@@ -11,7 +11,6 @@
 from SUAVE.Core import Units, Data
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 #------------------------------------------------------------------------------
 # Electric Payload Range Function
@@ -119,6 +118,7 @@ def electric_payload_range(vehicle,
 
     if display_plot:
 
+        import matplotlib.pyplot as plt
         plt.plot(R, PLD, 'r')
         plt.xlabel('Range ('+unit+')')
         plt.ylabel('Payload (kg)')
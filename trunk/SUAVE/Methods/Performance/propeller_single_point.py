@@ -13,7 +13,6 @@ import SUAVE
 
 from SUAVE.Core import Data
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 # ------------------------------------------------------------------------------
@@ -142,6 +141,7 @@ def propeller_single_point(prop,
     # ----------------------------------------------------------------------------
 
     if plots:
+        import matplotlib.pyplot as plt
         plt.figure(1)
         plt.plot(r_BEVW, va_BEVW, 'ro-', label='axial BEVW')
         plt.plot(r_BEVW, vt_BEVW, 'bo-', label='tangential BEVW')
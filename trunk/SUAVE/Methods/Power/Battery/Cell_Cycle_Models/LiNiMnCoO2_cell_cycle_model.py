@@ -2,6 +2,7 @@
 # LiNiMnCoO2_cell_cycle_model.py
 # 
 # Created: Sep 2021, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -47,7 +48,7 @@ def compute_NMC_cell_state_variables(battery_data,SOC,T,I):
     I[I<0.0]       = 0.0
     I[I>8.0]       = 8.0   
      
-    pts            = np.hstack((np.hstack((I, T)),DOD  )) # amps, temp, SOC   
-    V_ul           = np.atleast_2d(battery_data.Voltage(pts)[:,1]).T  
+    pts            = np.concatenate((I,T,DOD),axis=1) # amps, temp, SOC   
+    V_ul           = battery_data.Voltage(pts)[:,1,None]  
     
     return V_ul
\ No newline at end of file
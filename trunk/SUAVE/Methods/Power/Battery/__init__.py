@@ -2,10 +2,12 @@
 # Functions pertaining to battery discharge and sizing
 # @ingroup Methods-Power 
 
-from . import Ragone
-from . import Sizing
-from . import Variable_Mass
-from . import Cell_Cycle_Models
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Ragone',
+                                             'Sizing',
+                                             'Variable_Mass',
+                                             'Cell_Cycle_Models'])
 
 # utility funtions 
 from .append_initial_battery_conditions     import append_initial_battery_conditions
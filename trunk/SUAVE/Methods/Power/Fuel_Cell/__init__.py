@@ -1,5 +1,7 @@
 ## @defgroup Methods-Power-Fuel_Cell Fuel_Cell
 # Fuel_Cell methods contain the functions for the fuel cell analyses.
 # @ingroup Methods-Power
-from . import Discharge
-from . import Sizing
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Discharge',
+                                             'Sizing'])
\ No newline at end of file
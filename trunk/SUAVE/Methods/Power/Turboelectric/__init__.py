@@ -1,5 +1,7 @@
 ## @defgroup Methods-Power-Turboelectric Turboelectric
 # Turboelectric methods contain the functions for investigating vehicle electric power supplied by a turboelectric powertrain. Created by modifying existing Fuel_Cell methods.
 # @ingroup Methods-Power
-from . import Discharge
-from . import Sizing
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Discharge',
+                                             'Sizing'])
\ No newline at end of file
@@ -2,6 +2,8 @@
 # Power methods contain the functions for electric systems such as batteries and fuel cells.
 # @ingroup Methods
 
-from . import Battery
-from . import Fuel_Cell
-from . import Turboelectric
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Battery',
+                                             'Fuel_Cell',
+                                             'Turboelectric'])
@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2021, R. Erhard
 # Modified: Jan 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,7 +16,7 @@ import numpy as np
 from scipy.interpolate import interp1d
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def compute_fidelity_one_inflow_velocities( wake, prop ):
+def compute_fidelity_one_inflow_velocities( wake, prop, ctrl_pts_idx=None ):
     """
     Assumptions:
         None
@@ -23,9 +24,10 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
     Source:
         N/A
     Inputs:
-        wake - rotor wake
-        prop - rotor instance
-        WD   - wake vortex distribution
+        wake         - rotor wake
+        prop         - rotor instance
+        WD           - wake vortex distribution
+        ctrl_pts_idx - control points to evaluate, None for all of them
     Outputs:
         Va   - axial velocity, shape (ctrl_pts, Nr, Na); axis 2 in direction of rotation       [m/s]
         Vt   - tangential velocity, shape (ctrl_pts, Nr, Na); axis 2 in direction of rotation    [m/s]
@@ -38,6 +40,9 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
     # use results from prior bevw iteration
     prop_outputs  = prop.outputs
     cpts          = len(prop_outputs.velocity)
+    if ctrl_pts_idx is None:
+        ctrl_pts_idx = np.arange(cpts)
+    n_idx         = len(ctrl_pts_idx)
     Na            = prop.number_azimuthal_stations
     Nr            = len(prop.chord_distribution)
     r             = prop.radius_distribution
@@ -57,57 +62,65 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
     t0       = dt*init_timestep_offset
 
     # set shape of velocitie arrays
-    Va = np.zeros((cpts,Nr,Na))
-    Vt = np.zeros((cpts,Nr,Na))
+    Va = np.zeros((n_idx,Nr,Na))
+    Vt = np.zeros((n_idx,Nr,Na))
     
-    for i in range(Na):
-        # increment blade angle to new azimuthal position 
-        blade_angle   = -rot*(omega[0]*t0 + i*(2*np.pi/(Na)))  # axial view of rotor, negative rotation --> positive blade angle
+    # increment blade angle to new azimuthal position 
+    blade_angle   = -rot*(omega[0]*t0 + np.arange(Na)*(2*np.pi/(Na)))  # axial view of rotor, negative rotation --> positive blade angle
+
+    #----------------------------------------------------------------
+    #Compute the wake-induced velocities at propeller blade
+    #----------------------------------------------------------------
+    #set the evaluation points in the vortex distribution of every azimuthal station: (Na, Nr-1)
+    r    = prop.radius_distribution 
+    Yb   = wake.vortex_distribution.reshaped_wake.Yblades_cp[:,0,0,:,0]
+    Zb   = wake.vortex_distribution.reshaped_wake.Zblades_cp[:,0,0,:,0]
+    Xb   = wake.vortex_distribution.reshaped_wake.Xblades_cp[:,0,0,:,0]
     
-        #----------------------------------------------------------------
-        #Compute the wake-induced velocities at propeller blade
-        #----------------------------------------------------------------
-        #set the evaluation points in the vortex distribution: (ncpts, nblades, Nr, Ntsteps)
-        r    = prop.radius_distribution 
-        Yb   = wake.vortex_distribution.reshaped_wake.Yblades_cp[i,0,0,:,0]
-        Zb   = wake.vortex_distribution.reshaped_wake.Zblades_cp[i,0,0,:,0]
-        Xb   = wake.vortex_distribution.reshaped_wake.Xblades_cp[i,0,0,:,0]
-        
-        VD.YC = (Yb[1:] + Yb[:-1])/2
-        VD.ZC = (Zb[1:] + Zb[:-1])/2
-        VD.XC = (Xb[1:] + Xb[:-1])/2
-         
-        VD.n_cp = np.size(VD.YC)
+    VD.YC = (Yb[:,1:] + Yb[:,:-1])/2
+    VD.ZC = (Zb[:,1:] + Zb[:,:-1])/2
+    VD.XC = (Xb[:,1:] + Xb[:,:-1])/2
+     
+    VD.n_cp = np.shape(VD.YC)[1]
 
-        # Compute induced velocities at blade from the helical fixed wake
-        VD.Wake_collapsed = WD
-        
-        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
-        
-        # velocities in vehicle frame
-        u       = V_ind[:,:,0]   # velocity in vehicle x-frame
-        v       = V_ind[:,:,1]    # velocity in vehicle y-frame
-        w       = V_ind[:,:,2]    # velocity in vehicle z-frame
-        
-        # rotate from vehicle to prop frame:
-        rot_to_prop = prop.vec_to_prop_body()
-        uprop       = u*rot_to_prop[:,0,0][:,None] + w*rot_to_prop[:,0,2][:,None]
-        vprop       = v
-        wprop       = u*rot_to_prop[:,2,0][:,None] + w*rot_to_prop[:,2,2][:,None]     
-        
-        # interpolate to get values at rotor radial stations
-        r_midpts = (r[1:] + r[:-1])/2
-        u_r      = interp1d(r_midpts, uprop, fill_value="extrapolate")
-        v_r      = interp1d(r_midpts, vprop, fill_value="extrapolate")
-        w_r      = interp1d(r_midpts, wprop, fill_value="extrapolate")
-        
-        up = u_r(r)
-        vp = v_r(r)
-        wp = w_r(r)       
+    # Compute induced velocities at blade from the helical fixed wake for all stations at once: (Na, cpts, Nr-1, 3)
+    VD.Wake_collapsed = WD
+    
+    settings = wake.wake_settings
+    V_ind    = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=np.arange(Na), ctrl_pts_idx=ctrl_pts_idx,
+                                             precision           = settings.get('floating_point_precision',np.float64),
+                                             memory_budget       = settings.get('induced_velocity_memory_budget',None),
+                                             far_field_tolerance = settings.get('far_field_tolerance',None))
+    
+    # velocities in vehicle frame
+    u       = V_ind[:,:,:,0]   # velocity in vehicle x-frame
+    v       = V_ind[:,:,:,1]    # velocity in vehicle y-frame
+    w       = V_ind[:,:,:,2]    # velocity in vehicle z-frame
+    
+    # rotate from vehicle to prop frame:
+    rot_to_prop = np.broadcast_to(prop.vec_to_prop_body(),(cpts,3,3))[ctrl_pts_idx]
+    uprop       = u*rot_to_prop[:,0,0][:,None] + w*rot_to_prop[:,0,2][:,None]
+    vprop       = v
+    wprop       = u*rot_to_prop[:,2,0][:,None] + w*rot_to_prop[:,2,2][:,None]     
+    
+    # interpolate to get values at rotor radial stations
+    r_midpts = (r[1:] + r[:-1])/2
+    u_r      = interp1d(r_midpts, uprop, fill_value="extrapolate")
+    v_r      = interp1d(r_midpts, vprop, fill_value="extrapolate")
+    w_r      = interp1d(r_midpts, wprop, fill_value="extrapolate")
+    
+    up = u_r(r).transpose(1,2,0)
+    vp = v_r(r).transpose(1,2,0)
+    wp = w_r(r).transpose(1,2,0)
 
-        # Update velocities at the disc
-        Va[:,:,i]  = up
-        Vt[:,:,i]  = -rot*(vp*(np.cos(blade_angle)) - wp*(np.sin(blade_angle)) )  # velocity component in direction of rotation     
+    # Update velocities at the disc
+    Va[:,:,:]  = up
+    Vt[:,:,:]  = -rot*(vp*(np.cos(blade_angle)) - wp*(np.sin(blade_angle)) )  # velocity component in direction of rotation     
+    
+    # leave the evaluation points of the last station in the vortex distribution
+    VD.YC = VD.YC[-1]
+    VD.ZC = VD.ZC[-1]
+    VD.XC = VD.XC[-1]
     
     prop.vortex_distribution = VD
     
@@ -1,168 +1,413 @@
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
 # compute_wake_induced_velocity.py
-# 
-# Created:  Sep 2020, M. Clarke 
+#
+# Created:  Sep 2020, M. Clarke
 # Modified: Dec 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+from SUAVE.Core import Data
+
 # package imports
-import numpy as np 
+import numpy as np
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False):  
+def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,precision=np.float64,\
+                                  memory_budget=None,far_field_tolerance=None,far_field_cluster_size=8,ctrl_pts_idx=None):
     """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
     on lifting surface control points
 
-    Assumptions:  
-    
-    Source:   
-    
-    Inputs: 
-    WD     - helical wake distribution points               [Unitless] 
-    VD     - vortex distribution points on lifting surfaces [Unitless] 
-    cpts   - control points in segment                      [Unitless] 
+    Assumptions:
+    Every wake panel is a vortex ring of four straight segments. The bound segment of the
+    panels on the lifting line of the rotor is left out.
+
+    Several azimuthal start indices are evaluated in one pass when azi_start_idx is an array,
+    each with its own evaluation points. With a memory budget the control points and evaluation
+    points are split into blocks, the results do not depend on the blocks.
+
+    With a far field tolerance, clusters of far_field_cluster_size consecutive wake time steps
+    whose size plus core radius is below the tolerance times their distance to an evaluation
+    point are replaced by their vortex ring dipole at the cluster center. The error falls quickly
+    with the tolerance, it is about 1e-2 of the largest velocity at 0.5 and 2e-3 at 0.3 for a
+    propeller in forward flight. Clusters on the lifting line are never lumped.
+
+    Source:
+    N/A
+
+    Inputs:
+    WD                     - helical wake distribution points                             [Unitless]
+    VD                     - vortex distribution points on lifting surfaces               [Unitless]
+      VD.XC, VD.YC, VD.ZC  - evaluation points, (n_cp) or (n_azi,n_cp) for several indices [m]
+    cpts                   - control points in segment                                    [Unitless]
+    ctrl_pts_idx           - control points of the wake to evaluate, None for all cpts    [Unitless]
+    azi_start_idx          - azimuthal start index of the wake, int or array of n_azi     [Unitless]
+    sigma                  - regularization radius                                        [m]
+    precision              - floating point type of the calculation                       [np.float32/64]
+    memory_budget          - bytes for the temporaries, None for no blocks                [bytes]
+    far_field_tolerance    - None for the exact sum                                       [Unitless]
+    far_field_cluster_size - wake time steps per far field cluster                        [Unitless]
+
+    Outputs:
+    V_ind                  - induced velocities, (cpts,n_cp,3) or (n_azi,cpts,n_cp,3),    [m/s]
+                             with one row per ctrl_pts_idx if given
 
     Properties Used:
     N/A
-    """    
-    
-    # control point, time step , blade number , location on blade 
-    num_vortex_pts = len(WD.XA1[0,0,:])    # number of vortex points
-    num_eval_pts   = VD.n_cp               # number of evaluation points
-    
-    dtype = np.float64
-
-    # expand vortex points
-    WXA1  = np.tile(WD.XA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA1  = np.tile(WD.YA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))     
-    WZA1  = np.tile(WD.ZA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXA2  = np.tile(WD.XA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA2  = np.tile(WD.YA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZA2  = np.tile(WD.ZA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-                
-    WXB1  = np.tile(WD.XB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB1  = np.tile(WD.YB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB1  = np.tile(WD.ZB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXB2  = np.tile(WD.XB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB2  = np.tile(WD.YB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB2  = np.tile(WD.ZB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    GAMMA = np.tile(WD.GAMMA.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    
-    # expand evaluation points
-    XC    = np.tile(VD.XC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    YC    = np.tile(VD.YC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    ZC    = np.tile(VD.ZC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    
+    """
+
+    single_azimuth = np.ndim(azi_start_idx) == 0
+    azi_idx        = np.atleast_1d(azi_start_idx)
+    n_azi          = len(azi_idx)
+    n_eval         = VD.n_cp
+    if ctrl_pts_idx is not None:
+        cpts       = len(ctrl_pts_idx)
+        wake_index = np.ix_(azi_idx,ctrl_pts_idx)
+    else:
+        wake_index = azi_idx
+
+    # wake panels, one row per azimuthal start index and control point: (n_azi*cpts,n_vortex)
+    def wake_rows(name):
+        values = np.asarray(WD[name])[wake_index]
+        return values.reshape(n_azi*cpts,-1).astype(precision)
+
+    A1    = (wake_rows('XA1'), wake_rows('YA1'), wake_rows('ZA1'))
+    B1    = (wake_rows('XB1'), wake_rows('YB1'), wake_rows('ZB1'))
+    B2    = (wake_rows('XB2'), wake_rows('YB2'), wake_rows('ZB2'))
+    A2    = (wake_rows('XA2'), wake_rows('YA2'), wake_rows('ZA2'))
+    GAMMA = wake_rows('GAMMA')
+
+    # evaluation points of each row: (n_azi*cpts,n_eval)
+    row_azimuth = np.repeat(np.arange(n_azi),cpts)
+    XC          = np.reshape(VD.XC,(n_azi,n_eval)).astype(precision)[row_azimuth]
+    YC          = np.reshape(VD.YC,(n_azi,n_eval)).astype(precision)[row_azimuth]
+    ZC          = np.reshape(VD.ZC,(n_azi,n_eval)).astype(precision)[row_azimuth]
+
+    # the panels of the first wake time step are on the lifting line of the rotor
+    n_rows, n_vortex = np.shape(GAMMA)
+    n_wts            = np.shape(WD.reshaped_wake.XA1)[-1]
+    lifting_line     = np.arange(n_vortex) % n_wts == 0
+
+    if far_field_tolerance is not None:
+        clusters = wake_clusters(A1,B1,B2,A2,GAMMA,n_wts,far_field_cluster_size)
+
     # -------------------------------------------------------------------------------------------
-    # Compute velocity induced by horseshoe vortex segments on every control point by every panel
-    # -------------------------------------------------------------------------------------------     
-    # Create empty data structure
-    V_ind = np.zeros((cpts,VD.n_cp,3))
-     
-    # compute influence of bound vortices 
-    _ , res_C_AB = vortex(XC, YC, ZC, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,sigma,GAMMA,bv=True,WD=WD) 
-    C_AB         = res_C_AB.transpose(1,3,0,2) 
-    
-    # compute influence of right vortex segment
-    _ , res_C_BC = vortex(XC, YC, ZC, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,sigma,GAMMA)
-    C_BC         = res_C_BC.transpose(1,3,0,2) 
-    
-    # compute influence of bottom vortex segment
-    _ , res_C_CD = vortex(XC, YC, ZC, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,sigma,GAMMA) 
-    C_CD         = res_C_CD.transpose(1,3,0,2) 
-    
-    # compute influence of left vortex segment 
-    _ , res_C_DA = vortex(XC, YC, ZC, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,sigma,GAMMA) 
-    C_DA         = res_C_DA.transpose(1,3,0,2) 
-    
-    # Add all the influences together
-    V_ind =  row_reduction_summation(C_AB) + row_reduction_summation(C_BC)  + row_reduction_summation(C_CD) + row_reduction_summation(C_DA)   
-    
+    # Compute velocity induced by the vortex rings on every evaluation point in blocks
+    # -------------------------------------------------------------------------------------------
+    V_ind = np.zeros((n_rows,n_eval,3),dtype=precision)
+
+    row_block, eval_block = wake_induced_velocity_block_size(memory_budget,n_rows,n_vortex,n_eval,precision)
+
+    for r0 in range(0,n_rows,row_block):
+        rows = slice(r0,min(r0+row_block,n_rows))
+        for e0 in range(0,n_eval,eval_block):
+            evals = slice(e0,min(e0+eval_block,n_eval))
+
+            X = XC[rows,evals]
+            Y = YC[rows,evals]
+            Z = ZC[rows,evals]
+
+            if far_field_tolerance is None:
+                corners = [tuple(c[rows,:,None] for c in corner) for corner in (A1,B1,B2,A2)]
+                U, V, W = ring_influence(X[:,None,:],Y[:,None,:],Z[:,None,:],*corners,sigma,lifting_line[:,None])
+
+                # weigh by the circulation and sum over the rings
+                G = GAMMA[rows,None,:]
+                V_ind[rows,evals,0] = np.matmul(G,U)[:,0,:]
+                V_ind[rows,evals,1] = np.matmul(G,V)[:,0,:]
+                V_ind[rows,evals,2] = np.matmul(G,W)[:,0,:]
+            else:
+                V_ind[rows,evals] = clustered_induced_velocity(X,Y,Z,A1,B1,B2,A2,GAMMA,lifting_line,clusters,rows,sigma,\
+                                                               far_field_tolerance)
+
+    V_ind = V_ind.reshape(n_azi,cpts,n_eval,3)
+
+    if single_azimuth:
+        V_ind = V_ind[0]
 
     return V_ind
-  
-  
-# -------------------------------------------------------------------------------
-# vortex strength computation
-# -------------------------------------------------------------------------------
+
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2,sigma, GAMMA = 1, bv=False,WD=None,use_regularization_kernal=True):
-    """ This computes the velocity induced on a control point by a segment
-    of a horseshoe vortex that points from point 1 to point 2 for a filament with
-    positive vortex strength.
-    
-    Assumptions:  
-    None 
-    
-    Source: 
+def ring_influence(X,Y,Z,A1,B1,B2,A2,sigma,lifting_line):
+    """ This computes the regularized velocity induced by vortex rings of unit strength, with
+    the corners in the order A1, B1, B2, A2
+
+    Assumptions:
+    The distances from the points to every corner are shared by the two segments that meet
+    there. The bound segment A1-B1 is left out on the lifting line.
+
+    Source:
+    N/A
+
+    Inputs:
+    X, Y, Z          - evaluation points, broadcast against the corners           [m]
+    A1, B1, B2, A2   - (x,y,z) corners of the rings                               [m]
+    sigma            - regularization radius                                      [m]
+    lifting_line     - rings on the lifting line, broadcast against the corners   [boolean]
+
+    Outputs:
+    U, V, W          - induced velocities per ring and point, in the precision of the points [1/m]
+
+    Properties Used:
+    N/A
+    """
+
+    precision = X.dtype
+
+    # distance of the points to every corner
+    corners   = (A1,B1,B2,A2)
+    distances = []
+    for XP,YP,ZP in corners:
+        X_XP = X - XP
+        Y_YP = Y - YP
+        Z_ZP = Z - ZP
+        RP   = np.sqrt(np.square(X_XP) + np.square(Y_YP) + np.square(Z_ZP))
+        distances.append((X_XP,Y_YP,Z_ZP,RP))
+
+    U = V = W = 0.
+    for i in range(4):
+        j = (i + 1) % 4
+        U_seg, V_seg, W_seg = vortex_segment(corners[i],corners[j],distances[i],distances[j],sigma,precision)
+
+        if i == 0:
+            # ignore the bound vortex of the row of panels on the lifting line of the rotor
+            U_seg = np.where(lifting_line,0,U_seg)
+            V_seg = np.where(lifting_line,0,V_seg)
+            W_seg = np.where(lifting_line,0,W_seg)
+
+        U = U + U_seg
+        V = V + V_seg
+        W = W + W_seg
+
+    return U, V, W
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def vortex_segment(P1,P2,D1,D2,sigma,precision=np.float64):
+    """ This computes the regularized velocity induced by a vortex segment of unit strength
+    that points from point 1 to point 2, from the distances of the evaluation points to its ends
+
+    Assumptions:
+    None
+
+    Source:
     Low-Speed Aerodynamics, Second Edition by Joseph katz, Allen Plotkin
     Pgs. 584(Literature), 579-586 (Fortran Code implementation)
-    
+
     Inputs:
-    GAMMA       - propeller/rotor circulation
-    [X,Y,Z]     - location of control point  
-    [X1,Y1,Z1]  - location of point 1 
-    [X2,Y2,Z2]  - location of point 2
+    P1, P2           - (x,y,z) of point 1 and point 2                            [m]
+    D1, D2           - (x,y,z,r) from point 1 and point 2 to the evaluation point [m]
+    sigma            - regularization radius                                      [m]
+    precision        - floating point type of the calculation                     [np.float32/64]
+
+    Outputs:
+    U, V, W          - induced velocities                                         [1/m]
+
     Properties Used:
     N/A
-    
-    """   
-    X_X1  = X-X1
-    X_X2  = X-X2
-    X2_X1 = X2-X1
-
-    Y_Y1  = Y-Y1
-    Y_Y2  = Y-Y2
-    Y2_Y1 = Y2-Y1
+    """
 
-    Z_Z1  = Z-Z1
-    Z_Z2  = Z-Z2 
-    Z2_Z1 = Z2-Z1 
+    X_X1, Y_Y1, Z_Z1, R1 = D1
+    X_X2, Y_Y2, Z_Z2, R2 = D2
+    X2_X1 = P2[0] - P1[0]
+    Y2_Y1 = P2[1] - P1[1]
+    Z2_Z1 = P2[2] - P1[2]
 
-    R1R2X  = Y_Y1*Z_Z2 - Z_Z1*Y_Y2 
+    R1R2X  = Y_Y1*Z_Z2 - Z_Z1*Y_Y2
     R1R2Y  = Z_Z1*X_X2 - X_X1*Z_Z2
     R1R2Z  = X_X1*Y_Y2 - Y_Y1*X_X2
-    
+
     SQUARE = np.square(R1R2X) + np.square(R1R2Y) + np.square(R1R2Z)
     SQUARE[SQUARE==0] = 1e-8
-    R1     = np.sqrt(np.square(X_X1) + np.square(Y_Y1) + np.square(Z_Z1)) 
-    R2     = np.sqrt(np.square(X_X2) + np.square(Y_Y2) + np.square(Z_Z2)) 
     R0R1   = X2_X1*X_X1 + Y2_Y1*Y_Y1 + Z2_Z1*Z_Z1
     R0R2   = X2_X1*X_X2 + Y2_Y1*Y_Y2 + Z2_Z1*Z_Z2
-    RVEC   = np.array([R1R2X,R1R2Y,R1R2Z])
-    COEF   = (1/(4*np.pi))*(RVEC/SQUARE) * (R0R1/R1 - R0R2/R2)    
+    SCALE  = R0R1/R1 - R0R2/R2
 
-    
-    if use_regularization_kernal:
-        COEF = regularization_kernel(COEF, sigma)
-
-    if bv:
-        # ignore the row of panels corresponding to the lifting line of the rotor
-        COEF_new = np.reshape(COEF[0,:,:,0],np.shape(WD.reshaped_wake.XA1[0,:,:,:,:]))
-        m = np.shape(WD.reshaped_wake.XA1)[1]
-        
-        lifting_line_panels = np.zeros_like(COEF_new,dtype=bool)
-        lifting_line_panels[:,:,:,0] = True
-        lifting_line_panels_compressed = np.reshape(lifting_line_panels, (m,np.size(lifting_line_panels[0,:,:,:])))
-        
-        COEF[:,lifting_line_panels_compressed,:] = 0
-    
+    U = regularization_kernel((1/(4*np.pi))*(R1R2X/SQUARE)*SCALE, sigma, precision)
+    V = regularization_kernel((1/(4*np.pi))*(R1R2Y/SQUARE)*SCALE, sigma, precision)
+    W = regularization_kernel((1/(4*np.pi))*(R1R2Z/SQUARE)*SCALE, sigma, precision)
 
-    V_IND  = GAMMA * COEF
-    
-    return COEF , V_IND  
+    return U, V, W
 
-def row_reduction_summation(A):
-    # sum along last axis
-    sum_res = A.dot(np.ones(A.shape[-1])) # sum along axis
-    
-    return sum_res
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def wake_clusters(A1,B1,B2,A2,GAMMA,n_wts,cluster_size):
+    """ This lumps consecutive wake time steps of every blade panel into clusters for the far
+    field approximation
+
+    Assumptions:
+    The wake panels of every row are ordered as (blade, radial panel, time step). A ring is a
+    dipole of its circulation times its vector area.
+
+    Source:
+    N/A
+
+    Inputs:
+    A1, B1, B2, A2   - (x,y,z) corners of the rings, (n_rows,n_vortex)            [m]
+    GAMMA            - circulation of the rings, (n_rows,n_vortex)                [m^2/s]
+    n_wts            - number of wake time steps                                  [Unitless]
+    cluster_size     - wake time steps per cluster                                [Unitless]
+
+    Outputs:
+    clusters.
+      starts         - first ring of every cluster, (n_clusters)                  [Unitless]
+      members        - rings of every cluster, padded with the last one           [Unitless]
+      padding        - padded members                                             [boolean]
+      center         - (x,y,z) of the cluster centers, (n_rows,n_clusters)        [m]
+      size           - distance from the center to the furthest corner            [m]
+      dipole         - (x,y,z) dipole moment of the clusters                      [m^4/s]
+      lifting_line   - clusters that hold a ring on the lifting line              [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    n_vortex = np.shape(GAMMA)[1]
+
+    # clusters never span two blade panels
+    steps    = np.arange(0,n_wts,cluster_size)
+    starts   = (np.arange(0,n_vortex,n_wts)[:,None] + steps[None,:]).ravel()
+    ends     = np.append(starts[1:],n_vortex)
+    counts   = ends - starts
+    members  = starts[:,None] + np.arange(cluster_size)[None,:]
+    padding  = members >= ends[:,None]
+    members  = np.minimum(members,ends[:,None] - 1)
+
+    clusters              = Data()
+    clusters.starts       = starts
+    clusters.members      = members
+    clusters.padding      = padding
+    clusters.lifting_line = starts % n_wts == 0
+
+    # centers and sizes
+    center = []
+    for k in range(3):
+        mean_corner = (A1[k] + B1[k] + B2[k] + A2[k])/4
+        center.append(np.add.reduceat(mean_corner,starts,axis=1)/counts)
+
+    corner_distance = 0.
+    for corner in (A1,B1,B2,A2):
+        distance        = np.sqrt(sum([np.square(corner[k] - np.repeat(center[k],counts,axis=1)) for k in range(3)]))
+        corner_distance = np.maximum(corner_distance,distance)
+
+    clusters.center = center
+    clusters.size   = np.maximum.reduceat(corner_distance,starts,axis=1)
+
+    # the vector area of a quadrilateral is half the cross product of its diagonals
+    D1 = [B2[k] - A1[k] for k in range(3)]
+    D2 = [A2[k] - B1[k] for k in range(3)]
+    area = [0.5*(D1[1]*D2[2] - D1[2]*D2[1]),
+            0.5*(D1[2]*D2[0] - D1[0]*D2[2]),
+            0.5*(D1[0]*D2[1] - D1[1]*D2[0])]
+    clusters.dipole = [np.add.reduceat(GAMMA*area[k],starts,axis=1) for k in range(3)]
+
+    return clusters
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def clustered_induced_velocity(X,Y,Z,A1,B1,B2,A2,GAMMA,lifting_line,clusters,rows,sigma,tolerance):
+    """ This computes the velocity induced by the wake on a block of evaluation points, with
+    the far clusters of each point replaced by their dipoles
+
+    Assumptions:
+    See compute_wake_induced_velocity
+
+    Source:
+    N/A
+
+    Inputs:
+    X, Y, Z          - evaluation points of the block, (n_block_rows,n_block_eval)   [m]
+    A1, B1, B2, A2   - (x,y,z) corners of the rings, (n_rows,n_vortex)               [m]
+    GAMMA            - circulation of the rings                                      [m^2/s]
+    lifting_line     - rings on the lifting line, (n_vortex)                          [boolean]
+    clusters         - from wake_clusters
+    rows             - rows of the block                                             [slice]
+    sigma            - regularization radius                                         [m]
+    tolerance        - far field tolerance                                           [Unitless]
+
+    Outputs:
+    V_ind            - induced velocities, (n_block_rows,n_block_eval,3)             [m/s]
+
+    Properties Used:
+    N/A
+    """
+
+    n_rows, n_eval = np.shape(X)
+    dtype          = X.dtype
+
+    # distance of every point to every cluster, (n_block_rows,n_clusters,n_block_eval)
+    RX   = X[:,None,:] - clusters.center[0][rows,:,None]
+    RY   = Y[:,None,:] - clusters.center[1][rows,:,None]
+    RZ   = Z[:,None,:] - clusters.center[2][rows,:,None]
+    R_sq = np.square(RX) + np.square(RY) + np.square(RZ)
+    R    = np.sqrt(R_sq)
+    far  = (clusters.size[rows,:,None] + sigma < tolerance*R) & ~clusters.lifting_line[None,:,None]
+
+    # far field of the dipoles
+    MX, MY, MZ = [clusters.dipole[k][rows,:,None] for k in range(3)]
+    R_sq[~far] = 1.
+    MR         = (MX*RX + MY*RY + MZ*RZ)*3/R_sq
+    R_cube     = (4*np.pi)*R_sq*np.sqrt(R_sq)
+    V_far      = np.zeros((n_rows,n_eval,3),dtype=dtype)
+    for k,(Mk,Rk) in enumerate(((MX,RX),(MY,RY),(MZ,RZ))):
+        V_far[:,:,k] = np.sum(np.where(far,(MR*Rk - Mk)/R_cube,0),axis=1)
+
+    # near field of every ring of the remaining clusters
+    row, cluster, point = np.nonzero(~far)
+    row_global = row + rows.start
+    members    = clusters.members[cluster]
+
+    corners = []
+    for corner in (A1,B1,B2,A2):
+        corners.append(tuple(c[row_global[:,None],members] for c in corner))
+
+    U, V, W = ring_influence(X[row,point][:,None],Y[row,point][:,None],Z[row,point][:,None],*corners,sigma,\
+                             lifting_line[members])
+
+    G        = np.where(clusters.padding[cluster],0,GAMMA[row_global[:,None],members])
+    flat     = row*n_eval + point
+    V_near   = np.zeros((n_rows,n_eval,3),dtype=dtype)
+    for k,Vk in enumerate((U,V,W)):
+        V_near[:,:,k] = np.bincount(flat,weights=np.sum(G*Vk,axis=1),minlength=n_rows*n_eval).reshape(n_rows,n_eval)
+
+    return V_near + V_far
+
+def wake_induced_velocity_block_size(memory_budget,n_rows,n_vortex,n_eval,precision):
+    """ This finds how many rows and evaluation points can be evaluated at once within a
+    memory budget
+
+    Assumptions:
+    About 40 temporaries per row, vortex ring and evaluation point. The evaluation points are
+    only split when a single row does not fit.
+
+    Source:
+    N/A
+
+    Inputs:
+    memory_budget                                [bytes]
+    n_rows   - azimuthal indices x control points [-]
+    n_vortex - number of vortex rings            [-]
+    n_eval   - number of evaluation points       [-]
+    precision                                    [np.float32/64]
+
+    Outputs:
+    row_block                                    [-]
+    eval_block                                   [-]
+
+    Properties Used:
+    N/A
+    """
+
+    if memory_budget is None:
+        return max(n_rows,1), max(n_eval,1)
+
+    bytes_per_point = 40*n_vortex*np.dtype(precision).itemsize
+    eval_block      = min(max(int(memory_budget // bytes_per_point),1),max(n_eval,1))
+    row_block       = min(max(int(memory_budget // (bytes_per_point*eval_block)),1),max(n_rows,1))
+
+    return row_block, eval_block
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def regularization_kernel(COEF_in, sigma):
+def regularization_kernel(COEF_in, sigma, precision=np.float64):
     """
     Regularization kernel used to prevent singularities
     
@@ -174,8 +419,9 @@ def regularization_kernel(COEF_in, sigma):
        Incompressible Unsteady Flows", 1989.
     
     Inputs:
-       COEF    Biot-Savart Kernel
-       sigma   regularization radius
+       COEF       Biot-Savart Kernel
+       sigma      regularization radius
+       precision  floating point type of the calculation
     
     Outputs:
        KAPPA   Regularization Kernel
@@ -184,18 +430,20 @@ def regularization_kernel(COEF_in, sigma):
     N/A
     
     """
-    COEF       = COEF_in.astype(np.float32)
+    COEF       = COEF_in.astype(precision)
     COEF_MAG   = np.abs(COEF)
     
     # Make sure the magnitude doesn't go to zero
-    COEF_MAG[np.isclose(COEF_MAG,0,atol=1e-8)] = 1e-8
+    COEF_MAG[COEF_MAG <= 1e-8] = 1e-8
 
     R_square   = 1/(4*np.pi*COEF_MAG)
     R          = np.sqrt(R_square)
     R_sigma_sq = R_square/np.square(sigma)
     
+    # (R_sigma_sq + 1)**(5/2) as products, which is much faster than the power
+    R_sigma_p1 = R_sigma_sq + 1
     NUM = R*(R_sigma_sq + (5/2))
-    DEN = 4*np.pi*(sigma**3)*np.power(R_sigma_sq + 1,5/2)
+    DEN = 4*np.pi*(sigma**3)*(R_sigma_p1*R_sigma_p1*np.sqrt(R_sigma_p1))
     
     DEN[DEN==0.] = 1e-8
     
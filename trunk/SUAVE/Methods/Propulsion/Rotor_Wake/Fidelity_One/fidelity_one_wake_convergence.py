@@ -2,46 +2,61 @@
 # fidelity_one_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
+from SUAVE.Core import Data
+from SUAVE.Core.Hashing import hash_data
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities import compute_fidelity_one_inflow_velocities
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.generate_fidelity_one_wake_shape import generate_fidelity_one_wake_shape
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_inflow_and_tip_loss
 
 import numpy as np
+import time
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
 def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     """
     This converges on the wake shape for the fidelity-one rotor wake.
-    
+
     Assumptions:
-    None
-    
+    The induced velocities of a control point only depend on its own wake. Control points
+    are iterated until their own axial velocity converges. Control points whose circulation,
+    velocity, speed and orientation are within the reuse tolerance of the last call keep the
+    induced velocities of that call. When converging on the wake shape the iteration starts
+    from the last converged axial velocity. The wake is only regenerated after the loop if
+    the last iterate did not converge.
+
     Source:
     N/A
-    
+
     Inputs:
     wake        - rotor wake
     rotor       - rotor
     wake_inputs - inputs passed from the BET rotor spin function
-    
+
     Outputs:
     None
-    
+
     Properties Used:
-    None
-    """    
+    wake.
+      semi_prescribed_converge                  [boolean]
+      maximum_convergence_iteration             [-]
+      axial_velocity_convergence_tolerance      [m/s]
+      circulation_reuse_tolerance               [-], None to never reuse
+      convergence_callback                      [callable], optional
+    """
+    tic = time.time()
+
     # Unpack inputs
     Ua = wake_inputs.velocity_axial
     Ut = wake_inputs.velocity_tangential
-    r  = wake_inputs.radius_distribution
-    
+    r  = np.broadcast_to(wake_inputs.radius_distribution,np.shape(Ua))
+
     R  = rotor.tip_radius
-    B  = rotor.number_of_blades    
-    
+    B  = rotor.number_of_blades
+
     # converge on va for a semi-prescribed wake method
-    va_diff, ii = 1, 0
+    ii  = 0
     tol = wake.axial_velocity_convergence_tolerance
     if wake.semi_prescribed_converge:
         if wake.verbose:
@@ -51,33 +66,198 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
         if wake.verbose:
             print("\tGenerating fully-prescribed wake shape...")
         ii_max = 1
-        
 
-    while va_diff > tol:  
+    # reuse the control points that did not change since the last call
+    reused, previous = warm_start(wake,rotor)
+    active           = ~reused
+    va_diff          = 1 if np.any(active) else 0
+    va               = np.zeros_like(rotor.outputs.disc_axial_induced_velocity)
+    vt               = np.zeros_like(va)
+    if np.any(reused):
+        va[reused] = previous.va[reused]
+        vt[reused] = previous.vt[reused]
+    n_evaluated = 0
+
+    while va_diff > tol and np.any(active):
         # generate wake geometry for rotor
         wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
-        
-        # compute axial wake-induced velocity (a byproduct of the circulation distribution which is an input to the wake geometry)
-        va, vt = compute_fidelity_one_inflow_velocities(wake,rotor)
-    
+
+        # compute axial wake-induced velocity of the unconverged control points (a byproduct of the circulation distribution which is an input to the wake geometry)
+        idx = np.nonzero(active)[0]
+        va_idx, vt_idx = compute_fidelity_one_inflow_velocities(wake,rotor,ctrl_pts_idx=idx)
+        va[idx]        = va_idx
+        vt[idx]        = vt_idx
+        n_evaluated   += len(idx)
+
         # compute new blade velocities
-        Wa   = va + Ua
-        Wt   = Ut - vt
-    
-        lamdaw, F, _ = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
-    
-        va_diff = np.max(abs(F*va - rotor.outputs.disc_axial_induced_velocity))
-    
+        Wa   = va_idx + Ua[idx]
+        Wt   = Ut[idx] - vt_idx
+
+        lamdaw, F, _ = compute_inflow_and_tip_loss(r[idx],R,Wa,Wt,B)
+
+        cpts_diff = np.max(abs(F*va_idx - rotor.outputs.disc_axial_induced_velocity[idx]),axis=(1,2))
+        va_diff   = np.max(cpts_diff)
+
         # update the axial disc velocity based on new va from HFW
-        rotor.outputs.disc_axial_induced_velocity = F*va 
-        
+        rotor.outputs.disc_axial_induced_velocity[idx] = F*va_idx
+
+        # converged control points keep their induced velocities
+        active[idx[cpts_diff<=tol]] = False
+
         ii+=1
         if ii>=ii_max and va_diff>tol:
             if wake.semi_prescribed_converge and wake.verbose:
                 print("Semi-prescribed vortex wake did not converge on axial inflow used for wake shape.")
             break
-        
-    # save converged wake:
-    wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
-    
-    return wake.vortex_distribution, va, vt
\ No newline at end of file
+
+    # save converged wake, unless the last wake was generated from the converged inflow
+    regenerated = va_diff > tol or ii == 0
+    if regenerated:
+        wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
+
+    previous.va                          = va
+    previous.vt                          = vt
+    previous.disc_axial_induced_velocity = np.copy(rotor.outputs.disc_axial_induced_velocity)
+    wake.previous_solution               = previous
+
+    # report the convergence
+    record                       = Data()
+    record.iterations            = ii
+    record.converged             = va_diff <= tol
+    record.regenerated           = regenerated
+    record.control_points        = len(va)
+    record.evaluated_points      = n_evaluated
+    record.reused_points         = int(np.sum(reused))
+    record.time                  = time.time() - tic
+    update_convergence_statistics(wake,record)
+
+    return wake.vortex_distribution, va, vt
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def warm_start(wake,rotor):
+    """
+    This compares the inputs of the wake of every control point to the last call, and starts
+    the semi-prescribed convergence from the last converged axial velocity.
+
+    Assumptions:
+    The wake of a control point depends on its circulation, velocity, rotational speed and
+    orientation, and on the rotor, the speed of the first control point and the wake settings
+    through the whole wake. Without semi-prescribed convergence the result also depends on
+    the starting axial velocity.
+
+    Source:
+    N/A
+
+    Inputs:
+    wake                     - rotor wake
+    rotor.outputs.
+      disc_circulation       [m^2/s]
+      disc_axial_induced_velocity [m/s]
+      velocity               [m/s]
+      omega                  [rad/s]
+
+    Outputs:
+    reused                   - control points that match the last call [boolean]
+    previous                 - the last solution with the inputs of this call
+    rotor.outputs.disc_axial_induced_velocity, from the last call where possible
+
+    Properties Used:
+    N/A
+    """
+    outputs  = rotor.outputs
+    cpts     = len(outputs.omega)
+    rotation = np.broadcast_to(rotor.body_to_prop_vel(),(cpts,3,3))
+
+    # inputs that change the whole wake
+    key = hash_data([cpts,
+                     outputs.number_radial_stations,
+                     outputs.number_azimuthal_stations,
+                     outputs.omega[0],
+                     rotation[0],
+                     rotor.inputs.pitch_command,
+                     rotor.origin,
+                     rotor.rotation,
+                     rotor.tip_radius,
+                     rotor.hub_radius,
+                     rotor.number_of_blades,
+                     rotor.radius_distribution,
+                     rotor.chord_distribution,
+                     rotor.twist_distribution,
+                     wake.wake_settings,
+                     wake.semi_prescribed_converge])
+
+    # inputs of the wake of every control point, copied as the axial velocity is updated in place
+    row_inputs = [np.array(outputs.disc_circulation).reshape(cpts,-1),
+                  np.array(outputs.velocity).reshape(cpts,-1),
+                  np.array(outputs.omega).reshape(cpts,-1),
+                  np.array(rotation).reshape(cpts,-1)]
+    if not wake.semi_prescribed_converge:
+        row_inputs.append(np.array(outputs.disc_axial_induced_velocity).reshape(cpts,-1))
+
+    last     = wake.get('previous_solution',None)
+    reused   = np.zeros(cpts,dtype=bool)
+    tol      = wake.get('circulation_reuse_tolerance',None)
+    if last is not None and last.key == key and tol is not None:
+        # start from the converged axial velocity of the last call
+        if wake.semi_prescribed_converge:
+            outputs.disc_axial_induced_velocity = np.copy(last.disc_axial_induced_velocity)
+
+        # every input may change by the tolerance relative to its largest value at the control point
+        reused = np.ones(cpts,dtype=bool)
+        for new_input, last_input in zip(row_inputs,last.row_inputs):
+            scale   = np.max(np.abs(last_input),axis=1,keepdims=True)
+            reused &= np.all(np.abs(new_input - last_input) <= tol*scale,axis=1)
+        if np.any(reused):
+            outputs.disc_axial_induced_velocity[reused] = last.disc_axial_induced_velocity[reused]
+
+    previous            = Data()
+    previous.key        = key
+    previous.row_inputs = row_inputs
+    if np.any(reused):
+        previous.va = last.va
+        previous.vt = last.vt
+
+    return reused, previous
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def update_convergence_statistics(wake,record):
+    """
+    This adds the record of one wake convergence to the statistics of the wake and passes it
+    to the convergence callback.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    wake     - rotor wake
+    record   - iterations, converged, regenerated, control_points, evaluated_points,
+               reused_points and time of the call
+
+    Outputs:
+    wake.convergence_statistics.
+      calls, iterations, evaluated_points, reused_points, regenerations, time, last
+
+    Properties Used:
+    N/A
+    """
+    stats = wake.get('convergence_statistics',None)
+    if stats is None:
+        stats = Data(calls=0,iterations=0,evaluated_points=0,reused_points=0,regenerations=0,time=0.)
+        wake.convergence_statistics = stats
+
+    stats.calls            += 1
+    stats.iterations       += record.iterations
+    stats.evaluated_points += record.evaluated_points
+    stats.reused_points    += record.reused_points
+    stats.regenerations    += int(record.regenerated)
+    stats.time             += record.time
+    stats.last              = record
+
+    callback = wake.get('convergence_callback',None)
+    if callback is not None:
+        callback(wake,record)
+
+    return
@@ -2,7 +2,7 @@
 # fidelity_zero_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 import numpy as np
@@ -49,7 +49,11 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    if wake_inputs.get('number_of_rotors',1) > 1:
+        # several rotors stacked along the control points, every station is solved on its own
+        PSI_final,ier = stationwise_newton(PSI,wake_inputs,rotor,rotor.sol_tolerance)
+    else:
+        PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
     
     if ier!=1:
         print("Rotor BEVW did not converge to a solution (Stall)")
@@ -111,6 +115,7 @@ def iteration(PSI, wake_inputs, rotor):
     tc           = rotor.thickness_to_chord
     airfoils     = rotor.Airfoils
     a_loc        = rotor.airfoil_polar_stations
+    polars       = wake_inputs.get('airfoil_polars',None)
     
     # Reshape PSI because the solver gives it flat
     if wake_inputs.use_2d_analysis:
@@ -126,7 +131,7 @@ def iteration(PSI, wake_inputs, rotor):
     vt           = Ut - Wt
 
     # compute blade airfoil forces and properties
-    Cl, Cdval, alpha, Ma, W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis)
+    Cl, Cdval, alpha, Ma, W = compute_airfoil_aerodynamics(beta,c,r,R,B,Wa,Wt,a,nu,airfoils,a_loc,ctrl_pts,Nr,Na,tc,use_2d_analysis,polars)
 
     # compute inflow velocity and tip loss factor
     lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
@@ -137,6 +142,56 @@ def iteration(PSI, wake_inputs, rotor):
     
     return Rsquiggly.flatten()
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def stationwise_newton(PSI, wake_inputs, rotor, tolerance, max_iterations=200, max_step=0.2):
+    """
+    Solves the BEVW residual with a damped Newton iteration at every blade station at
+    once. The residual at a station only depends on the inflow angle of that station,
+    so its derivative is found with one extra residual evaluation for all stations.
+    Used for stacked rotors, where the dense steps of fsolve grow with the cube of
+    the number of stations.
+
+    Assumptions:
+    Steps are limited to max_step radians. A station is converged when its step is
+    below the tolerance relative to its inflow angle.
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        initial inflow angle                            [rad]
+       wake_inputs                see iteration                                   [-]
+       rotor                      SUAVE rotor                                     [-]
+       tolerance                  relative tolerance on the inflow angle          [-]
+       max_iterations             maximum number of Newton steps                  [-]
+       max_step                   largest step per iteration                      [rad]
+
+    Outputs:
+       PSI                        converged inflow angle                          [rad]
+       ier                        1 if all stations converged                     [-]
+
+    """
+    
+    PSI   = np.array(PSI,dtype=float).flatten()
+    delta = np.sqrt(np.finfo(float).eps)
+    ier   = 0
+    
+    for i in range(max_iterations):
+        R_0  = iteration(PSI, wake_inputs, rotor)
+        R_1  = iteration(PSI + delta, wake_inputs, rotor)
+        dR   = (R_1 - R_0)/delta
+        
+        step = np.zeros_like(PSI)
+        np.divide(-R_0, dR, out=step, where=dR!=0)
+        step = np.clip(np.nan_to_num(step),-max_step,max_step)
+        PSI  = PSI + step
+        
+        if np.all(np.abs(step) <= tolerance*(np.abs(PSI) + tolerance)):
+            ier = 1
+            break
+    
+    return PSI, ier
+
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def va_vt(PSI, wake_inputs, rotor):
     """
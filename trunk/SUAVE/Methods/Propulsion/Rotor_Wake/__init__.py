@@ -2,8 +2,10 @@
 # Rotor_Wake provides the functions needed to perform analyses.
 # @ingroup Methods-Propulsion
 
-from . import Fidelity_One
-from . import Fidelity_Zero
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Fidelity_One',
+                                             'Fidelity_Zero'])
 
 
 
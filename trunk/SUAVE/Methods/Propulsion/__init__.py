@@ -2,7 +2,10 @@
 # Description
 # @ingroup Methods
 
-from . import Rotor_Wake
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Rotor_Wake',
+                                             'electric_motor_sizing'])
 from .ducted_fan_sizing import ducted_fan_sizing
 from .propeller_design import propeller_design
 from .turbofan_emission_index import turbofan_emission_index
@@ -15,8 +18,8 @@ from .fm_id import fm_id
 from .fm_solver import fm_solver
 from .rayleigh import rayleigh
 from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
-from . import electric_motor_sizing
 from .liquid_rocket_sizing import liquid_rocket_sizing
 from .serial_HTS_turboelectric_sizing import serial_HTS_turboelectric_sizing
 from .serial_HTS_dynamo_turboelectric_sizing import serial_HTS_dynamo_turboelectric_sizing
 
+from .spin_rotors import spin_rotors
@@ -0,0 +1,207 @@
+## @ingroup Methods-Propulsion
+# spin_rotors.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data
+from SUAVE.Core.Hashing import hash_data
+import numpy as np
+import copy
+
+# ----------------------------------------------------------------------
+#  Spin Rotors
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def spin_rotors(rotors,conditions):
+    """ Spins several rotors, solving the BET of all rotors that share a blade in one go.
+
+        Assumptions:
+        Rotors with the same blade geometry, airfoils and discretization are stacked
+        along the control points and spun as a single rotor. They may differ in speed,
+        pitch command and orientation. Rotors with a Fidelity One wake or with a
+        nonuniform freestream are spun one at a time.
+
+        Source:
+        N/A
+
+        Inputs:
+        rotors             [list of rotors], with their inputs set
+        conditions         [Data]
+
+        Outputs:
+        results            [list], the outputs of rotor.spin for every rotor
+
+        Properties Used:
+        N/A
+    """
+
+    # group the rotors that can be stacked
+    groups = {}
+    for ii,rotor in enumerate(rotors):
+        key = stacking_key(rotor)
+        if key is None:
+            key = ii
+        groups.setdefault(key,[]).append(ii)
+
+    results = [None]*len(rotors)
+    for indices in groups.values():
+        if len(indices) == 1:
+            results[indices[0]] = rotors[indices[0]].spin(conditions)
+        else:
+            stacked_results = spin_stacked_rotors([rotors[ii] for ii in indices],conditions)
+            for ii,result in zip(indices,stacked_results):
+                results[ii] = result
+
+    return results
+
+## @ingroup Methods-Propulsion
+def stacking_key(rotor):
+    """ Hashes everything of a rotor that the BET needs besides its inputs and orientation
+
+        Assumptions:
+        Returns None for rotors that can not be stacked
+
+        Source:
+        N/A
+
+        Inputs:
+        rotor              [rotor]
+
+        Outputs:
+        key                [str]
+
+        Properties Used:
+        N/A
+    """
+
+    if rotor.Wake.wake_method != 'Fidelity_Zero' or rotor.nonuniform_freestream:
+        return None
+
+    blade = [type(rotor),
+             rotor.number_of_blades,
+             rotor.tip_radius,
+             rotor.hub_radius,
+             rotor.twist_distribution,
+             rotor.sweep_distribution,
+             rotor.chord_distribution,
+             rotor.radius_distribution,
+             rotor.thickness_to_chord,
+             rotor.airfoil_polar_stations,
+             [airfoil.get('polars',None) for airfoil in rotor.Airfoils],
+             rotor.number_azimuthal_stations,
+             rotor.use_2d_analysis,
+             rotor.sol_tolerance]
+
+    return hash_data(blade)
+
+## @ingroup Methods-Propulsion
+def spin_stacked_rotors(rotors,conditions):
+    """ Spins rotors with the same blade as one rotor, with the control points of every
+        rotor one after another, and splits the results per rotor.
+
+        Assumptions:
+        The rotors share a stacking_key
+
+        Source:
+        N/A
+
+        Inputs:
+        rotors             [list of rotors]
+        conditions.
+          freestream.density, dynamic_viscosity, speed_of_sound, temperature
+          frames.inertial.velocity_vector
+          frames.body.transform_to_inertial
+          propulsion.throttle
+
+        Outputs:
+        results            [list], the outputs of rotor.spin for every rotor
+        rotor.outputs      [Data]
+
+        Properties Used:
+        N/A
+    """
+
+    n_rot    = len(rotors)
+    ctrl_pts = len(conditions.frames.inertial.velocity_vector)
+
+    for rotor in rotors:
+        if np.any(rotor.inputs.pitch_command !=0) and not rotor.variable_pitch:
+            print("Warning: pitch commanded for a fixed-pitch rotor. Changing to variable pitch rotor for weights analysis.")
+            rotor.variable_pitch = True
+
+    # a copy of the first rotor carries the inputs of all the rotors
+    stacked                          = copy.copy(rotors[0])
+    stacked.inputs                   = Data()
+    stacked.inputs.number_of_rotors  = n_rot
+    stacked.inputs.omega             = np.vstack([rotor.inputs.omega for rotor in rotors])
+    stacked.inputs.y_axis_rotation   = np.vstack([stack_column(rotor.inputs.y_axis_rotation,ctrl_pts) for rotor in rotors])
+    stacked.orientation_euler_angles = np.repeat(np.array([rotor.orientation_euler_angles for rotor in rotors])*1.,ctrl_pts,axis=0)
+    stacked.variable_pitch           = True
+
+    pitch_commands = [rotor.inputs.pitch_command for rotor in rotors]
+    if all([np.size(pitch)==1 and pitch==pitch_commands[0] for pitch in pitch_commands]):
+        stacked.inputs.pitch_command = pitch_commands[0]
+    else:
+        stacked.inputs.pitch_command = np.vstack([stack_column(pitch,ctrl_pts) for pitch in pitch_commands])
+
+    # the conditions seen by every rotor
+    stacked_conditions                                   = Data()
+    stacked_conditions.freestream                        = Data()
+    stacked_conditions.frames                            = Data()
+    stacked_conditions.frames.inertial                   = Data()
+    stacked_conditions.frames.body                       = Data()
+    stacked_conditions.propulsion                        = Data()
+    for key in ['density','dynamic_viscosity','speed_of_sound','temperature']:
+        stacked_conditions.freestream[key]               = np.tile(conditions.freestream[key],(n_rot,1))
+    stacked_conditions.frames.inertial.velocity_vector   = np.tile(conditions.frames.inertial.velocity_vector,(n_rot,1))
+    stacked_conditions.frames.body.transform_to_inertial = np.tile(conditions.frames.body.transform_to_inertial,(n_rot,1,1))
+    stacked_conditions.propulsion.throttle               = np.tile(conditions.propulsion.throttle,(n_rot,1))
+
+    F, Q, P, Cp, outputs, etap = stacked.spin(stacked_conditions)
+
+    # split the results per rotor
+    results = []
+    for ii,rotor in enumerate(rotors):
+        rows          = slice(ii*ctrl_pts,(ii+1)*ctrl_pts)
+        rotor_outputs = Data()
+        for key,value in outputs.items():
+            if isinstance(value,np.ndarray) and np.ndim(value) > 0 and len(value) == n_rot*ctrl_pts:
+                rotor_outputs[key] = value[rows]
+            else:
+                rotor_outputs[key] = value
+
+        rotor.outputs                = rotor_outputs
+        rotor.azimuthal_distribution = stacked.azimuthal_distribution
+
+        results.append((F[rows], Q[rows], P[rows], Cp[rows], rotor_outputs, etap[rows]))
+
+    conditions.propulsion.etap = results[-1][-1]
+
+    return results
+
+## @ingroup Methods-Propulsion
+def stack_column(value,ctrl_pts):
+    """ Makes a scalar or column input a column with one row per control point
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        value              [float or array]
+        ctrl_pts           [int]
+
+        Outputs:
+        column             [array]
+
+        Properties Used:
+        N/A
+    """
+
+    return np.broadcast_to(np.reshape(value,(-1,1)),(ctrl_pts,1))
@@ -2,8 +2,10 @@
 # These provide functionality that is not easily grouped into another set.
 # Most of these provide some type of mathematical functionality.
 # @ingroup Methods
-from . import Chebyshev
-from . import soft_max
-#import Utilities
-from . import latin_hypercube_sampling
-from . import Cubic_Spline_Blender
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Chebyshev',
+                                             'soft_max',
+                                             'latin_hypercube_sampling',
+                                             'Cubic_Spline_Blender'])
+#import Utilities
\ No newline at end of file
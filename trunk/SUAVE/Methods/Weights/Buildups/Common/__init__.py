@@ -3,7 +3,9 @@
 # utilizing buildup weight methods.
 # @ingroup Methods-Weights-Buildups
 
-from . import fuselage
-from . import prop
-from . import wing
-from . import wiring
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['fuselage',
+                                             'prop',
+                                             'wing',
+                                             'wiring'])
\ No newline at end of file
@@ -3,5 +3,7 @@
 # sizing.
 # @ingroup Methods-Weights
 
-from . import eVTOL  
-from . import Common  
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['eVTOL',
+                                             'Common'])
\ No newline at end of file
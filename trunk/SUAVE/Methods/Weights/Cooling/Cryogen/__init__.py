@@ -1,4 +1,6 @@
 ## @defgroup Methods-Cooling-Cryogen Cryogen
 # Cooling by liquid (or gaseous) cryogen.
 # @ingroup Methods-Cooling
-from . import Consumption
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Consumption'])
\ No newline at end of file
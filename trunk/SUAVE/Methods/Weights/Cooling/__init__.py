@@ -2,4 +2,6 @@
 # Cooling methods contain the functions for cryogenic systems such as Cryocoolers and cryogen cooling.
 # @ingroup Methods
 
-from . import Cryogen
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Cryogen'])
@@ -2,11 +2,13 @@
 #Correlation methods provide component weight breakdowns for different vehicle configurations based on regressed data
 # @ingroup Methods-Weights
 
-from . import Propulsion
-from . import Transport
-from . import BWB
-from . import Human_Powered
-from . import UAV
-from . import Common
-from . import FLOPS
-from . import Raymer
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Propulsion',
+                                             'Transport',
+                                             'BWB',
+                                             'Human_Powered',
+                                             'UAV',
+                                             'Common',
+                                             'FLOPS',
+                                             'Raymer'])
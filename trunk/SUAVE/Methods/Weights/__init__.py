@@ -2,8 +2,10 @@
 #Weights methods provide different means of estimating vehicle weight breakdowns
 # @ingroup Methods
 
-from . import Correlations
-from . import Buildups
-from . import Dynamo_Supply
-from . import Cooling
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Correlations',
+                                             'Buildups',
+                                             'Dynamo_Supply',
+                                             'Cooling'])
 
@@ -1,20 +1,22 @@
 ## @defgroup Methods
 # Methods provide the functions needed to perform analyses. These are generally not classes.
 
-from . import Aerodynamics
-from . import Center_of_Gravity
-from . import Costs
-from . import Flight_Dynamics
-from . import Geometry
-from . import Missions
-from . import Noise
-from . import Performance
-from . import Power
-from . import Propulsion
-from . import Utilities
-from . import Weights
-from . import Cryogenics
-from . import Figures_of_Merit
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Aerodynamics',
+                                             'Center_of_Gravity',
+                                             'Costs',
+                                             'Flight_Dynamics',
+                                             'Geometry',
+                                             'Missions',
+                                             'Noise',
+                                             'Performance',
+                                             'Power',
+                                             'Propulsion',
+                                             'Utilities',
+                                             'Weights',
+                                             'Cryogenics',
+                                             'Figures_of_Merit'])
 
 
 from .skip import skip
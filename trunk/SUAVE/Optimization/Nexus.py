@@ -6,6 +6,7 @@
 #           Apr 2017, T. MacDonald
 #           Jul 2020, M. Clarke
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,11 +14,16 @@
 
 # suave imports
 import SUAVE 
-from SUAVE.Core import Data, DataOrdered
+from SUAVE.Core import Data, DataOrdered, Process_Pool
 from SUAVE.Analyses import Process
 from copy import deepcopy
+from collections import OrderedDict
 from . import helper_functions as help_fun
 import numpy as np
+import hashlib
+import json
+import os
+import tempfile
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -71,13 +77,26 @@ class Nexus(Data):
         self.evaluation_count       = 0
         self.force_evaluate         = False
         self.hard_bounded_inputs    = False
+        self.number_of_processes    = 1
+        self.last_jacobian          = None
+        
+        # remembers the objective and constraints of this many design points, 0 only uses last_inputs
+        self.cache_size             = 0
+        self.cache_aliases          = []
+        self.cache_file             = None
+        self.cache_entries          = None
+        self.cache_hits             = 0
+        self.cache_misses           = 0
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
             If the last time you ran this the inputs were the same, a cache is used.
+            With a cache_size the objective and constraints of that many earlier design
+            points are also remembered.
     
             Assumptions:
-            None
+            On a cache hit only the objective, constraint and cache_aliases values are
+            put back into the nexus, the rest of the results are not updated.
     
             Source:
             N/A
@@ -99,10 +118,85 @@ class Nexus(Data):
            and self.last_fidelity == self.fidelity_level \
            and self.force_evaluate == False:
             pass
+        elif self.cache_size and not self.force_evaluate and self.load_from_cache():
+            pass
         else:
             self._really_evaluate()
+            if self.cache_size:
+                self.store_in_cache()
         
     
+    def evaluate_batch(self,X,keys=['objective','all_constraints'],pool=None):
+        """Runs the problem at many design points. The points are spread over a pool of
+            processes, each working on its own copy of the vehicle and analyses.
+    
+            Assumptions:
+            The workers are forked from this process, so each one starts from the
+            state of the nexus when its pool is opened. With more than one process
+            this nexus is not changed by the evaluations.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  [array], (number of points x number of inputs), scaled
+            keys               [list of strings], the functions of the nexus to return
+            pool               [Process_Pool], from batch_pool(keys), to reuse its workers
+    
+            Outputs:
+            outputs[key]       [array], (number of points x length of the function)
+    
+            Properties Used:
+            self.number_of_processes [int]
+        """            
+        
+        X = np.atleast_2d(np.asarray(X,dtype=float))
+        
+        if pool is None:
+            with self.batch_pool(keys) as pool:
+                points = pool.map(list(X))
+        else:
+            points = pool.map(list(X))
+        
+        # stack the points
+        outputs = Data()
+        for key in keys:
+            values = [np.asarray(point[key],dtype=float) for point in points]
+            if len(values) and values[0].size:
+                outputs[key] = np.vstack(values)
+            else:
+                outputs[key] = np.zeros((len(points),0))
+                
+        return outputs
+    
+    def batch_pool(self,keys=['objective','all_constraints']):
+        """Opens a pool of number_of_processes workers that evaluate design points, which
+            evaluate_batch can reuse for every batch of an optimization.
+    
+            Assumptions:
+            The workers are forked now, see evaluate_batch
+    
+            Source:
+            N/A
+    
+            Inputs:
+            keys               [list of strings], the functions of the nexus to return
+    
+            Outputs:
+            pool               [Process_Pool]
+    
+            Properties Used:
+            self.number_of_processes [int]
+        """            
+        
+        def evaluate_point(x):
+            point = Data()
+            for key in keys:
+                point[key] = np.atleast_1d(getattr(self,key)(x))
+            return point
+        
+        return Process_Pool(evaluate_point,self.number_of_processes)
+    
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
             This steps through like a process through the nexus, and stores the results.
@@ -139,6 +233,213 @@ class Nexus(Data):
         self.last_fidelity = self.fidelity_level
           
     
+    def cache_key(self):
+        """Hashes the scaled inputs and the fidelity level of the current design point
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            key                [str]
+    
+            Properties Used:
+            self.optimization_problem.inputs
+            self.fidelity_level
+        """        
+        
+        inputs = self.optimization_problem.inputs
+        x      = np.array(inputs[:,1]/inputs[:,-2],dtype=float)
+        
+        key = hashlib.sha1(x.tobytes())
+        key.update(str(self.fidelity_level).encode())
+        
+        return key.hexdigest()
+    
+    def cache_pointers(self):
+        """Finds the paths in the nexus of the objective, the constraints and the
+            cache_aliases
+    
+            Assumptions:
+            Aliases with several paths or a * are expanded into every path, as when
+            the inputs are set
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            pointers           [list of str]
+    
+            Properties Used:
+            None
+        """          
+        
+        opt_prob = self.optimization_problem
+        names    = list(np.array(opt_prob.objective)[:,0]) + list(self.cache_aliases)
+        if len(opt_prob.constraints):
+            names = names + list(np.array(opt_prob.constraints)[:,0])
+        
+        pointers = []
+        for alias in opt_prob.aliases:
+            if not alias[0] in names:
+                continue
+            paths = [alias[1]] if isinstance(alias[1],str) else list(alias[1])
+            for path in paths:
+                if '*' in path:
+                    expanded = help_fun.find_a_star(self,path)
+                else:
+                    expanded = [path]
+                for pointer in expanded:
+                    if not pointer in pointers:
+                        pointers.append(pointer)
+                
+        return pointers
+    
+    def load_from_cache(self):
+        """Puts the stored values of the current design point back into the nexus
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            hit                [bool]
+    
+            Properties Used:
+            self.cache_file
+        """         
+        
+        if self.cache_entries is None:
+            self.read_cache_file()
+        
+        key = self.cache_key()
+        if not key in self.cache_entries:
+            self.cache_misses += 1
+            return False
+        
+        self.cache_hits += 1
+        self.cache_entries.move_to_end(key)
+        for pointer,value in self.cache_entries[key].items():
+            self.deep_set(pointer,value)
+            
+        self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+        self.last_fidelity = self.fidelity_level
+        
+        return True
+    
+    def store_in_cache(self):
+        """Stores the objective, constraints and cache_aliases of the current design
+            point, dropping the least recently used points beyond cache_size
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.cache_size
+            self.cache_file
+        """          
+        
+        if self.cache_entries is None:
+            self.read_cache_file()
+        
+        values = Data()
+        for pointer in self.cache_pointers():
+            value = np.array(self.deep_get(pointer),dtype=float)
+            if value.ndim == 0:
+                value = float(value)
+            values[pointer] = value
+        
+        key = self.cache_key()
+        self.cache_entries[key] = values
+        self.cache_entries.move_to_end(key)
+        while len(self.cache_entries) > self.cache_size:
+            self.cache_entries.popitem(last=False)
+            
+        # one line per stored point, so a store does not rewrite the file
+        if self.cache_file is not None:
+            with open(self.cache_file,'a') as cache_file:
+                cache_file.write(cache_line(key,values))
+                
+    def read_cache_file(self):
+        """Reads the design points of the cache_file into the cache. The file holds one
+            line per stored point, later lines replace earlier ones, and it is rewritten
+            with only the kept points once it holds more lines than that
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.cache_size
+            self.cache_file
+        """          
+        
+        self.cache_entries = OrderedDict()
+        if self.cache_file is None or not os.path.exists(self.cache_file):
+            return
+        
+        n_lines = 0
+        with open(self.cache_file,'r') as cache_file:
+            for line in cache_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # a line cut off by an interrupted run
+                    continue
+                n_lines += 1
+                values = Data()
+                for pointer,value in entry['values'].items():
+                    values[pointer] = np.array(value) if isinstance(value,list) else value
+                self.cache_entries[entry['key']] = values
+                self.cache_entries.move_to_end(entry['key'])
+                
+        while len(self.cache_entries) > self.cache_size:
+            self.cache_entries.popitem(last=False)
+            
+        # the old file stays valid if it can not be rewritten
+        if n_lines > len(self.cache_entries):
+            temp_path = None
+            try:
+                handle, temp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(os.path.abspath(self.cache_file)))
+                with os.fdopen(handle,'w') as temp_file:
+                    for key,values in self.cache_entries.items():
+                        temp_file.write(cache_line(key,values))
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, self.cache_file)
+            except OSError:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)
+    
     def objective(self,x = None):
         """Retrieve the objective value for your function
     
@@ -349,11 +650,11 @@ class Nexus(Data):
         """           
         pass     
 
-    def finite_difference(self,x,diff_interval=1e-8):
+    def finite_difference(self,x,diff_interval=1e-8,scheme='forward'):
         """Finite difference gradients and jacobians of the problem.
     
             Assumptions:
-            N/A
+            The perturbed points are run concurrently, see jacobian
     
             Source:
             N/A
@@ -361,6 +662,7 @@ class Nexus(Data):
             Inputs:
             x                  [vector]
             diff_interval      [float]
+            scheme             [str], 'forward', 'backward' or 'central'
     
             Outputs:
             grad_obj           [vector]
@@ -370,35 +672,93 @@ class Nexus(Data):
             None
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
-        
-        inpu  = self.optimization_problem.inputs
-        const = self.optimization_problem.constraints
-        
-        inplen = len(inpu)
-        conlen = len(const)
-        
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
-        
-        con2 = (con*np.ones_like(jac_con))
+        jacobians = self.jacobian(x,['objective','all_constraints'],diff_interval,scheme)
         
-        for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+        grad_obj = jacobians.objective[0].astype(float)
+        jac_con  = jacobians.all_constraints.astype(float)
         
-        grad_obj = (grad_obj - obj)/diff_interval
+        return grad_obj, jac_con
+    
+    def jacobian(self,x,keys=['objective','all_constraints'],diff_interval=1e-8,scheme='forward'):
+        """Finite difference jacobians of functions of the nexus. All perturbed design
+            points are run at once with evaluate_batch, so they are spread over the
+            pool of processes. The last jacobians are kept, so asking for the gradients
+            of the objective and the constraints at the same point runs them once.
+    
+            Assumptions:
+            Absolute step of diff_interval on the scaled inputs. Forward and backward
+            differences run one point per input, central differences run two.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            x                  [vector]
+            keys               [list of strings], the functions of the nexus to differentiate
+            diff_interval      [float]
+            scheme             [str], 'forward', 'backward' or 'central'
+    
+            Outputs:
+            jacobians[key]     [array], (length of the function x number of inputs)
+    
+            Properties Used:
+            self.number_of_processes [int]
+        """          
         
-        jac_con = (jac_con - con2).T/diff_interval
+        x = np.array(x,dtype=float).flatten()
+        n = len(x)
+        
+        # Check if these jacobians were just computed
+        last = self.last_jacobian
+        if last is not None \
+           and np.array_equal(last.inputs,x) \
+           and last.fidelity == self.fidelity_level \
+           and last.diff_interval == diff_interval \
+           and last.scheme == scheme \
+           and all([key in last.jacobians for key in keys]):
+            jacobians = Data()
+            for key in keys:
+                jacobians[key] = last.jacobians[key]
+            return jacobians
+        
+        # Perturbed points
+        steps = diff_interval*np.eye(n)
+        if scheme == 'forward':
+            X = x + steps
+        elif scheme == 'backward':
+            X = x - steps
+        elif scheme == 'central':
+            X = np.vstack((x + steps, x - steps))
+        else:
+            raise ValueError('Finite difference scheme not recognized.')
+        
+        # Values at the point itself, usually already evaluated by the optimizer
+        values = Data()
+        if scheme != 'central':
+            for key in keys:
+                values[key] = np.atleast_1d(np.asarray(getattr(self,key)(x),dtype=float))
+        
+        outputs = self.evaluate_batch(X,keys)
+        
+        jacobians = Data()
+        for key in keys:
+            if scheme == 'forward':
+                jac = (outputs[key] - values[key])/diff_interval
+            elif scheme == 'backward':
+                jac = (values[key] - outputs[key])/diff_interval
+            else:
+                jac = (outputs[key][:n] - outputs[key][n:])/(2.*diff_interval)
+            jacobians[key] = jac.T
         
-        grad_obj = grad_obj.astype(float)
-        jac_con  = jac_con.astype(float)
+        # Store to cache
+        self.last_jacobian = Data()
+        self.last_jacobian.inputs        = x
+        self.last_jacobian.fidelity      = self.fidelity_level
+        self.last_jacobian.diff_interval = diff_interval
+        self.last_jacobian.scheme        = scheme
+        self.last_jacobian.jacobians     = jacobians
         
-        return grad_obj, jac_con
+        return jacobians
     
     
     def translate(self,x = None):
@@ -456,3 +816,30 @@ class Nexus(Data):
         
     
  
+
+## @ingroup Optimization
+def cache_line(key,values):
+    """Writes a design point of the Nexus cache as one line of JSON
+
+    Assumptions:
+    The values are floats or arrays
+
+    Source:
+    N/A
+
+    Inputs:
+    key          [str]
+    values       [Data]
+
+    Outputs:
+    line         [str]
+
+    Properties Used:
+    N/A
+    """
+
+    entry = {'key':key,'values':{}}
+    for pointer,value in values.items():
+        entry['values'][pointer] = value.tolist() if isinstance(value,np.ndarray) else value
+
+    return json.dumps(entry) + '\n'
@@ -2,6 +2,8 @@
 # Trust Region Model Management Scripts live here
 # @ingroup Optimization-Package_Setups
 
-from . import TRMM_setup
-from . import Trust_Region
-from . import Trust_Region_Optimization
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['TRMM_setup',
+                                             'Trust_Region',
+                                             'Trust_Region_Optimization'])
\ No newline at end of file
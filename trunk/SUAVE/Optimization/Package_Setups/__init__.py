@@ -2,11 +2,13 @@
 # Individual package setups that help you interface with other codes
 # @ingroup Optimization
 
-from . import pyopt_setup
-from . import scipy_setup
-from . import ipopt_setup
-from . import pyopt_surrogate_setup
-from . import TRMM
-from . import additive_setup
-from . import pyoptsparse_setup
-from . import particle_swarm_optimization
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['pyopt_setup',
+                                             'scipy_setup',
+                                             'ipopt_setup',
+                                             'pyopt_surrogate_setup',
+                                             'TRMM',
+                                             'additive_setup',
+                                             'pyoptsparse_setup',
+                                             'particle_swarm_optimization'])
\ No newline at end of file
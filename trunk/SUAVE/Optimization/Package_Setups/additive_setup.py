@@ -5,6 +5,7 @@
 # Modified: Jun 2017, T. MacDonald
 #           Oct 2019, T. MacDonald
 #           Jun 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,11 +19,8 @@ try:
     import pyOpt.pyALPSO
 except:
     pass
-import sklearn
-from sklearn import gaussian_process
 from SUAVE.Optimization import helper_functions as help_fun
 from SUAVE.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
-from scipy.stats import norm
 import os
 import sys
 from scipy.optimize import minimize
@@ -102,13 +100,13 @@ class Additive_Solver():
         
         for level in range(1,num_fidelity_levels+1):
             problem.fidelity_level = level
-            for ii,x in enumerate(x_samples):
-                res = self.evaluate_model(problem,x,scaled_constraints)
-                f[level-1,ii]    = res[0]  # objective value
-                g[level-1,ii,:]  = res[1]  # constraints vector
+            samples          = problem.evaluate_batch(x_samples)
+            f[level-1,:]     = samples.objective[:,0]  # objective value
+            g[level-1,:,:]   = samples.all_constraints # constraints vector
         
         converged = False
         
+        from sklearn import gaussian_process
         for kk in range(max_iterations):
             # Build objective surrogate
             f_diff = f[1,:] - f[0,:]
@@ -448,6 +446,7 @@ class Additive_Solver():
         obj_addition, obj_sigma   = obj_surrogate.predict(np.atleast_2d(x),return_std=True)
         cons_addition, cons_sigma = cons_surrogate.predict(np.atleast_2d(x),return_std=True)
         
+        from scipy.stats import norm
         fhat  = obj[0] + obj_addition
         # Calculate expected improvement (based on Schonlau, Computer Experiments and Global Optimization, 1997)
         EI    = (fstar-fhat)*norm.cdf((fstar-fhat)/obj_sigma) + obj_sigma*norm.pdf((fstar-fhat)/obj_sigma)
@@ -519,6 +518,7 @@ class Additive_Solver():
             
         EI = np.zeros([linspace_num,linspace_num])        
             
+        from scipy.stats import norm
         for ii,x0 in enumerate(x0s):
             for jj,x1 in enumerate(x1s):
                 x = [[x0,x1]]
@@ -2,6 +2,7 @@
 # particle_swarm_optimization.py
 # 
 # Created:  Sep. 2019, M. Clarke
+# Modified: Oct  2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,7 +15,7 @@ import scipy as sp
 ## @ingroup Optimization-Package_Setups
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, f_batch=None):
     """
     This function perform a particle swarm optimization (PSO)
     
@@ -41,6 +42,9 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        f_batch   : Returns the objective values and the inequality constraint values of a whole swarm of           
+                    positions, f_batch(x,*args,**kwargs) -> (f, c) with f[i] as returned by func and c (S, n).   
+                    swarm is moved and evaluated together once per iteration (Default: None)                        [function]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -109,6 +113,11 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     def is_feasible(x):
         check = np.all(cons(x)>=0)
         return check
+    
+    def evaluate_swarm(x):
+        f, c = f_batch(x, *args, **kwargs)
+        c    = np.reshape(c,(len(x),-1))
+        return np.ravel(f), np.all(c>=0,axis=1)
         
     # Initialize the particle swarm ############################################
     S = swarmsize
@@ -120,6 +129,9 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     g = []  # best swarm position
     fg = 1e100  # artificial best swarm position starting value
     
+    if f_batch is not None:
+        f_swarm, feasible_swarm = evaluate_swarm(lb + x*(ub - lb))
+    
     for i in range(S):
         # Initialize the particle's position
         x[i, :] = lb + x[i, :]*(ub - lb)
@@ -128,7 +140,12 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         p[i, :] = x[i, :]
        
         # Calculate the objective's value at the current particle's
-        fp[i] = obj(p[i, :])
+        if f_batch is None:
+            fp[i]    = obj(p[i, :])
+            feasible = lambda: is_feasible(p[i, :])
+        else:
+            fp[i]    = f_swarm[i]
+            feasible = lambda: feasible_swarm[i]
        
         # At the start, there may not be any feasible starting point, so just
         # give it a temporary "best" point since it's likely to change
@@ -137,7 +154,7 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
 
         # If the current particle's position is better than the swarm's,
         # update the best swarm position
-        if fp[i]<fg and is_feasible(p[i, :]):
+        if fp[i]<fg and feasible():
             fg = fp[i]
             g = p[i, :].copy()
        
@@ -149,23 +166,36 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     while it<=maxiter:
         rp = np.random.uniform(size=(S, D))
         rg = np.random.uniform(size=(S, D))
+        
+        # Move the whole swarm with the best position of the last iteration, then
+        # evaluate it at once
+        if f_batch is not None:
+            v = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+            x = np.minimum(np.maximum(x + v, lb), ub)
+            f_swarm, feasible_swarm = evaluate_swarm(x)
+            
         for i in range(S):
 
-            # Update the particle's velocity
-            v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
-                      phig*rg[i, :]*(g - x[i, :])
-                      
-            # Update the particle's position, correcting lower and upper bound 
-            # violations, then update the objective function value
-            x[i, :] = x[i, :] + v[i, :]
-            mark1 = x[i, :]<lb
-            mark2 = x[i, :]>ub
-            x[i, mark1] = lb[mark1]
-            x[i, mark2] = ub[mark2]
-            fx = obj(x[i, :])
+            if f_batch is None:
+                # Update the particle's velocity
+                v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
+                          phig*rg[i, :]*(g - x[i, :])
+                          
+                # Update the particle's position, correcting lower and upper bound 
+                # violations, then update the objective function value
+                x[i, :] = x[i, :] + v[i, :]
+                mark1 = x[i, :]<lb
+                mark2 = x[i, :]>ub
+                x[i, mark1] = lb[mark1]
+                x[i, mark2] = ub[mark2]
+                fx = obj(x[i, :])
+                feasible = lambda: is_feasible(x[i, :])
+            else:
+                fx = f_swarm[i]
+                feasible = lambda: feasible_swarm[i]
             
             # Compare particle's best position (if constraints are satisfied)
-            if fx<fp[i] and is_feasible(x[i, :]):
+            if fx<fp[i] and feasible():
                 p[i, :] = x[i, :].copy()
                 fp[i] = fx
 
@@ -19,12 +19,13 @@ from SUAVE.Optimization import helper_functions as help_fun
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization-Package_Setups
-def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False):
+def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False, gradient_scheme=None):
     """ This converts your SUAVE Nexus problem into a PyOpt optimization problem and solves it
         PyOpt has many algorithms, they can be switched out by using the solver input. 
 
         Assumptions:
-        None
+        With a gradient_scheme the sensitivities come from the nexus, which runs the
+        perturbed points concurrently, instead of the finite differences of the optimizer
 
         Source:
         N/A
@@ -35,6 +36,7 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
         FD (parallel or single)   [str]
         sense_step                [float]
         nonderivative_line_search [bool]
+        gradient_scheme           [str], None, 'forward', 'backward' or 'central'
 
         Outputs:
         outputs                   [list]
@@ -141,7 +143,10 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderiv
         opt = pyOpt.pyALPSO.ALPSO()
     if nonderivative_line_search==True:
         opt.setOption('Nonderivative linesearch')
-    if FD == 'parallel':
+    if gradient_scheme is not None:
+        mygrad  = lambda x,f,g:PyOpt_Gradient(problem,x,sense_step,gradient_scheme)
+        outputs = opt(opt_prob, sens_type=mygrad)
+    elif FD == 'parallel':
         outputs = opt(opt_prob, sens_type='FD',sens_mode='pgc')
         
     elif solver == 'SNOPT' or solver == 'SLSQP':
@@ -195,3 +200,34 @@ def PyOpt_Problem(problem,x):
     print(const)
    
     return obj,const,fail
+
+## @ingroup Optimization-Package_Setups
+def PyOpt_Gradient(problem,x,sense_step,gradient_scheme):
+    """ This wrapper finite differences the SUAVE problem and is called by the PyOpt solver.
+        If any values produce NaN then a fail flag is thrown.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem         [nexus()]
+        x               [array]
+        sense_step      [float]
+        gradient_scheme [str]
+
+        Outputs:
+        g_obj           [list]
+        g_con           [list]
+        fail            [bool]
+
+        Properties Used:
+        None
+    """      
+   
+    g_obj, g_con = problem.finite_difference(x,diff_interval=sense_step,scheme=gradient_scheme)
+    fail         = np.array(np.isnan(g_obj).any() or np.isnan(g_con).any()).astype(int)
+    
+    return g_obj.tolist(),g_con.tolist(),fail
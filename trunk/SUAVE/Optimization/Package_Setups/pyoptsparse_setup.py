@@ -18,12 +18,13 @@ from SUAVE.Optimization import helper_functions as help_fun
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization-Package_Setups
-def Pyoptsparse_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False):
+def Pyoptsparse_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  nonderivative_line_search=False, gradient_scheme=None):
     """ This converts your SUAVE Nexus problem into a PyOptsparse optimization problem and solves it.
         Pyoptsparse has many algorithms, they can be switched out by using the solver input. 
 
         Assumptions:
-        None
+        With a gradient_scheme the sensitivities come from the nexus, which runs the
+        perturbed points concurrently, instead of the finite differences of the optimizer
 
         Source:
         N/A
@@ -34,6 +35,7 @@ def Pyoptsparse_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  no
         FD (parallel or single)   [str]
         sense_step                [float]
         nonderivative_line_search [bool]
+        gradient_scheme           [str], None, 'forward', 'backward' or 'central'
 
         Outputs:
         outputs                   [list]
@@ -140,7 +142,10 @@ def Pyoptsparse_Solve(problem,solver='SNOPT',FD='single', sense_step=1.0E-6,  no
         
     if nonderivative_line_search==True:
         opt.setOption('Nonderivative linesearch')
-    if FD == 'parallel':
+    if gradient_scheme is not None:
+        mygrad  = lambda xdict,funcs:PyOpt_Gradient(problem,xdict,sense_step,gradient_scheme)
+        outputs = opt(opt_prob, sens=mygrad)
+    elif FD == 'parallel':
         outputs = opt(opt_prob, sens='FD',sensMode='pgc')
         
     elif solver == 'SNOPT' or solver == 'SLSQP':
@@ -207,4 +212,45 @@ def PyOpt_Problem(problem,xdict):
     print('Con')
     print(const)
    
-    return funcs,fail
\ No newline at end of file
+    return funcs,fail
+
+## @ingroup Optimization-Package_Setups
+def PyOpt_Gradient(problem,xdict,sense_step,gradient_scheme):
+    """ This wrapper finite differences the SUAVE problem and is called by the PyOptsparse solver.
+        If any values produce NaN then a fail flag is thrown.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem         [nexus()]
+        xdict           [dict]
+        sense_step      [float]
+        gradient_scheme [str]
+
+        Outputs:
+        funcsSens       [dict]
+        fail            [bool]
+
+        Properties Used:
+        None
+    """      
+    
+    names = list(xdict.keys())
+    x     = []
+    for key, val in xdict.items():
+        x.append(float(val))
+        
+    g_obj, g_con = problem.finite_difference(x,diff_interval=sense_step,scheme=gradient_scheme)
+    fail         = np.array(np.isnan(g_obj).any() or np.isnan(g_con).any()).astype(int)
+    
+    funcsSens = {}
+    obj_name  = problem.optimization_problem.objective[0,0]
+    funcsSens[obj_name] = dict(zip(names,g_obj))
+    for ii, con in enumerate(g_con):
+        funcsSens[problem.optimization_problem.constraints[ii,0]] = dict(zip(names,con))
+        
+    return funcsSens,fail
@@ -6,6 +6,7 @@
 #           Mar 2020, E. Botero
 #           Jul 2020, M. Clarke
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,12 +24,17 @@ from SUAVE.Optimization import helper_functions as help_fun
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization-Package_Setups
-def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None ):  
+def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, iter =200, tolerance = 1e-6, pop_size =  10 , prob_seed = None,
+                gradient_scheme = None):  
     """ This converts your SUAVE Nexus problem into a SciPy optimization problem and solves it
         SciPy has many algorithms, they can be switched out by using the solver input. 
 
         Assumptions:
         1.4901161193847656e-08 is SLSQP default FD step in scipy
+        With a gradient_scheme the gradients come from the nexus, which runs the perturbed
+        points concurrently, otherwise SciPy finite differences them one at a time
+        The particle swarm moves and evaluates the whole swarm at once only if the problem
+        has more than one process, otherwise it updates the particles one at a time
 
         Source:
         N/A
@@ -37,12 +43,13 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         problem                   [nexus()]
         solver                    [str]
         sense_step                [float]
+        gradient_scheme           [str], None, 'forward', 'backward' or 'central'
 
         Outputs:
         outputs                   [list]
 
         Properties Used:
-        None
+        problem.number_of_processes [int]
     """
     
     inp = problem.optimization_problem.inputs
@@ -72,10 +79,23 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         ub[ii]   = bndu[ii]/scl[ii]
         de_bnds.append((bndl[ii]/scl[ii],bndu[ii]/scl[ii]))  
      
+    # Have the optimizer call the gradients of the nexus
+    if gradient_scheme is not None:
+        keys     = ['objective','equality_constraint','inequality_constraint']
+        jacobian = lambda x,key:problem.jacobian(x,keys,sense_step,gradient_scheme)[key]
+        fprime   = lambda x:jacobian(x,'objective')[0]
+        fp_eqcon = lambda x:jacobian(x,'equality_constraint')
+        fp_iqcon = lambda x:jacobian(x,'inequality_constraint')
+    else:
+        fprime   = None
+        fp_eqcon = None
+        fp_iqcon = None
+     
     # Finalize problem statement and run
     if solver=='SLSQP':
         outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
-                                         iter=iter, epsilon = sense_step, acc  = tolerance)
+                                         iter=iter, epsilon = sense_step, acc  = tolerance, fprime=fprime, fprime_eqcons=fp_eqcon,\
+                                         fprime_ieqcons=fp_iqcon)
     elif solver == 'differential_evolution':
         # Define constraints as a tuple of nonlinear constraints 
         scaled_constraints = []
@@ -109,10 +129,21 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
                                                      workers=1,constraints=diff_evo_cons)
         
     elif solver == 'particle_swarm_optimization':
-        outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+        number_of_processes = problem.number_of_processes
+        if number_of_processes is not None and number_of_processes > 1:
+            # one pool of workers for the whole swarm search
+            with problem.batch_pool(keys=['objective','inequality_constraint']) as pool:
+                batch   = lambda X:SciPy_Batch_Problem(problem,X,pool)
+                outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                                      omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                                      f_batch=batch)
+        else:
+            outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                                  omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)
     else:
-        outputs = sp.optimize.minimize(wrapper,x,method=solver)
+        if gradient_scheme is not None:
+            fprime = lambda x:problem.jacobian(x,['objective'],sense_step,gradient_scheme).objective[0]
+        outputs = sp.optimize.minimize(wrapper,x,method=solver,jac=fprime)
     
     return outputs
 
@@ -147,3 +178,31 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+
+
+## @ingroup Optimization-Package_Setups
+def SciPy_Batch_Problem(problem,X,pool=None):
+    """ This wrapper runs the SUAVE problem at many points at once, used by the particle swarm.
+    
+        Assumptions:
+        None
+    
+        Source:
+        N/A
+    
+        Inputs:
+        problem   [nexus()]
+        X         [array]
+        pool      [Process_Pool], from problem.batch_pool
+    
+        Outputs:
+        obj       [array]
+        con       [array]
+    
+        Properties Used:
+        None
+    """      
+    
+    outputs = problem.evaluate_batch(X,keys=['objective','inequality_constraint'],pool=pool)
+    
+    return outputs.objective, outputs.inequality_constraint
@@ -8,6 +8,8 @@ from .carpet_plot                import carpet_plot
 from .line_plot                  import line_plot
 from .Surrogate_Optimization     import Surrogate_Optimization
 
-from . import helper_functions
-from . import Package_Setups
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['helper_functions',
+                                             'Package_Setups'])
 
@@ -4,6 +4,7 @@
 # Created:  Feb 2016, M. Vegh 
 # Modified: Feb 2017, M. Vegh
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  carpet_plot
@@ -75,16 +75,19 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
     inputs[1,:] = np.linspace(bndl[idx1], bndu[idx1], number_of_points)
 
     
-    #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
-  
+    #inputs defined; now run sweep on every point at once
+    x0      = np.array(base_inputs[:,1]/scl,dtype=float)
+    X       = np.tile(x0,(number_of_points**2,1))
+    ii, jj  = np.meshgrid(range(number_of_points),range(number_of_points),indexing='ij')
+    X[:,idx0] = inputs[0,ii.ravel()]/scl[idx0]
+    X[:,idx1] = inputs[1,jj.ravel()]/scl[idx1]
+    
+    sweep = problem.evaluate_batch(X)
+    
+    obj            = np.reshape(sweep.objective[:,0],[number_of_points,number_of_points]).T*obj_scaling
+    constraint_val = np.reshape(sweep.all_constraints,[number_of_points,number_of_points,constraint_num]).transpose(2,1,0)
+        
+    import matplotlib.pyplot as plt
     if plot_obj==1:
         plt.figure(0)
         CS = plt.contourf(inputs[0,:],inputs[1,:], obj, linewidths=2)
@@ -4,6 +4,7 @@
 # Created:  Oct 2017, M. Vegh 
 # Modified: Nov 2017, M. Vegh
 #           May 2021, E. Botero 
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,6 @@
  
 from SUAVE.Core import Data
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ----------------------------------------------------------------------
 #  line_plot
@@ -75,13 +75,17 @@ def line_plot(problem, number_of_points,  plot_obj=1, plot_const=1, sweep_index=
     inputs[0,:] = np.linspace(bndl[idx0], bndu[idx0], number_of_points)
  
 
-    #inputs defined; now run sweep
-    for i in range(0, number_of_points):
-        opt_prob.inputs[:,1][idx0]= inputs[0,i]
-   
-        obj[i]             = problem.objective()*obj_scaling
-        constraint_val[:,i]= problem.all_constraints().tolist()
-  
+    #inputs defined; now run sweep on every point at once
+    scl       = base_inputs[:,4] # Scaling
+    X         = np.tile(np.array(base_inputs[:,1]/scl,dtype=float),(number_of_points,1))
+    X[:,idx0] = inputs[0,:]/scl[idx0]
+    
+    sweep = problem.evaluate_batch(X)
+    
+    obj            = sweep.objective[:,0]*obj_scaling
+    constraint_val = sweep.all_constraints.T
+        
+    import matplotlib.pyplot as plt
     if plot_obj==1:
         plt.figure(0)
         plt.plot(inputs[0,:], obj, lw = 2)
@@ -1,5 +1,7 @@
 ## @defgroup Plots  
 # Plots contains functions for generating common figures
 
-from . import Performance
-from . import Geometry
\ No newline at end of file
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Performance',
+                                             'Geometry'])
\ No newline at end of file
@@ -6,6 +6,11 @@
 from .load_plugin import load_plugin
 # these packages are imported by temporarily modifying
 # the python path to account for potential absolute
-# package imports
+# package imports, on their first use, and are ordinary
+# attributes of this package from then on
 
-pint = load_plugin('pint')
\ No newline at end of file
+def __getattr__(name):
+    if name == 'pint':
+        package = globals()[name] = load_plugin(name)
+        return package
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__,name))
\ No newline at end of file
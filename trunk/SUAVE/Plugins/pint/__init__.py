@@ -14,28 +14,45 @@
 from __future__ import with_statement
 import os
 import subprocess
-import pkg_resources
 from .unit import UnitRegistry, DimensionalityError, UndefinedUnitError
 from .util import formatter, pi_theorem, logger
 from .measurement import Measurement
 from .context import Context
 
-_DEFAULT_REGISTRY = UnitRegistry()
+# the default registry and the version are found on first use, so that importing
+# pint does not parse the definitions or start a git process
+_DEFAULT_REGISTRY = None
 
-__version__ = "unknown"
-try:  # try to grab the commit version of our package
-    __version__ = (subprocess.check_output(["git", "describe"],
+def _default_registry():
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = UnitRegistry()
+    return _DEFAULT_REGISTRY
+
+def _find_version():
+    version = "unknown"
+    try:  # try to grab the commit version of our package
+        version = (subprocess.check_output(["git", "describe"],
                                            stderr=subprocess.STDOUT,
                                            cwd=os.path.dirname(os.path.abspath(__file__)))).strip()
-except:  # on any error just try to grab the version that is installed on the system
-    try:
-        __version__ = pkg_resources.get_distribution('pint').version
-    except:
-        pass  # we seem to have a local copy without any repository control or installed without setuptools
-              # so the reported version will be __unknown__  
+    except:  # on any error just try to grab the version that is installed on the system
+        try:
+            import pkg_resources
+            version = pkg_resources.get_distribution('pint').version
+        except:
+            pass  # we seem to have a local copy without any repository control or installed without setuptools
+                  # so the reported version will be __unknown__
+    return version
+
+def __getattr__(name):
+    if name == '__version__':
+        globals()['__version__'] = _find_version()
+        return globals()['__version__']
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
 
 def _build_quantity(value, units):
-    return _DEFAULT_REGISTRY.Quantity(value, units)
+    return _default_registry().Quantity(value, units)
 
 
 def run_pyroma(data):
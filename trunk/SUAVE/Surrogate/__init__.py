@@ -1,8 +1,10 @@
 ## @defgroup Surrogate
 # Surrogate provides methods for different surrogate formulations of the original problem
 
-from . import kriging_surrogate_functions
-from . import scikit_surrogate_functions
-from . import svr_surrogate_functions
-from . import Surrogate_Problem
+# packages, imported on first use
+from SUAVE.Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['kriging_surrogate_functions',
+                                             'scikit_surrogate_functions',
+                                             'svr_surrogate_functions',
+                                             'Surrogate_Problem'])
 
@@ -11,7 +11,6 @@
 
 
 from SUAVE.Core import Data
-from sklearn import svm
 from .Surrogate_Problem import Surrogate_Problem
 
 import numpy as np
@@ -46,6 +45,7 @@ def build_svr_models(obj_values, inputs, constraints, kernel = 'rbf', C = 1E5, e
     
     
     
+    from sklearn import svm
     #now build surrogates based on these
     t1=time.time()
 
@@ -103,6 +103,7 @@ def check_svr_accuracy(x, data_inputs, data_outputs, imin = -1): #set up so you
         data_inputs2 = np.vstack((data_inputs[:imin], data_inputs[imin+1:]))
         data_outputs2 = np.vstack((data_outputs[:imin], data_outputs[imin+1:]))
         
+    from sklearn import svm
     for j in range (len(data_outputs[0,:])): #loop over data
         clf         = svm.SVR(C=Cval,  epsilon = eps)
         y_surrogate = clf.fit(data_inputs2, data_outputs2[:,j]) #leave out closest data point for surrogate fit
@@ -8,16 +8,17 @@
 #  IMPORT!!
 # ----------------------------------------------------------------------
 
-# packages
-from . import Plugins
+# packages, imported on first use
 from . import Core
-from . import Components
-from . import Analyses
-from . import Methods
-from . import Attributes
-from . import Optimization
-from . import Input_Output
-from . import Plots
+from .Core import lazy_import
+__getattr__, __dir__ = lazy_import(__name__,['Plugins',
+                                             'Components',
+                                             'Analyses',
+                                             'Methods',
+                                             'Attributes',
+                                             'Optimization',
+                                             'Input_Output',
+                                             'Plots'])
 
 # the vehicle class
 from .Vehicle import Vehicle